@@ -1,6 +1,98 @@
 # main.py
 
-from src.start import start_menu_loop
+import time
+
+started = time.perf_counter()  # time-to-first-frame is measured from here
+
+import argparse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="SkyDodo")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without window, audio or mouse (SDL dummy drivers)")
+    parser.add_argument("--no-render", action="store_true",
+                        help="headless only: skip drawing completely")
+    parser.add_argument("--sessions", type=int, default=1,
+                        help="headless only: number of automated games to play")
+    parser.add_argument("--max-frames", type=int, default=None,
+                        help="headless only: frame limit per game")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="headless only: seed of the first game (game i uses seed + i)")
+    parser.add_argument("--simulate", action="store_true",
+                        help="headless only: run the simulation core without pygame display")
+    parser.add_argument("--step-frames", type=int, default=1, metavar="N",
+                        help="simulate and balance only: advance N frames per simulation step")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="record the inputs of each game to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="play a recorded game back (with --headless: as fast as possible, and verify it)")
+    parser.add_argument("--stress", action="store_true",
+                        help="measure frame times at growing entity counts (headless; --max-frames per scenario)")
+    parser.add_argument("--stress-scales", default=None, metavar="N,N,...",
+                        help="stress only: entity count multipliers (default 1,2,4,8,16,32,64)")
+    parser.add_argument("--stress-out", default=None, metavar="PATH",
+                        help="stress only: write the results to a .csv or .json file")
+    parser.add_argument("--bench-entities", action="store_true",
+                        help="compare memory and access cost of the slotted entity classes (headless)")
+    parser.add_argument("--batch", type=int, default=None, metavar="N",
+                        help="step N games at once in the vectorized BatchEnv (--max-frames steps) and report the rate")
+    parser.add_argument("--balance", type=int, default=None, metavar="GAMES",
+                        help="Monte Carlo balance run: play GAMES simulated games in a process pool")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="balance only: worker processes (default: one per CPU core)")
+    parser.add_argument("--balance-out", default=None, metavar="PATH",
+                        help="balance only: write the aggregate to a JSON file")
+    parser.add_argument("--bake-assets", action="store_true",
+                        help="decode and scale every image into the on-disk asset cache, drop stale entries")
+    parser.add_argument("--time-to-first-frame", action="store_true",
+                        help="open the start menu, print the time until its first frame and exit")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    start_menu_loop()
+    args = parse_args()
+    if args.balance:
+        from src.balance import run_balance
+        run_balance(args.balance, args.seed or 0, args.max_frames, args.workers, output=args.balance_out,
+                    dt=args.step_frames)
+    elif args.batch:
+        from src.batch_env import run_batch
+        run_batch(args.batch, args.max_frames or 1000, args.seed or 0)
+    elif args.bench_entities:
+        from src.headless import enable_headless
+        enable_headless()
+        from src.entity_benchmark import run_entity_benchmark
+        run_entity_benchmark()
+    elif args.stress:
+        from src.headless import enable_headless
+        enable_headless(render_frames=not args.no_render)
+        from src.stress import run_stress, DEFAULT_SCALES
+        scales = [int(n) for n in args.stress_scales.split(",")] if args.stress_scales else DEFAULT_SCALES
+        run_stress(scales, args.max_frames or 600, args.seed or 0, args.stress_out)
+    elif args.replay:
+        from src.headless import enable_headless, replay_file
+        if args.headless:
+            enable_headless(render_frames=False)
+        replay_file(args.replay, realtime=not args.headless)
+    elif args.bake_assets:
+        from src.headless import enable_headless
+        enable_headless()
+        from src.asset_cache import bake_assets
+        bake_assets()
+    elif args.time_to_first_frame:
+        if args.headless:
+            from src.headless import enable_headless
+            enable_headless()
+        from src.start import start_menu_loop
+        start_menu_loop(started, first_frame_only=True)
+    elif args.headless:
+        from src.headless import enable_headless, run_sessions
+        enable_headless(render_frames=not args.no_render)
+        run_sessions(args.sessions, args.max_frames, args.seed, args.simulate, args.record, args.step_frames)
+    else:
+        if args.record:
+            from src.replay import enable_recording
+            enable_recording(args.record)
+        from src.start import start_menu_loop
+        start_menu_loop()
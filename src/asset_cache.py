@@ -0,0 +1,180 @@
+# asset_cache.py
+# ---------------------------------
+# On-disk cache of baked images: decoded, scaled and converted pixels as raw buffers
+
+import hashlib
+import mmap
+import os
+import struct
+import time
+
+from src.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")
+
+# Entry layout: HEADER (magic, width, height, pixel format) + raw pixel rows.
+# Bump the magic when the layout or the baking of any variant changes.
+HEADER = struct.Struct("<4sII4s")
+MAGIC = b"SKY1"
+ENTRY_SUFFIX = ".px"
+
+
+# Class: AssetCache
+# directory - folder holding the cache entries (created on first store)
+# -------------------------------------------------------------
+# Stores the final pixels of a surface built from image files, so later
+# runs skip decoding, scaling and compositing. An entry is keyed by the
+# source files and a variant string describing how the surface is made
+# from them (AssetRegistry: size, flip, convert mode, smooth; the
+# parallax background: the composited screen-size layer). Its name is a
+# hash of the sources' contents plus the variant, so editing an image
+# simply misses the cache and bakes a new entry; the old one is left
+# behind until prune().
+#
+# Entries are read with a memory-mapped read and wrapped by
+# pygame.image.frombuffer without copying; the only pixel work left at
+# load time is the convert to the display format. Surfaces with per-pixel
+# alpha are stored as RGBA bytes and come back from convert_alpha(), all
+# others as RGB bytes and come back from convert(), so entries do not
+# depend on the display. A cache that cannot be read or written
+# (read-only disk, corrupt entry) just falls back to building.
+
+class AssetCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.used = set()      # entry names loaded or stored by this process
+        self._digests = {}     # path -> (mtime_ns, file size, content hash)
+
+
+    # Method: load
+    # sources - paths of the files the surface is made from
+    # variant - string describing how it is made from them
+    # -------------------------------------------------------------
+    # Returns the converted surface of a baked entry, or None on a miss.
+
+    def load(self, sources, variant):
+        name = self._entry_name(sources, variant)
+        if name is None:
+            return None
+        try:
+            with open(os.path.join(self.directory, name), "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, width, height, fmt = HEADER.unpack_from(data)
+                fmt = fmt.rstrip(b"\0").decode()
+                if magic != MAGIC or fmt not in ("RGBA", "RGB") or len(data) != HEADER.size + width * height * len(fmt):
+                    return None
+                with memoryview(data)[HEADER.size:] as pixels:
+                    raw = pygame.image.frombuffer(pixels, (width, height), fmt)
+                    surface = raw.convert_alpha() if fmt == "RGBA" else raw.convert()
+                    del raw  # releases the view before the mapping is closed
+        except (OSError, ValueError, struct.error):
+            return None
+        self.used.add(name)
+        return surface
+
+
+    # Method: store
+    # sources, variant - as for load
+    # surface - the built (converted) surface
+    # -------------------------------------------------------------
+    # Writes the surface's pixels as a new entry. The file is written under
+    # a temporary name and renamed, so a reader never sees half an entry.
+
+    def store(self, sources, variant, surface):
+        name = self._entry_name(sources, variant)
+        if name is None:
+            return
+        fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+        target = os.path.join(self.directory, name)
+        temp = f"{target}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, *surface.get_size(), fmt.encode()))
+                f.write(pygame.image.tobytes(surface, fmt))
+            os.replace(temp, target)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+        self.used.add(name)
+
+
+    # Method: prune
+    # -------------------------------------------------------------
+    # Deletes every entry this process did not load or store (stale bakes
+    # of edited images, variants no longer requested). Returns the number
+    # of entries removed.
+
+    def prune(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        removed = 0
+        for name in names:
+            if name.endswith(ENTRY_SUFFIX) and name not in self.used:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+    # Entry file name for a variant, or None if a source cannot be read
+    def _entry_name(self, sources, variant):
+        key = hashlib.blake2b(variant.encode(), digest_size=16)
+        for path in sources:
+            digest = self._digest(path)
+            if digest is None:
+                return None
+            key.update(digest)
+        return key.hexdigest() + ENTRY_SUFFIX
+
+
+    # Content hash of a source file, recomputed only when the file changes
+    def _digest(self, path):
+        try:
+            stat = os.stat(path)
+            known = self._digests.get(path)
+            if known is None or known[:2] != (stat.st_mtime_ns, stat.st_size):
+                with open(path, "rb") as f:
+                    known = (stat.st_mtime_ns, stat.st_size, hashlib.blake2b(f.read(), digest_size=16).digest())
+                self._digests[path] = known
+        except OSError:
+            return None
+        return known[2]
+
+
+# Method: bake_assets
+# -------------------------------------------------------------
+# Bake step: opens an offscreen display, requests every image the start
+# menu and the game load (menu images, preload_assets, the composited
+# parallax background) so each missing entry is built and stored, then
+# prunes the entries no longer used. Run it after changing assets, e.g.
+# when building a kiosk image; a normal launch also bakes whatever it
+# misses.
+
+def bake_assets():
+    from src import headless, start
+    from src.assets import assets, preload_assets
+    from src.background import load_parallax
+    from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, PARALLAX_LAYERS
+
+    if assets.cache is None:
+        print("asset cache is disabled (config.ASSET_CACHE)")
+        return
+    headless.init_pygame()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    started = time.perf_counter()
+    start.load_assets()
+    preload_assets()
+    load_parallax(PARALLAX_LAYERS, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    elapsed = time.perf_counter() - started
+    removed = assets.cache.prune()
+    print(f"baked {len(assets.cache.used)} entries into {assets.cache.directory} "
+          f"in {elapsed * 1000:.0f} ms, removed {removed} stale entries")
@@ -0,0 +1,292 @@
+# assets.py
+# ---------------------------------
+# Central image registry: every asset is decoded once and shared
+
+from src.asset_cache import AssetCache
+from src.atlas import TextureAtlas, AtlasRegion
+from src.config import (
+    ASSET_CACHE, ASSET_CACHE_DIR, SCREEN_WIDTH, PLAYER_SIZE, PLATFORM_WIDTH, PLATFORM_HEIGHT,
+    PAUSE_ICON_PATH, INFO_ICON_PATH, VOLUME_ICON_PATH, ICON_SIZE,
+    PLATFORM_IMAGE, MOVING_PLATFORM_IMAGE, GROUND_IMAGE,
+    PLAYER_SPRITE_SHEET, PLAYER_FRAME_SIZE, PLAYER_FRAMES_PER_ROW,
+    BETTLE_FRAMES
+)
+from src.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")
+
+
+# Class: AssetRegistry
+# -------------------------------------------------------------
+# Hands out shared surfaces keyed by (path, size, flip, convert mode).
+# The first request for a key decodes, converts and scales the image;
+# every later request returns the very same surface object, so memory
+# grows with the number of distinct assets, not with the number of
+# platforms, enemies or players using them.
+#
+# convert mode is "alpha" (convert_alpha), "opaque" (convert) or None
+# (raw pixels). Conversion needs a display, so anything requested before
+# pygame.display.set_mode() is kept in a separate raw cache and gets
+# converted on the first request after the display exists.
+#
+# Small sprites can additionally be packed into a texture atlas with
+# pack(); region() and sprite_regions() then return AtlasRegions that
+# are drawn with area blits from a few large atlas pages.
+#
+# With a cache (an AssetCache), converted images are first looked up in
+# the on-disk bake and only decoded and scaled on a miss, after which
+# the result is stored for the next run (see baked()). Raw (pre-display)
+# images are never cached.
+
+class AssetRegistry:
+    def __init__(self, cache=None):
+        self.cache = cache
+        self._images = {}
+        self._raw = {}
+        self._sheets = {}
+        self._regions = {}
+        self.atlases = []
+
+
+    # Method: image
+    # path   - file path of the image
+    # size   - optional (width, height) to scale to
+    # flip   - mirror the image horizontally
+    # mode   - convert mode: "alpha", "opaque" or None
+    # smooth - use smoothscale instead of scale
+    # -------------------------------------------------------------
+    # Returns the shared surface for the given key, building it on first use.
+
+    def image(self, path, size=None, flip=False, mode="alpha", smooth=False):
+        key = (path, size, flip, mode, smooth)
+        surface = self._images.get(key)
+        if surface is not None:
+            return surface
+
+        if pygame.display.get_surface() is None and mode is not None:
+            surface = self._raw.get(key)
+            if surface is None:
+                surface = self._build(path, size, flip, None, smooth)
+                self._raw[key] = surface
+            return surface
+
+        surface = self._build(path, size, flip, mode, smooth)
+        self._images[key] = surface
+        return surface
+
+
+    # Method: sprite_rows
+    # path           - file path to the sprite sheet
+    # frame_size     - (width, height) of one frame in the sheet
+    # frames_per_row - number of frames to cut from each row
+    # size           - optional (width, height) every frame is scaled to
+    # flip           - mirror every frame horizontally
+    # -------------------------------------------------------------
+    # Slices a sprite sheet into rows of animation frames once and returns
+    # the shared list of rows for every later call with the same arguments.
+
+    def sprite_rows(self, path, frame_size, frames_per_row, size=None, flip=False):
+        key = (path, frame_size, tuple(frames_per_row), size, flip)
+        rows = self._sheets.get(key)
+        if rows is not None:
+            return rows
+
+        sheet = self.image(path)
+        sheet_width, sheet_height = sheet.get_size()
+        frame_width, frame_height = frame_size
+
+        rows = []
+        for row in range(sheet_height // frame_height):
+            row_frames = []
+            max_cols = frames_per_row[row] if row < len(frames_per_row) else 0
+            for col in range(max_cols):
+                # Check if frame is inside image bounds
+                if (col + 1) * frame_width <= sheet_width:
+                    frame = sheet.subsurface(
+                        pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
+                    )
+                    if size:
+                        frame = pygame.transform.scale(frame, size)
+                    if flip:
+                        frame = pygame.transform.flip(frame, True, False)
+                    row_frames.append(frame)
+            rows.append(row_frames)
+
+        if pygame.display.get_surface() is not None:
+            self._sheets[key] = rows
+        return rows
+
+
+    # Method: solid
+    # color - fill color (RGB or RGBA)
+    # size  - (width, height) of the surface
+    # -------------------------------------------------------------
+    # Returns a shared single-color surface, so filled rectangles can be
+    # drawn with blits like every other sprite.
+
+    def solid(self, color, size):
+        key = ("solid", tuple(color), size)
+        surface = self._images.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA if len(color) == 4 else 0)
+            surface.fill(color)
+            self._images[key] = surface
+        return surface
+
+
+    # Method: region
+    # path - file path of the image
+    # size - optional (width, height) to scale to
+    # flip - mirror the image horizontally
+    # -------------------------------------------------------------
+    # Returns the AtlasRegion for an image. Images that were not packed
+    # get a region covering their whole (shared) surface.
+
+    def region(self, path, size=None, flip=False):
+        key = (path, size, flip)
+        region = self._regions.get(key)
+        if region is None:
+            surface = self.image(path, size, flip)
+            region = AtlasRegion(surface, surface.get_rect(), surface)
+            if pygame.display.get_surface() is not None:
+                self._regions[key] = region
+        return region
+
+
+    # Method: sprite_regions
+    # Same arguments as sprite_rows
+    # -------------------------------------------------------------
+    # Returns the rows of a sliced sprite sheet as AtlasRegions.
+
+    def sprite_regions(self, path, frame_size, frames_per_row, size=None, flip=False):
+        spec = (path, frame_size, tuple(frames_per_row), size, flip)
+        rows = self._regions.get(spec)
+        if rows is None:
+            rows = [
+                [self._regions.get(spec + (r, c)) or AtlasRegion(frame, frame.get_rect(), frame)
+                 for c, frame in enumerate(row)]
+                for r, row in enumerate(self.sprite_rows(*spec))
+            ]
+            if pygame.display.get_surface() is not None:
+                self._regions[spec] = rows
+        return rows
+
+
+    # Method: pack
+    # images - iterable of (path, size, flip) image keys
+    # sheets - iterable of sprite_rows argument tuples
+    # -------------------------------------------------------------
+    # Packs the given images and sprite sheet frames into a texture atlas.
+    # Afterwards region() and sprite_regions() resolve to the atlas pages,
+    # and the individual surfaces are released from the cache.
+
+    def pack(self, images=(), sheets=()):
+        atlas = TextureAtlas()
+        for path, size, flip in images:
+            atlas.add((path, size, flip), self.image(path, size, flip))
+        for path, frame_size, frames_per_row, size, flip in sheets:
+            spec = (path, frame_size, tuple(frames_per_row), size, flip)
+            for r, row in enumerate(self.sprite_rows(*spec)):
+                for c, frame in enumerate(row):
+                    atlas.add(spec + (r, c), frame)
+        atlas.build()
+
+        for key in atlas.regions:
+            if len(key) == 3:
+                self._images.pop((key[0], key[1], key[2], "alpha", False), None)
+            else:
+                self._sheets.pop(key[:5], None)
+                self._regions.pop(key[:5], None)
+        self._regions.update(atlas.regions)
+        self.atlases.append(atlas)
+        return atlas
+
+
+    # Method: baked
+    # sources - paths of the image files the surface is made from
+    # variant - string describing how it is made from them
+    # build   - callable returning the converted surface
+    # -------------------------------------------------------------
+    # Returns the surface from the on-disk cache, or builds it and stores
+    # it there. Without a cache or a display this just calls build().
+    # Not kept in memory: callers cache the result themselves.
+
+    def baked(self, sources, variant, build):
+        if self.cache is None or pygame.display.get_surface() is None:
+            return build()
+        surface = self.cache.load(sources, variant)
+        if surface is None:
+            surface = build()
+            self.cache.store(sources, variant, surface)
+        return surface
+
+
+    # Method: clear
+    # -------------------------------------------------------------
+    # Drops every cached surface (e.g. after the display was recreated).
+
+    def clear(self):
+        self._images.clear()
+        self._raw.clear()
+        self._sheets.clear()
+        self._regions.clear()
+        self.atlases.clear()
+
+
+    def _build(self, path, size, flip, mode, smooth):
+        if mode is None:
+            return self._decode(path, size, flip, mode, smooth)
+        return self.baked((path,), f"image {size} {flip} {mode} {smooth}",
+                          lambda: self._decode(path, size, flip, mode, smooth))
+
+
+    def _decode(self, path, size, flip, mode, smooth):
+        if size is None and not flip:
+            surface = pygame.image.load(path)
+            if mode == "alpha":
+                surface = surface.convert_alpha()
+            elif mode == "opaque":
+                surface = surface.convert()
+            return surface
+
+        # Derived variants share the decoded base image
+        surface = self.image(path, None, False, mode)
+        if size is not None and size != surface.get_size():
+            scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+            surface = scale(surface, size)
+        if flip:
+            surface = pygame.transform.flip(surface, True, False)
+        return surface
+
+
+assets = AssetRegistry(AssetCache(ASSET_CACHE_DIR) if ASSET_CACHE else None)
+
+
+# Function: preload_assets
+# -------------------------------------------------------------
+# Decodes every in-game asset up front. Must run after the display
+# exists so that surfaces are converted to the display format; after
+# that, run_game never touches the disk or rescales an image.
+# Platform, ground, enemy and player frames are packed into one atlas.
+
+def preload_assets():
+    if assets.atlases:
+        return
+
+    platform_size = (PLATFORM_WIDTH, PLATFORM_HEIGHT)
+    ground_height = assets.image(GROUND_IMAGE).get_height()
+
+    for path in (PAUSE_ICON_PATH, INFO_ICON_PATH, VOLUME_ICON_PATH):
+        assets.image(path, ICON_SIZE)
+
+    images = [
+        (PLATFORM_IMAGE, platform_size, False),
+        (MOVING_PLATFORM_IMAGE, platform_size, False),
+        (GROUND_IMAGE, (SCREEN_WIDTH, ground_height), False),
+    ]
+    images += [(path, None, False) for path in BETTLE_FRAMES]
+    sheets = [
+        (PLAYER_SPRITE_SHEET, PLAYER_FRAME_SIZE, PLAYER_FRAMES_PER_ROW, PLAYER_SIZE, flip)
+        for flip in (False, True)
+    ]
+    assets.pack(images, sheets)
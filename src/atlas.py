@@ -0,0 +1,93 @@
+# atlas.py
+# ---------------------------------
+# Packs many small sprites into a few large surfaces (texture atlas)
+
+from collections import namedtuple
+
+from src.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")
+
+# A packed sprite: the atlas page it lives on, its source rect on that page
+# and a subsurface view of that rect (for code that needs a plain Surface).
+# Draw with screen.blit(region.sheet, pos, region.area).
+AtlasRegion = namedtuple("AtlasRegion", ["sheet", "area", "image"])
+
+
+# Class: TextureAtlas
+# page_width - width of every atlas page in pixels
+# padding    - empty pixels kept around every packed sprite
+# -------------------------------------------------------------
+# Collects named surfaces with add() and packs them with a simple shelf
+# packer in build(): sprites are sorted by height and laid out left to
+# right in rows ("shelves"); a new page is started when a page would grow
+# past max_page_height. Each page is one converted surface, and regions
+# maps every name to its AtlasRegion.
+
+class TextureAtlas:
+    def __init__(self, page_width=1024, max_page_height=1024, padding=1):
+        self.page_width = page_width
+        self.max_page_height = max_page_height
+        self.padding = padding
+        self.pages = []
+        self.regions = {}
+        self._pending = []
+
+
+    # Method: add
+    # name    - any hashable key used to look the sprite up later
+    # surface - the sprite to pack
+    # -------------------------------------------------------------
+    # Queues a surface for packing. Names added twice are packed once.
+
+    def add(self, name, surface):
+        if name not in self.regions:
+            self._pending.append((name, surface))
+
+
+    # Method: build
+    # -------------------------------------------------------------
+    # Packs every queued surface into atlas pages and fills self.regions.
+
+    def build(self):
+        pad = self.padding
+        items = sorted(self._pending, key=lambda item: item[1].get_height(), reverse=True)
+        self._pending = []
+
+        # Lay out shelves first, so every page is allocated with its final size
+        layouts = []  # list of pages, each a list of (name, surface, x, y)
+        placed = []
+        x = y = shelf_height = 0
+        for name, surface in items:
+            width, height = surface.get_size()
+            if width + 2 * pad > self.page_width:
+                raise ValueError(f"Sprite {name!r} is wider than the atlas page")
+
+            if x + width + 2 * pad > self.page_width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            if y + height + 2 * pad > self.max_page_height and placed:
+                layouts.append(placed)
+                placed = []
+                x = y = shelf_height = 0
+
+            placed.append((name, surface, x + pad, y + pad))
+            x += width + 2 * pad
+            shelf_height = max(shelf_height, height + 2 * pad)
+        if placed:
+            layouts.append(placed)
+
+        for placed in layouts:
+            page_height = max(py + s.get_height() + pad for _, s, _, py in placed)
+            page = pygame.Surface((self.page_width, page_height), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+
+            for name, surface, px, py in placed:
+                # RGBA_MAX onto a cleared page copies pixels and alpha unchanged
+                page.blit(surface, (px, py), special_flags=pygame.BLEND_RGBA_MAX)
+                area = pygame.Rect(px, py, *surface.get_size())
+                self.regions[name] = AtlasRegion(page, area, page.subsurface(area))
+            self.pages.append(page)
@@ -0,0 +1,67 @@
+# audio.py
+# ---------------------------------
+# Thin wrapper around pygame.mixer that can be switched off (headless mode)
+
+import pygame
+
+audio_enabled = True
+
+
+# Class: SilentSound
+# -------------------------------------------------------------
+# Stand-in for pygame.mixer.Sound when audio is disabled; every call is a no-op.
+
+class SilentSound:
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        return None
+
+    def set_volume(self, volume):
+        return None
+
+
+# Method: init_audio
+# enabled - False skips mixer initialisation entirely
+# -------------------------------------------------------------
+# Initialises the mixer. All other functions in this module do nothing
+# when audio is disabled or the mixer could not be initialised.
+
+def init_audio(enabled=True):
+    global audio_enabled
+    audio_enabled = enabled
+    if not enabled:
+        return
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        audio_enabled = False
+
+
+# Method: load_sound
+# path - file path of the sound effect
+# -------------------------------------------------------------
+# Returns a pygame Sound, or a SilentSound when audio is disabled.
+
+def load_sound(path):
+    if not audio_enabled:
+        return SilentSound()
+    return pygame.mixer.Sound(path)
+
+
+def play_music(path, volume, loops=-1):
+    if audio_enabled:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+
+
+def set_music_volume(volume):
+    if audio_enabled:
+        pygame.mixer.music.set_volume(volume)
+
+
+def stop_music():
+    if audio_enabled:
+        pygame.mixer.music.stop()
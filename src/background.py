@@ -2,21 +2,133 @@
 # ---------------------------------
 # Parallax background drawing functionality for vertical scrolling
 
-# Method: draw_animated_background
-# screen - instance of the screen to draw on
-# bg_layers - list of background image layers (surfaces)
-# scroll_offsets - list of current scroll positions for each layer
-# scroll_speeds - list of scroll speeds corresponding to each layer
+import pygame
+
+from src.assets import assets
+
+
+# Class: ParallaxBackground
+# layers      - list of (image path, scroll speed) from back to front
+# screen_size - (width, height) of the screen
 # -------------------------------------------------------------
-# Draws a vertically scrolling animated background.
-# Each layer scrolls at its own speed to create a parallax effect.
-# The images are wrapped around so that the scrolling appears continuous.
-# For each layer, two copies are drawn to ensure seamless looping.
-
-def draw_animated_background(screen, bg_layers, scroll_offsets, scroll_speeds):
-    screen_height = screen.get_height()
-    for i, layer in enumerate(bg_layers):
-        scroll_offsets[i] = (scroll_offsets[i] + scroll_speeds[i]) % screen_height
-        y = -scroll_offsets[i]
-        screen.blit(layer, (0, y))
-        screen.blit(layer, (0, y + screen_height))
+# Layered background that scrolls vertically with the camera; each layer
+# moves at its own fraction of the camera scroll to create a parallax effect.
+#
+# At build time every layer is scaled to cover the screen (aspect ratio kept,
+# centered crop). Fully transparent layers are dropped, fully opaque ones are
+# converted without alpha, and consecutive layers with the same speed are
+# pre-composited into one surface, so there is one surface per distinct speed.
+# The composited surfaces are what the on-disk asset cache keeps (about
+# 1.8 MB each at 600x750); the cover-scaled layers are only intermediates.
+#
+# When drawing, every surface wraps around vertically, and only the slices
+# that are visible on screen and contain pixels (the layer's bounding band)
+# are blitted with area blits, instead of two full-height copies per layer.
+
+class ParallaxBackground:
+    def __init__(self, layers, screen_size):
+        self.screen_size = screen_size
+        self.surfaces = []
+        self.speeds = []
+        self.bands = []  # visible (left, top, width, height) content of each surface
+        self.offsets = []
+
+        group = []
+        for path, speed in layers:
+            if assets.image(path).get_bounding_rect().height == 0:
+                continue  # fully transparent layer
+            if group and group[0][1] != speed:
+                self._add_group(group)
+                group = []
+            group.append((path, speed))
+        if group:
+            self._add_group(group)
+
+
+    # Scaled copy of a layer covering the screen (not kept by the registry)
+    def _cover(self, path):
+        width, height = self.screen_size
+        source = assets.image(path)
+        scale = max(width / source.get_width(), height / source.get_height())
+        size = (round(source.get_width() * scale), round(source.get_height() * scale))
+        return pygame.transform.scale(source, size)
+
+
+    def _add_group(self, group):
+        width, height = self.screen_size
+        paths = [path for path, _ in group]
+        surface = assets.baked(paths, f"parallax {width}x{height}", lambda: self._composite(paths))
+
+        self.surfaces.append(surface)
+        self.speeds.append(group[0][1])
+        self.bands.append(surface.get_bounding_rect())
+        self.offsets.append(0.0)
+
+
+    def _composite(self, paths):
+        width, height = self.screen_size
+        images = [self._cover(path) for path in paths]
+        opaque = _is_opaque(images[0])
+
+        surface = pygame.Surface((width, height), 0 if opaque else pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert() if opaque else surface.convert_alpha()
+        if not opaque:
+            surface.fill((0, 0, 0, 0))
+        for image in images:
+            surface.blit(image, ((width - image.get_width()) // 2, 0))
+        return surface
+
+
+    # Method: draw
+    # screen        - surface (or DrawList) to draw on
+    # camera_offset - total distance the camera has scrolled up
+    # -------------------------------------------------------------
+    # Draws all layers for the given camera position.
+
+    def draw(self, screen, camera_offset):
+        height = self.screen_size[1]
+        for i, surface in enumerate(self.surfaces):
+            offset = (camera_offset * self.speeds[i]) % height
+            self.offsets[i] = offset
+            band = self.bands[i]
+
+            # The layer repeats every screen height; copies start at offset - height and offset
+            shift = int(offset)
+            for start in (shift - height, shift):
+                top = max(0, start + band.top)
+                bottom = min(height, start + band.bottom)
+                if bottom > top:
+                    area = pygame.Rect(band.left, top - start, band.width, bottom - top)
+                    screen.blit(surface, (band.left, top), area)
+
+
+# Function: _is_opaque
+# surface - surface to test
+# -------------------------------------------------------------
+# Returns True if every pixel of the surface is fully opaque.
+
+def _is_opaque(surface):
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return True
+    mask = pygame.mask.from_surface(surface, 254)
+    return mask.count() == surface.get_width() * surface.get_height()
+
+
+_backgrounds = {}
+
+
+# Function: load_parallax
+# layers      - list of (image path, scroll speed) from back to front
+# screen_size - (width, height) of the screen
+# -------------------------------------------------------------
+# Returns a ParallaxBackground, building and compositing it only once
+# per layer set and screen size.
+
+def load_parallax(layers, screen_size):
+    key = (tuple(layers), tuple(screen_size))
+    background = _backgrounds.get(key)
+    if background is None:
+        background = ParallaxBackground(layers, screen_size)
+        _backgrounds[key] = background
+    return background
@@ -0,0 +1,184 @@
+# balance.py
+# ---------------------------------
+# Monte Carlo balance runs: survivability per difficulty level over many games
+
+import json
+import multiprocessing
+import os
+import time
+
+from src.config import MAX_PLATFORM_DISTANCE
+
+HEIGHT_BIN = 50    # death height histogram bin width in pixels (score units)
+BATCH_SIZE = 100   # games per worker task
+PROGRESS_TASKS = 50  # finished tasks between progress lines
+CAUSES = ("enemy", "fall", "timeout")
+
+
+# Class: BalanceStats
+# -------------------------------------------------------------
+# Streaming aggregate of game results. Memory depends on the number of
+# levels and height bins reached, not on the number of games, and two
+# aggregates merge by adding their counters, so every worker task
+# returns one and the runner folds them together as they arrive.
+#   levels[level][cause]    - games that ended on the level, by cause
+#                             ("timeout" = still alive at the frame limit)
+#   failed[level]           - enemy placements that broke the spawn rules
+#   heights[bin]            - games that ended at score in [bin, bin + HEIGHT_BIN)
+
+class BalanceStats:
+    def __init__(self):
+        self.games = 0
+        self.frames = 0
+        self.score_sum = 0
+        self.levels = {}
+        self.failed = {}
+        self.heights = {}
+
+
+    # Method: add
+    # result - run_simulation result dict
+    # -------------------------------------------------------------
+
+    def add(self, result):
+        score = result["score"]
+        level = score // MAX_PLATFORM_DISTANCE
+        self.games += 1
+        self.frames += result["frames"]
+        self.score_sum += score
+        causes = self.levels.setdefault(level, dict.fromkeys(CAUSES, 0))
+        causes[result["cause"]] += 1
+        height = score - score % HEIGHT_BIN
+        self.heights[height] = self.heights.get(height, 0) + 1
+        for failed_level, count in result["failed_placements"].items():
+            self.failed[failed_level] = self.failed.get(failed_level, 0) + count
+
+
+    # Method: merge
+    # other - BalanceStats to add to this one
+    # -------------------------------------------------------------
+
+    def merge(self, other):
+        self.games += other.games
+        self.frames += other.frames
+        self.score_sum += other.score_sum
+        for level, causes in other.levels.items():
+            mine = self.levels.setdefault(level, dict.fromkeys(CAUSES, 0))
+            for cause, count in causes.items():
+                mine[cause] += count
+        for level, count in other.failed.items():
+            self.failed[level] = self.failed.get(level, 0) + count
+        for height, count in other.heights.items():
+            self.heights[height] = self.heights.get(height, 0) + count
+
+
+    # Method: height_percentile
+    # point - percentile (0-100)
+    # -------------------------------------------------------------
+    # Death height at the given percentile, to HEIGHT_BIN resolution.
+
+    def height_percentile(self, point):
+        rank = max(1, -(-self.games * point // 100))
+        seen = 0
+        for height in sorted(self.heights):
+            seen += self.heights[height]
+            if seen >= rank:
+                return height
+        return 0
+
+
+    # Method: level_table
+    # -------------------------------------------------------------
+    # One row per level from 0 to the highest level reached:
+    # reached (games that got to the level), deaths by cause, hazard
+    # (share of the games reaching the level that died on it) and the
+    # failed placements on the level. Level 0 also counts the enemies the
+    # initial spawn found no room for, which is most of its placements.
+
+    def level_table(self):
+        top = max(list(self.levels) + list(self.failed) + [0])
+        rows = []
+        reached = self.games
+        for level in range(top + 1):
+            causes = self.levels.get(level, dict.fromkeys(CAUSES, 0))
+            deaths = causes["enemy"] + causes["fall"]
+            rows.append({
+                "level": level, "reached": reached,
+                "enemy": causes["enemy"], "fall": causes["fall"], "timeout": causes["timeout"],
+                "hazard": deaths / reached if reached else 0.0,
+                "failed_placements": self.failed.get(level, 0),
+            })
+            reached -= deaths + causes["timeout"]
+        return rows
+
+
+    def to_dict(self):
+        return {
+            "games": self.games, "frames": self.frames,
+            "mean_score": self.score_sum / self.games if self.games else 0.0,
+            "height_bin": HEIGHT_BIN,
+            "death_heights": {str(height): self.heights[height] for height in sorted(self.heights)},
+            "levels": self.level_table(),
+        }
+
+
+# Worker task: plays games seed .. seed + count - 1 and returns their BalanceStats
+def _play_batch(task):
+    from src.simulation import run_simulation
+
+    seed, count, max_frames, controller_factory, dt = task
+    stats = BalanceStats()
+    for game_seed in range(seed, seed + count):
+        stats.add(run_simulation(game_seed, controller_factory(), max_frames, dt))
+    return stats
+
+
+# Method: run_balance
+# games      - number of games to play
+# seed       - game i uses seed + i
+# max_frames - frame limit per game (None = until game over)
+# workers    - worker processes (None = one per CPU core)
+# controller - picklable factory of the controller (a class), default
+#              headless.AutoJumpController
+# output     - JSON file the aggregate is written to (None = print only)
+# dt         - frames per simulation step (see simulation.step)
+# -------------------------------------------------------------
+# Plays the games with run_simulation in a process pool, BATCH_SIZE
+# games per task. Tasks are independent and only return a BalanceStats,
+# so the run scales with the number of cores and a sweep of any size
+# needs no more memory than one aggregate per worker. Prints progress
+# every PROGRESS_TASKS finished tasks (a count that, unlike the number
+# of games, does not depend on which task finishes last), the death
+# height distribution and the per-level table; returns the BalanceStats.
+
+def run_balance(games, seed=0, max_frames=None, workers=None, controller=None, output=None, dt=1):
+    if controller is None:
+        from src.headless import AutoJumpController
+        controller = AutoJumpController
+    workers = workers or os.cpu_count() or 1
+
+    tasks = ((start, min(BATCH_SIZE, seed + games - start), max_frames, controller, dt)
+             for start in range(seed, seed + games, BATCH_SIZE))
+    stats = BalanceStats()
+    started = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        for done, partial in enumerate(pool.imap_unordered(_play_batch, tasks), 1):
+            stats.merge(partial)
+            if done % PROGRESS_TASKS == 0:
+                print(f"{stats.games}/{games} games")
+    elapsed = time.perf_counter() - started
+
+    print(f"{stats.games} games, {stats.frames} frames in {elapsed:.1f}s with {workers} workers "
+          f"({stats.games / elapsed:.0f} games/s), mean score {stats.to_dict()['mean_score']:.0f}")
+    print("death height p10/p50/p90: "
+          + "/".join(str(stats.height_percentile(point)) for point in (10, 50, 90)))
+    print("level  reached   enemy    fall  timeout  hazard  failed placements")
+    for row in stats.level_table():
+        print(f"{row['level']:5} {row['reached']:8} {row['enemy']:7} {row['fall']:7} {row['timeout']:8} "
+              f"{row['hazard']:7.1%} {row['failed_placements']:18}")
+    print("(level 0 failed placements include the enemies the initial spawn found no room for)")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(stats.to_dict(), f, indent=2)
+    return stats
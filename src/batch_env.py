@@ -0,0 +1,445 @@
+# batch_env.py
+# ---------------------------------
+# Batched environment: N independent games stepped together with NumPy
+
+import math
+
+import numpy as np
+
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, PLAYER_START_X, PLAYER_START_Y, SCROLL_TRIGGER_Y,
+    PLATFORM_WIDTH, PLATFORM_HEIGHT, PLATFORM_MIN_GAP, PLATFORM_MAX_GAP, PLATFORM_MAX_SHIFT,
+    BETTLE_SIZE, ENEMY_RESPAWN_Y, ENEMY_MIN_DISTANCE, ENEMY_PLATFORM_CLEARANCE, ENEMY_SPAWN_BOX,
+    LEVEL_CHUNK_HEIGHT, ENEMY_SPAWNS_PER_CHUNK
+)
+from src.player import Player
+from src.reachability import REACH_TABLE, MAX_DROP, MAX_RISE
+from src.replay import BIT_LEFT, BIT_RIGHT, BIT_JUMP
+from src.simulation import ENEMY_COUNT
+from src.swept import slab
+
+# Why a game ended (BatchEnv.causes)
+CAUSE_NONE = 0
+CAUSE_ENEMY = 1
+CAUSE_FALL = 2
+CAUSE_TIMEOUT = 3
+
+ENEMY_PATROL = 100       # Bettle: patrol range on each side of the spawn x
+ENEMY_SPEED = 2          # Bettle: patrol speed
+SPAWN_CANDIDATES = 16    # candidate positions tried per enemy (re)spawn
+
+# splitmix64 constants
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_STEPS = np.arange(1, 2 * SPAWN_CANDIDATES + 1, dtype=np.uint64)
+
+# Platform shift limit by rise (index rise + MAX_DROP), as in next_platform_spec
+_SHIFT_BY_RISE = np.minimum(PLATFORM_MAX_SHIFT, np.array(REACH_TABLE) + PLATFORM_WIDTH)
+
+
+# Function: random_int / random_unit
+# raw       - uint64 array from a splitmix64 stream
+# low, high - inclusive bounds (arrays or scalars)
+# -------------------------------------------------------------
+# Integers in [low, high] and floats in [0, 1) from raw random values.
+
+def random_int(raw, low, high):
+    span = (np.asarray(high) - low + 1).astype(np.uint64)
+    return low + (raw % span).astype(np.int64)
+
+
+def random_unit(raw):
+    return (raw >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+# Class: BatchEnv
+# num_games      - number of games N stepped together
+# enemy_count    - enemies per game (as for GameState)
+# platform_count - platforms per game (None = PlatformRing's default)
+# max_frames     - end games after this many steps (None = no limit)
+# -------------------------------------------------------------
+# Holds N games as stacked NumPy arrays: player (N,), platforms (N, K)
+# and enemies (N, E). step() advances all of them with whole-array
+# operations (no Python loop over games) by the rules of
+# simulation.step: jump, steering, gravity, moving platforms, camera
+# scroll with platform recycling and enemy respawns, landing, enemy
+# collision, enemy patrol and falling.
+#
+# Levels are built the same way as in the game (next_platform_spec's
+# gaps, shifts and moving platforms; enemies placed with the clearance
+# and distance rules from a fixed number of candidates), but every game
+# draws from its own splitmix64 stream, so a game only depends on its
+# seed and its actions, not on the other games of the batch. The levels
+# do not reproduce the ones GameState builds from the same seed.
+#
+# reset(seeds) starts all games; step(actions) returns
+# (observations, rewards, dones). A finished game is reset at once (from
+# the next seed of its own stream) and its final score and cause are
+# kept in `scores` and `causes` until it finishes again.
+#
+# actions      - int array (N,), BIT_LEFT | BIT_RIGHT | BIT_JUMP as in
+#                replay files
+# observations - float32 (N, observation_size): player x, y, vel_y,
+#                is_jumping, then x, y, velocity of every platform slot,
+#                then x, y, alive of every enemy slot (screen pixels)
+# rewards      - float32 (N,): score gained in the step (camera scroll)
+
+class BatchEnv:
+    def __init__(self, num_games, enemy_count=ENEMY_COUNT, platform_count=None, max_frames=None,
+                 screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
+        if platform_count is None:
+            platform_count = screen_height // PLATFORM_MIN_GAP + 2
+        self.num_games = n = num_games
+        self.width, self.height = screen_width, screen_height
+        self.max_frames = max_frames
+        k, e = platform_count, math.ceil(enemy_count)
+
+        self.rng = np.zeros(n, dtype=np.uint64)
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.vel_y = np.zeros(n)
+        self.jumping = np.zeros(n, dtype=bool)
+        self.offset = np.zeros(n)
+        self.frame = np.zeros(n, dtype=np.int64)
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.causes = np.zeros(n, dtype=np.int8)
+
+        self.plat_x = np.zeros((n, k))
+        self.plat_y = np.zeros((n, k))
+        self.plat_w = np.zeros((n, k))
+        self.plat_speed = np.zeros((n, k))
+        self.plat_dir = np.ones((n, k))
+        self.plat_min = np.zeros((n, k))
+        self.plat_max = np.zeros((n, k))
+        self.top_x = np.zeros(n)  # highest platform, the anchor of the next one
+        self.top_y = np.zeros(n)
+
+        self.enemy_x = np.zeros((n, e))
+        self.enemy_y = np.zeros((n, e))
+        self.enemy_dir = np.ones((n, e))
+        self.enemy_min = np.zeros((n, e))
+        self.enemy_max = np.zeros((n, e))
+        self.enemy_alive = np.zeros((n, e), dtype=bool)
+
+        self.observation_size = 4 + 3 * k + 3 * e
+        self._observations = np.zeros((n, self.observation_size), dtype=np.float32)
+        self._all = np.arange(n)
+
+
+    # Method: reset
+    # seeds - one seed per game (N ints)
+    # -------------------------------------------------------------
+    # Starts new games in every slot. Returns the observations.
+
+    def reset(self, seeds):
+        seeds = np.asarray(seeds, dtype=np.uint64)
+        if seeds.shape != (self.num_games,):
+            raise ValueError(f"expected {self.num_games} seeds, got {seeds.shape}")
+        self.rng[:] = seeds
+        self.scores[:] = 0
+        self.causes[:] = CAUSE_NONE
+        self._reset_games(self._all)
+        return self.observations()
+
+
+    # Method: step
+    # actions - int array (N,) of BIT_LEFT / BIT_RIGHT / BIT_JUMP flags
+    # -------------------------------------------------------------
+    # Advances every game by one simulation step.
+    # Returns (observations, rewards, dones).
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        width, height = self.width, self.height
+        pw, ph = Player.width, Player.height
+        x, y, vel_y, jumping = self.x, self.y, self.vel_y, self.jumping
+        prev_x, prev_y, prev_plat_x = x.copy(), y.copy(), self.plat_x.copy()
+
+        # Jump, steering (left wins), gravity
+        jump = ((actions & BIT_JUMP) != 0) & ~jumping
+        vel_y[jump] = Player.jump_velocity
+        jumping |= jump
+        left = (actions & BIT_LEFT) != 0
+        right = ((actions & BIT_RIGHT) != 0) & ~left
+        x += Player.speed * (right.astype(np.float64) - left)
+        np.clip(x, 0, width - pw, out=x)
+        vel_y += Player.gravity
+        y += vel_y
+
+        # Moving platforms
+        plat_x, plat_dir = self.plat_x, self.plat_dir
+        plat_x += self.plat_speed * plat_dir
+        plat_dir[plat_x > self.plat_max] = -1
+        plat_dir[plat_x < self.plat_min] = 1
+
+        # Camera scroll, platform recycling and enemy respawns
+        scroll = np.maximum(SCROLL_TRIGGER_Y - y, 0)
+        scrolling = scroll > 0
+        if scrolling.any():
+            y[scrolling] = SCROLL_TRIGGER_Y
+            prev_y += scroll
+            self.offset += scroll
+            self.plat_y += scroll[:, None]
+            self.top_y += scroll
+            self.enemy_y += scroll[:, None]
+            self._recycle_platforms()
+            self._respawn_enemies(scrolling)
+
+        # Land on the first platform whose landing band the falling feet
+        # pass through (swept, as in simulation.step)
+        plat_y = self.plat_y
+        left, right = np.minimum(prev_x, x), np.maximum(prev_x, x) + pw
+        near = ((vel_y > 0)[:, None] & (plat_y < (y + ph)[:, None])
+                & (plat_y + PLATFORM_HEIGHT + 10 >= (prev_y + ph)[:, None])
+                & (np.minimum(prev_plat_x, plat_x) < right[:, None])
+                & (np.maximum(prev_plat_x, plat_x) + self.plat_w > left[:, None]))
+        games, slots = np.nonzero(near)
+        start_x = prev_x[games] - prev_plat_x[games, slots]
+        x_low, x_high = slab(start_x, (x[games] - plat_x[games, slots]) - start_x, -pw, self.plat_w[games, slots])
+        y_low, y_high = slab(prev_y[games] + ph - plat_y[games, slots], y[games] - prev_y[games],
+                             0.0, PLATFORM_HEIGHT + 10)
+        low = np.maximum(np.maximum(x_low, y_low), 0.0)
+        hit = low < np.minimum(np.minimum(x_high, y_high), 1.0)
+        games, slots, low = games[hit], slots[hit], low[hit]
+        first = np.full(len(x), np.inf)
+        np.minimum.at(first, games, low)
+        top = np.full(len(x), np.inf)
+        earliest = low == first[games]
+        np.minimum.at(top, games[earliest], plat_y[games[earliest], slots[earliest]])
+        landed = np.isfinite(top)
+        y[landed] = top[landed] - ph
+        vel_y[landed] = 0
+        jumping[landed] = False
+
+        self.frame += 1
+
+        # Enemy collision (swept), enemy patrol, falling
+        ew, eh = BETTLE_SIZE
+        enemy_x, enemy_y = self.enemy_x, self.enemy_y
+        left, right = np.minimum(prev_x, x), np.maximum(prev_x, x) + pw
+        near = (self.enemy_alive & (enemy_x < right[:, None]) & (enemy_x + ew > left[:, None])
+                & (enemy_y < (np.maximum(prev_y, y) + ph)[:, None]) & (enemy_y + eh > np.minimum(prev_y, y)[:, None]))
+        games, slots = np.nonzero(near)
+        x_low, x_high = slab(prev_x[games] - enemy_x[games, slots], x[games] - prev_x[games], -pw, ew)
+        y_low, y_high = slab(prev_y[games] - enemy_y[games, slots], y[games] - prev_y[games], -ph, eh)
+        hit = np.maximum(np.maximum(x_low, y_low), 0.0) < np.minimum(np.minimum(x_high, y_high), 1.0)
+        touched = np.zeros(len(x), dtype=bool)
+        touched[games[hit]] = True
+        enemy_x += ENEMY_SPEED * self.enemy_dir
+        self.enemy_dir[enemy_x > self.enemy_max] = -1
+        self.enemy_dir[enemy_x < self.enemy_min] = 1
+        fell = ~touched & (y > height)
+
+        rewards = scroll.astype(np.float32)
+        dones = touched | fell
+        causes = np.where(touched, CAUSE_ENEMY, CAUSE_FALL)
+        if self.max_frames is not None:
+            timeout = ~dones & (self.frame >= self.max_frames)
+            causes[timeout] = CAUSE_TIMEOUT
+            dones |= timeout
+
+        if dones.any():
+            done = np.flatnonzero(dones)
+            self.scores[done] = self.offset[done].astype(np.int64)
+            self.causes[done] = causes[done]
+            self.rng[done] = self._random(done, 1)[:, 0]  # next game's seed, from the same stream
+            self._reset_games(done)
+        return self.observations(), rewards, dones
+
+
+    # Method: observations
+    # -------------------------------------------------------------
+    # Returns the current float32 observation array (reused between calls).
+
+    def observations(self):
+        obs = self._observations
+        k = self.plat_x.shape[1]
+        e = self.enemy_x.shape[1]
+        obs[:, 0] = self.x
+        obs[:, 1] = self.y
+        obs[:, 2] = self.vel_y
+        obs[:, 3] = self.jumping
+        p = 4
+        obs[:, p:p + 3 * k:3] = self.plat_x
+        obs[:, p + 1:p + 3 * k:3] = self.plat_y
+        obs[:, p + 2:p + 3 * k:3] = self.plat_speed * self.plat_dir
+        p += 3 * k
+        obs[:, p:p + 3 * e:3] = self.enemy_x
+        obs[:, p + 1:p + 3 * e:3] = self.enemy_y
+        obs[:, p + 2:p + 3 * e:3] = self.enemy_alive
+        return obs
+
+
+    # Method: auto_jump_actions
+    # -------------------------------------------------------------
+    # Vectorized AutoJumpController: jump whenever possible and steer
+    # towards the lowest platform above the player. Returns actions (N,).
+
+    def auto_jump_actions(self):
+        above = np.where(self.plat_y < self.y[:, None], self.plat_y, -np.inf)
+        target = above.argmax(axis=1)
+        has_target = np.isfinite(above[self._all, target])
+        target_x = self.plat_x[self._all, target] + self.plat_w[self._all, target] / 2
+        center_x = self.x + Player.width / 2
+        left = has_target & (target_x < center_x - Player.speed)
+        right = has_target & (target_x > center_x + Player.speed)
+        return (left * BIT_LEFT) | (right * BIT_RIGHT) | (~self.jumping * BIT_JUMP)
+
+
+    # (games, count) uniform uint64 values: the next `count` outputs of
+    # the splitmix64 streams of the given games, drawn in one block
+    def _random(self, games, count):
+        state = self.rng[games][:, None] + _GOLDEN * _STEPS[:count]
+        self.rng[games] = state[:, -1]
+        z = (state ^ (state >> np.uint64(30))) * _MIX1
+        z = (z ^ (z >> np.uint64(27))) * _MIX2
+        return z ^ (z >> np.uint64(31))
+
+
+    # Starts new games in the given slots: player at the start position,
+    # ground plus platforms above it, enemies on the first screen
+    def _reset_games(self, games):
+        width, height = self.width, self.height
+        self.x[games] = PLAYER_START_X
+        self.y[games] = PLAYER_START_Y
+        self.vel_y[games] = 0
+        self.jumping[games] = False
+        self.offset[games] = 0
+        self.frame[games] = 0
+
+        ground_y = height - 20
+        self.plat_x[games, 0] = 0
+        self.plat_y[games, 0] = ground_y
+        self.plat_w[games, 0] = width
+        self.plat_speed[games, 0] = 0
+        self.plat_dir[games, 0] = 1
+        self.plat_min[games, 0] = self.plat_max[games, 0] = 0
+        self.top_x[games] = (width - PLATFORM_WIDTH) / 2
+        self.top_y[games] = ground_y
+        for slot in range(1, self.plat_x.shape[1]):
+            self._next_platform(games, np.full(len(games), slot))
+
+        self.enemy_alive[games] = False
+        for slot in range(self.enemy_x.shape[1]):
+            raw = self._random(games, 2 * SPAWN_CANDIDATES)
+            x = random_int(raw[:, :SPAWN_CANDIDATES], 50, width - 100).astype(np.float64)
+            y = 100 + (height - 300) * random_unit(raw[:, SPAWN_CANDIDATES:])
+            self._place_enemies(games, slot, x, y, require_valid=True)
+
+
+    # Puts the next platform above each game's highest platform into the
+    # given slots (the rules of next_platform_spec)
+    def _next_platform(self, games, slots):
+        width = PLATFORM_WIDTH
+        raw = self._random(games, 5)
+        gap = random_int(raw[:, 0], PLATFORM_MIN_GAP, min(PLATFORM_MAX_GAP, MAX_RISE))
+        y = self.top_y[games] - gap
+        anchor = self.top_x[games].astype(np.int64)
+        shift = _SHIFT_BY_RISE[gap + MAX_DROP]
+        low = np.maximum(0, anchor - shift)
+        high = np.minimum(self.width - width, anchor + shift)
+        x = random_int(raw[:, 1], low, high).astype(np.float64)
+        moving = random_unit(raw[:, 2]) > 0.8
+        factor = 0.5 + 0.5 * random_unit(raw[:, 3])
+        move_range = np.where(moving, ((self.width - width - x) * factor).astype(np.int64), 0)
+        speed = np.where(moving, random_int(raw[:, 4], 2, 4), 0)
+
+        self.plat_x[games, slots] = x
+        self.plat_y[games, slots] = y
+        self.plat_w[games, slots] = width
+        self.plat_speed[games, slots] = speed
+        self.plat_dir[games, slots] = 1
+        self.plat_min[games, slots] = x
+        self.plat_max[games, slots] = x + move_range
+        self.top_x[games] = x
+        self.top_y[games] = y
+
+
+    # Replaces platforms that fell below the screen with new ones on top;
+    # one per game and round, as later platforms are always higher
+    def _recycle_platforms(self):
+        while True:
+            lowest = self.plat_y.argmax(axis=1)
+            below = self.plat_y[self._all, lowest] > self.height
+            if not below.any():
+                return
+            games = np.flatnonzero(below)
+            self._next_platform(games, lowest[games])
+
+
+    # Respawns enemies that scrolled below the screen above its top edge,
+    # at the first candidate that keeps the spawn rules (or the first
+    # candidate if none does, like simulation._respawn_enemies)
+    def _respawn_enemies(self, scrolling):
+        gone = self.enemy_alive & (self.enemy_y > self.height) & scrolling[:, None]
+        if not gone.any():
+            return
+        spacing = LEVEL_CHUNK_HEIGHT / ENEMY_SPAWNS_PER_CHUNK
+        for slot in np.flatnonzero(gone.any(axis=0)):
+            games = np.flatnonzero(gone[:, slot])
+            raw = self._random(games, 2 * SPAWN_CANDIDATES)
+            x = random_int(raw[:, :SPAWN_CANDIDATES], 50, self.width - 100).astype(np.float64)
+            y = ENEMY_RESPAWN_Y - spacing * random_unit(raw[:, SPAWN_CANDIDATES:])
+            self._place_enemies(games, slot, x, y, require_valid=False)
+
+
+    # Places enemy `slot` of the given games at the first of the (games, C)
+    # candidates that keeps the platform clearance and the distance to the
+    # other live enemies. Without a valid candidate the enemy stays dead
+    # (require_valid) or takes the first candidate.
+    def _place_enemies(self, games, slot, x, y, require_valid):
+        clear_x, clear_y = ENEMY_PLATFORM_CLEARANCE
+        box = ENEMY_SPAWN_BOX
+        px = self.plat_x[games][:, None, :]
+        py = self.plat_y[games][:, None, :]
+        pw = self.plat_w[games][:, None, :]
+        cx, cy = x[:, :, None], y[:, :, None]
+        near_platform = ((cx > px - box - clear_x) & (cx < px + pw + clear_x)
+                         & (cy > py - box - clear_y) & (cy < py + PLATFORM_HEIGHT + clear_y)).any(axis=2)
+
+        others = self.enemy_alive[games].copy()
+        others[:, slot] = False
+        distance2 = (cx - self.enemy_x[games][:, None, :]) ** 2 + (cy - self.enemy_y[games][:, None, :]) ** 2
+        crowded = ((distance2 < ENEMY_MIN_DISTANCE ** 2) & others[:, None, :]).any(axis=2)
+
+        valid = ~near_platform & ~crowded
+        choice = valid.argmax(axis=1)
+        rows = np.arange(len(games))
+        ex, ey = x[rows, choice], y[rows, choice]
+        alive = valid.any(axis=1) if require_valid else np.ones(len(games), dtype=bool)
+
+        self.enemy_x[games, slot] = ex
+        self.enemy_y[games, slot] = ey
+        self.enemy_dir[games, slot] = 1
+        self.enemy_min[games, slot] = ex - ENEMY_PATROL
+        self.enemy_max[games, slot] = ex + ENEMY_PATROL
+        self.enemy_alive[games, slot] = alive
+
+
+# Method: run_batch
+# num_games - games stepped together
+# steps     - steps to run
+# seed      - game i starts from seed + i
+# -------------------------------------------------------------
+# Plays `num_games` games with the vectorized auto-jump controller for
+# `steps` steps, prints the step rate and the mean score of the games
+# that ended, and returns the BatchEnv.
+
+def run_batch(num_games, steps, seed=0):
+    import time
+
+    env = BatchEnv(num_games)
+    env.reset(np.arange(seed, seed + num_games))
+    finished = 0
+    total_score = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, dones = env.step(env.auto_jump_actions())
+        finished += int(dones.sum())
+        total_score += int(env.scores[dones].sum())
+    elapsed = time.perf_counter() - start
+    print(f"{num_games} games x {steps} steps in {elapsed:.2f}s "
+          f"({num_games * steps / elapsed:.0f} game-steps/s), {finished} games ended, "
+          f"mean score {total_score / finished if finished else 0:.0f}")
+    return env
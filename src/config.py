@@ -7,14 +7,43 @@ SCREEN_HEIGHT = 750
 # Player starting position
 PLAYER_START_X = 300
 PLAYER_START_Y = SCREEN_HEIGHT - 150
+PLAYER_SIZE = (64, 64)
+
+# Platform dimensions
+PLATFORM_WIDTH = 100
+PLATFORM_HEIGHT = 25
 
 # Assets - images
-BACKGROUND_IMAGE = "assets/images/Nature Landscapes Free Pixel Art/nature_1/orig.png"
 PAUSE_ICON_PATH = "assets/images/pause_btn.svg"
 INFO_ICON_PATH = "assets/images/info_btn.svg"
 VOLUME_ICON_PATH = "assets/images/volume_btn.svg"
 ICON_SIZE = (40, 40)
 
+# Baked asset cache: decoded, scaled and converted images stored as raw
+# pixels, keyed by source file hash and target size (see asset_cache.py)
+ASSET_CACHE = True
+ASSET_CACHE_DIR = "assets/cache"
+
+# Parallax background layers (back to front) and their share of the camera scroll.
+# Consecutive layers with the same speed are pre-composited into one surface.
+PARALLAX_DIR = "assets/images/Nature Landscapes Free Pixel Art/nature_5"
+PARALLAX_LAYERS = [
+    (f"{PARALLAX_DIR}/1.png", 0.2),
+    (f"{PARALLAX_DIR}/2.png", 0.4),
+    (f"{PARALLAX_DIR}/3.png", 0.6),
+    (f"{PARALLAX_DIR}/4.png", 0.6),
+    (f"{PARALLAX_DIR}/5.png", 1.2),
+]
+
+PLATFORM_IMAGE = "assets/images/platform.png"
+MOVING_PLATFORM_IMAGE = "assets/images/moving_platform_cloud_lighter.png"
+GROUND_IMAGE = "assets/images/ground_new.png"
+PLAYER_SPRITE_SHEET = "assets/images/BirdSprite.png"
+PLAYER_FRAME_SIZE = (16, 16)
+PLAYER_FRAMES_PER_ROW = (2, 8, 3)  # idle, fly/jump, eat
+BETTLE_FRAMES = [f"assets/images/enemies/bettle{i}.png" for i in range(1, 5)]
+BETTLE_SIZE = (36, 39)  # size of the bettle frames, used as its hitbox
+
 # UI positions
 PAUSE_BTN_POS = (SCREEN_WIDTH - 50, 60)
 INFO_BTN_POS = (SCREEN_WIDTH - 100, 60)
@@ -28,6 +57,24 @@ GAME_OVER_SOUND_PATH = "assets/sounds/gameover.wav"
 MAX_PLATFORM_DISTANCE = 300  # Distance per level increase
 SCROLL_TRIGGER_Y = SCREEN_HEIGHT // 3
 
+# Platform generation (a jump rises about 320 px; src/reachability.py caps
+# both limits at what a jump can actually reach)
+PLATFORM_MIN_GAP = 60     # vertical distance between consecutive platforms
+PLATFORM_MAX_GAP = 110
+PLATFORM_MAX_SHIFT = 120  # horizontal distance between consecutive platforms
+
+# Level streaming
+LEVEL_CHUNK_HEIGHT = SCREEN_HEIGHT  # height of one pre-generated level chunk
+LEVEL_LOOKAHEAD_CHUNKS = 3          # chunks kept generated ahead of the camera
+LEVEL_STREAM_THREAD = True          # generate on a worker thread (False = in idle frame time)
+ENEMY_SPAWNS_PER_CHUNK = 2          # enemy respawn points per chunk
+
+# Enemy spawn rules (positions are the top-left corner of the enemy)
+ENEMY_MIN_DISTANCE = 200              # between any two spawned enemies
+ENEMY_PLATFORM_CLEARANCE = (150, 40)  # free space (x, y) between the enemy's box and any platform
+ENEMY_SPAWN_BOX = 50                  # size of the enemy box the clearance is measured from
+ENEMY_SPAWN_ATTEMPTS = 30             # candidates per sample and per grid cell of the spawner
+
 # Info box
 INFO_BOX_RECT = (50, 200, 500, 300)
 INFO_TEXT_COLOR = (0, 0, 0)
@@ -46,6 +93,16 @@ NOTIF_POS = (SCREEN_WIDTH // 2, 40)
 
 # Game mechanics
 ENEMY_RESPAWN_Y = -50
+ENEMY_RESPAWN_BAND = 2 * LEVEL_CHUNK_HEIGHT  # respawn points are taken at most this far above ENEMY_RESPAWN_Y
+GRID_CELL_SIZE = 128  # cell size of the spatial grid used for collision and placement queries
+
+# Timing
+SIM_HZ = 60             # simulation steps per second; all movement is defined per step
+RENDER_FPS = 60         # frame rate cap of the window (0 = uncapped), independent of SIM_HZ
+MAX_CATCHUP_STEPS = 5   # most simulation steps run for one rendered frame
+
+# Rendering
+DIRTY_RECT_RENDERING = False  # push only changed screen regions to the display
 
 # Info
 
@@ -0,0 +1,100 @@
+# dirty_rects.py
+# ---------------------------------
+# Dirty-rectangle presentation: push only the changed parts of the frame
+
+import pygame
+
+
+# Class: DirtyRectTracker
+# screen_size - (width, height) of the display
+# enabled     - when False, present() always updates the whole window
+# -------------------------------------------------------------
+# The frame is still composed in full on the screen surface, but only the
+# regions that may have changed are sent to the display.
+#
+# Every dynamic element is reported each frame with track(key, rect).
+# A key's area is dirty when its rect moved (old and new rect are pushed)
+# or when the caller says its content changed (e.g. an animated sprite or
+# a new score text). Keys that are no longer reported (recycled platforms,
+# respawned clouds) get their last rect pushed once so they are erased.
+# invalidate() forces a full-window update, e.g. when the camera scrolls.
+
+class DirtyRectTracker:
+    def __init__(self, screen_size, enabled=True):
+        self.enabled = enabled
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self._previous = {}
+        self._current = {}
+        self._rects = []
+        self._full = True
+
+
+    # Method: track
+    # key     - stable identifier of the element (e.g. id(platform))
+    # rect    - area the element was drawn to this frame
+    # changed - True if the pixels inside rect changed even if it did not move
+    # -------------------------------------------------------------
+
+    def track(self, key, rect, changed=True):
+        previous = self._previous.pop(key, None)
+        self._current[key] = rect
+        if self._full:
+            return
+        if previous is None:
+            self._rects.append(rect)
+        elif previous != rect:
+            # Small moves: one rect covering both positions
+            if previous.colliderect(rect):
+                self._rects.append(previous.union(rect))
+            else:
+                self._rects.append(previous)
+                self._rects.append(rect)
+        elif changed:
+            self._rects.append(rect)
+
+
+    # Method: mark
+    # rect - area to push to the display this frame
+    # -------------------------------------------------------------
+
+    def mark(self, rect):
+        if not self._full:
+            self._rects.append(pygame.Rect(rect))
+
+
+    # Method: invalidate
+    # -------------------------------------------------------------
+    # Requests a full-window update for the current frame.
+
+    def invalidate(self):
+        self._full = True
+
+
+    # Method: present
+    # -------------------------------------------------------------
+    # Pushes the dirty regions (or the whole window) to the display and
+    # starts a new frame. Returns the number of rects that were pushed
+    # (0 meaning the full window).
+
+    def present(self):
+        rects = self._rects
+        if not self._full:
+            rects.extend(self._previous.values())  # elements that disappeared
+
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        if (not self.enabled or self._full
+                or sum(r.width * r.height for r in rects) > screen_area // 2):
+            pygame.display.update()
+            pushed = 0
+        else:
+            rects = [r.clip(self.screen_rect) for r in rects]
+            rects = [r for r in rects if r.width and r.height]
+            if rects:
+                pygame.display.update(rects)
+            pushed = len(rects)
+
+        self._previous = self._current
+        self._current = {}
+        self._rects = []
+        self._full = not self.enabled
+        return pushed
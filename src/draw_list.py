@@ -0,0 +1,96 @@
+# draw_list.py
+# ---------------------------------
+# Frame command buffer: record blits during the frame, submit them in one batch
+
+import pygame
+
+# Z-order layers used by the gameplay loop (drawn from low to high)
+Z_BACKGROUND = 0
+Z_PLATFORMS = 10
+Z_ENEMIES = 20
+Z_PLAYER = 30
+Z_HUD = 40
+
+
+# Class: DrawList
+# bounds - area of the target surface; commands entirely outside are culled
+# -------------------------------------------------------------
+# Collects (surface, position, area) blit commands per z layer. DrawList.blit
+# has the same signature as Surface.blit, so every draw method that only
+# blits (Player.draw, Platform.draw, BaseEnemy.draw, draw_background,
+# draw_number, ...) can record into a DrawList instead of drawing directly.
+# flush() submits all commands, ordered by z and then by recording order,
+# with a single Surface.blits() call.
+#
+# The current layer is set with the z attribute before calling a subsystem's
+# draw method. The recorded/culled counters of the last flushed frame are
+# kept in last_recorded/last_culled for instrumentation.
+
+class DrawList:
+    def __init__(self, bounds):
+        self.bounds = pygame.Rect(bounds)
+        self.z = 0
+        self._layers = {}
+        self.recorded = 0
+        self.culled = 0
+        self.last_recorded = 0
+        self.last_culled = 0
+
+
+    # Method: blit
+    # source - surface to draw
+    # dest   - top-left position (tuple or Rect)
+    # area   - optional source rect (e.g. an atlas region)
+    # z      - layer override; defaults to the current z attribute
+    # -------------------------------------------------------------
+    # Records a blit and returns the screen rect it will cover.
+
+    def blit(self, source, dest, area=None, z=None):
+        if area is None:
+            rect = pygame.Rect(dest[0], dest[1], *source.get_size())
+        else:
+            rect = pygame.Rect(dest[0], dest[1], area[2], area[3])
+
+        if not rect.colliderect(self.bounds):
+            self.culled += 1
+            return rect
+
+        layer = self._layers.get(self.z if z is None else z)
+        if layer is None:
+            layer = self._layers[self.z if z is None else z] = []
+        layer.append((source, rect.topleft, area))
+        self.recorded += 1
+        return rect
+
+
+    # Surface-like size queries, answered from bounds
+    def get_size(self):
+        return self.bounds.size
+
+    def get_width(self):
+        return self.bounds.width
+
+    def get_height(self):
+        return self.bounds.height
+
+    def get_rect(self):
+        return self.bounds.copy()
+
+
+    # Method: flush
+    # target - surface to submit the recorded commands to
+    # -------------------------------------------------------------
+    # Draws every recorded command in z order with one Surface.blits()
+    # call and clears the list for the next frame.
+
+    def flush(self, target):
+        commands = []
+        for z in sorted(self._layers):
+            commands.extend(self._layers[z])
+        target.blits(commands, doreturn=False)
+
+        self._layers.clear()
+        self.z = 0
+        self.last_recorded, self.last_culled = self.recorded, self.culled
+        self.recorded = 0
+        self.culled = 0
@@ -1,60 +1,164 @@
-
 # enemy_logic.py
 # ---------------------------------
 # Handles enemy creation with collision constraints
 
+import math
+import random
+
+from src.config import (
+    ENEMY_MIN_DISTANCE, ENEMY_PLATFORM_CLEARANCE, ENEMY_SPAWN_BOX, ENEMY_SPAWN_ATTEMPTS
+)
+from src.sprites.bettle import Bettle
+
+
+# Class: EnemySpawner
+# screen_width - width of the game screen; spawn x lies in [50, screen_width - 100]
+# min_distance - smallest distance between two enemies
+# attempts     - candidates tried around each sample before it is retired
+# -------------------------------------------------------------
+# Poisson-disk sampler (Bridson's algorithm) for enemy spawn points that
+# follow the spawn rules:
+# - the enemy's ENEMY_SPAWN_BOX box keeps ENEMY_PLATFORM_CLEARANCE away
+#   from every platform,
+# - no two enemies are closer than min_distance.
+# A band is filled with blue noise: new candidates are drawn in the ring
+# [r, 2r] around accepted points and tested against a background grid of
+# cell size r / sqrt(2) (at most one point per cell, so the distance test
+# looks at 5 x 5 cells) and against the platforms binned by grid row.
+# When no accepted point has room left, the next empty grid cell (in
+# random order) gets `attempts` fresh candidates, so free pockets between
+# platforms are found even when they are not connected to each other.
+# The work is bounded by `attempts` candidates per sample and per grid
+# cell, whatever the layout, and each candidate costs O(1).
+# The requested number of points is then drawn from the filled band, so
+# the result keeps both rules. A band too crowded for them yields fewer
+# points, never rule-breaking ones.
+
+class EnemySpawner:
+    def __init__(self, screen_width, min_distance=ENEMY_MIN_DISTANCE, attempts=ENEMY_SPAWN_ATTEMPTS):
+        self.left = 50
+        self.right = screen_width - 100
+        self.min_distance = min_distance
+        self.attempts = attempts
+        self.cell = min_distance / math.sqrt(2)
+
+
+    # Method: sample
+    # rng       - random number source (the random module or a random.Random)
+    # top       - upper edge of the band spawn points are placed in
+    # bottom    - lower edge of the band
+    # count     - number of spawn points wanted
+    # platforms - (x, y, width, height) boxes of the platforms to avoid
+    # taken     - (x, y) positions of existing enemies to keep away from
+    # -------------------------------------------------------------
+    # Returns up to `count` (x, y) spawn points in the band, in random order.
+    # All coordinates use the same system (screen or world).
+
+    def sample(self, rng, top, bottom, count, platforms, taken=()):
+        r = self.min_distance
+        r2 = r * r
+        cell = self.cell
+        left, right = self.left, self.right
+        clear_x, clear_y = ENEMY_PLATFORM_CLEARANCE
+        box = ENEMY_SPAWN_BOX
+
+        # Spawn points too close to a platform form a box around it; the
+        # boxes are binned by the grid rows they span
+        blocked = {}
+        for px, py, pw, ph in platforms:
+            area = (px - box - clear_x, py - box - clear_y, px + pw + clear_x, py + ph + clear_y)
+            for row in range(math.floor((area[1] - top) / cell), math.floor((area[3] - top) / cell) + 1):
+                blocked.setdefault(row, []).append(area)
+
+        grid = {}  # (column, row) -> points in the cell
+        for point in taken:
+            key = (math.floor((point[0] - left) / cell), math.floor((point[1] - top) / cell))
+            grid.setdefault(key, []).append(point)
+
+        def fits(x, y):
+            if not (left <= x <= right and top <= y <= bottom):
+                return False
+            cx, cy = math.floor((x - left) / cell), math.floor((y - top) / cell)
+            for x0, y0, x1, y1 in blocked.get(cy, ()):
+                if x0 < x < x1 and y0 < y < y1:
+                    return False
+            for gx in range(cx - 2, cx + 3):
+                for gy in range(cy - 2, cy + 3):
+                    for ox, oy in grid.get((gx, gy), ()):
+                        if (ox - x) ** 2 + (oy - y) ** 2 < r2:
+                            return False
+            return True
+
+        def accept(x, y):
+            point = (x, y)
+            grid.setdefault((math.floor((x - left) / cell), math.floor((y - top) / cell)), []).append(point)
+            points.append(point)
+            active.append(point)
+
+        # Cells fresh candidates are drawn in, visited in random order
+        columns = math.floor((right - left) / cell) + 1
+        rows = math.floor((bottom - top) / cell) + 1
+        seeds = [(gx, gy) for gx in range(columns) for gy in range(rows)]
+        rng.shuffle(seeds)
+
+        points = []
+        active = []
+        while True:
+            if active:
+                i = rng.randrange(len(active))
+                ax, ay = active[i]
+                for _ in range(self.attempts):
+                    angle = rng.uniform(0, 2 * math.pi)
+                    distance = rng.uniform(r, 2 * r)
+                    x, y = ax + distance * math.cos(angle), ay + distance * math.sin(angle)
+                    if fits(x, y):
+                        accept(x, y)
+                        break
+                else:
+                    active[i] = active[-1]
+                    active.pop()
+            elif seeds:
+                gx, gy = seeds.pop()
+                if (gx, gy) in grid:
+                    continue
+                x0, y0 = left + gx * cell, top + gy * cell
+                x1, y1 = min(x0 + cell, right), min(y0 + cell, bottom)
+                for _ in range(self.attempts):
+                    x, y = rng.uniform(x0, x1), rng.uniform(y0, y1)
+                    if fits(x, y):
+                        accept(x, y)
+                        break
+            else:
+                break
+
+        if len(points) <= count:
+            return points
+        return rng.sample(points, count)
+
+
 # Method: spawn_enemies
-# num - number of enemies to spawn
+# num - number of enemies to spawn (rounded up)
 # screen_width, screen_height - dimensions of the game screen
 # game - reference to the game instance (used to create enemy instances)
 # platforms - list of platform objects to avoid when spawning enemies
+# rng - random number source (the random module or a random.Random)
+# store - EntityStore for the enemies (None = one store per enemy)
+# spawner - EnemySpawner to place them with (None = a new one)
 # -------------------------------------------------------------
-# Spawns a specified number of enemies at random positions on the screen.
-# Ensures that enemies:
+# Spawns a specified number of enemies at random positions on the screen,
+# placed by an EnemySpawner (the one that also places respawned enemies),
+# so that enemies:
 # - do not spawn inside or too close to platforms,
 # - do not spawn too close to each other (min_distance),
 # - are within screen bounds.
-# Tries up to 1000 attempts to find valid spawn positions.
-
-def spawn_enemies(num, screen_width, screen_height, game, platforms):
-    import pygame
-    from random import randint
-    from src.sprites.bettle import Bettle
-
-    enemies = []
-    attempts = 0
-    min_distance = 200
-    min_platform_dist_x = 150
-    min_platform_dist_y = 40
-
-    while len(enemies) < num and attempts < 1000:
-        x = randint(50, screen_width - 50)
-        y = randint(100, screen_height - 200)
-        test_rect = pygame.Rect(x, y, 50, 50)
-
-        collides = False
-        for p in platforms:
-            plat_rect = pygame.Rect(p.x, p.y, p.width, p.height)
-            if test_rect.colliderect(plat_rect):
-                collides = True
-                break
-
-            dx = max(0, max(p.x - (x + 50), x - (p.x + p.width)))
-            dy = max(0, max(p.y - (y + 50), y - (p.y + p.height)))
-            if dx < min_platform_dist_x and dy < min_platform_dist_y:
-                collides = True
-                break
-
-        if not collides:
-            for e in enemies:
-                distance = ((e.rect.x - x)**2 + (e.rect.y - y)**2)**0.5
-                if distance < min_distance:
-                    collides = True
-                    break
-
-        if not collides:
-            enemies.append(Bettle(game=game, x=x, y=y))
+# Fewer enemies are returned only if the screen has no room for more.
 
-        attempts += 1
+def spawn_enemies(num, screen_width, screen_height, game, platforms, rng=None, store=None, spawner=None):
+    if rng is None:
+        rng = random
+    if spawner is None:
+        spawner = EnemySpawner(screen_width)
 
-    return enemies
+    boxes = [(p.x, p.y, p.width, p.height) for p in platforms]
+    points = spawner.sample(rng, 100, screen_height - 200, math.ceil(num), boxes)
+    return [Bettle(game=game, x=x, y=y, store=store) for x, y in points]
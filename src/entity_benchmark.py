@@ -0,0 +1,304 @@
+# entity_benchmark.py
+# ---------------------------------
+# Memory and attribute-access cost of the slotted entity classes against
+# the original plain-attribute ones
+
+import sys
+import time
+
+import pygame
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, PLATFORM_IMAGE
+from src.draw_list import DrawList
+from src.entity_store import EntityStore
+from src.game_platform import Platform
+from src.player import Player
+
+
+# Class: BaselinePlatform
+# -------------------------------------------------------------
+# The Platform class as it was before the slotted rewrite: every field a
+# plain instance attribute in a per-instance __dict__, including the
+# pre-scaled image. Only what the benchmark exercises is kept; update()
+# and draw() are the original code.
+
+class BaselinePlatform:
+    def __init__(self, x, y, width=100, height=25, moving=False, move_range=100, move_speed=2, image=None, is_ground=False):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.moving = moving
+        self.move_range = move_range
+        self.move_speed = move_speed
+        self.start_x = x
+        self.direction = 1 #1 = right, -1 = left
+        self.movement_delta = 0
+        self.image = image
+        self.is_ground = is_ground
+
+        if image:
+            self.image = pygame.transform.scale(image, (self.width, self.height))
+
+    def update(self):
+        if self.moving:
+            old_x = self.x
+            self.x += self.move_speed * self.direction
+            self.movement_delta = self.x - old_x
+            if self.x > self.start_x + self.move_range:
+                self.direction = -1
+            elif self.x < self.start_x:
+                self.direction = 1
+        else:
+            self.movement_delta = 0
+
+    def draw(self, screen):
+        if self.image:
+            screen.blit(self.image, (self.x, self.y))
+        else:
+            pygame.draw.rect(screen, (0, 255, 0), (self.x, self.y, self.width, self.height))
+
+        if self.y >= screen.get_height() - 30 and self.is_ground:
+            ground_img = pygame.image.load("assets/images/ground_new.png").convert_alpha()
+            ground_img = pygame.transform.scale(ground_img, (screen.get_width(), ground_img.get_height()))
+            screen.blit(ground_img, (0, 750 - 80))
+
+
+# Class: BaselinePlayer
+# animations - sprite frames (the original sliced its own copy of the
+#              sheet per player; sharing them only shortens the setup)
+# -------------------------------------------------------------
+# The Player class as it was before the slotted rewrite: per-instance
+# __dict__ with the constants (gravity, animation speed) and the current
+# image copied into every player. move(), apply_gravity(), update() and
+# draw() are the original code.
+
+class BaselinePlayer:
+    width = 64
+    height = 64
+    speed = 5
+
+    def __init__(self, x, y, animations):
+        self.x = x
+        self.y = y
+        self.vel_y = 0
+        self.gravity = 0.6
+        self.is_jumping = False
+        self.direction = "idle"  # 'idle', 'fly', 'jump', 'eat'
+        self.facing_right = False
+
+        self.animations = animations
+        self.current_row = 0
+        self.current_frame = 0
+        self.animation_timer = 0
+        self.animation_speed = 0.04
+        self.image = self.animations[self.current_row][self.current_frame]
+
+    def move(self, keys, screen_width):
+        if keys[pygame.K_LEFT]:
+            self.x -= self.speed
+            self.direction = "fly"
+            self.facing_right = True
+        elif keys[pygame.K_RIGHT]:
+            self.x += self.speed
+            self.direction = "fly"
+            self.facing_right = False
+        else:
+            self.direction = "idle"
+
+        self.x = max(0, min(self.x, screen_width - self.width))
+
+    def apply_gravity(self):
+        self.vel_y += self.gravity
+        self.y += self.vel_y
+
+        # Use jump/fly animation when moving vertically
+        if self.vel_y < 0:
+            self.direction = "fly"
+        elif self.vel_y > 5:
+            self.direction = "fly"
+
+    def update(self, dt):
+        # Set current animation row
+        if self.direction == "idle":
+            self.current_row = 0
+            self.current_frame = 0  # Always show the first idle frame
+            self.image = self.animations[self.current_row][self.current_frame]
+            return  # Skip animation
+
+        elif self.direction == "fly":
+            self.current_row = 1
+        elif self.direction == "eat":
+            self.current_row = 2
+
+        # Animate for non-idle directions
+        self.animation_timer += dt
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            num_frames = len(self.animations[self.current_row])
+            self.current_frame = (self.current_frame + 1) % num_frames
+            self.image = self.animations[self.current_row][self.current_frame]
+
+    def draw(self, screen):
+        image = self.image
+        if not self.facing_right:
+            image = pygame.transform.flip(self.image, True, False)
+        screen.blit(image, (self.x, self.y))
+
+
+# Function: object_size
+# obj - entity object (or dict)
+# -------------------------------------------------------------
+# Bytes used by the object itself plus its __dict__, if it has one.
+
+def object_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+# Function: time_per_object
+# run     - callable(objects) doing one pass over the objects
+# objects - the objects
+# rounds  - passes per measurement; the best of 5 measurements is kept
+# -------------------------------------------------------------
+# Returns microseconds per object and pass.
+
+def time_per_object(run, objects, rounds):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            run(objects)
+        best = min(best, time.perf_counter() - start)
+    return best / rounds / len(objects) * 1e6
+
+
+# Cloud drift and blit, as in start.draw_clouds, for slotted clouds and
+# for the original dict clouds
+def _drift_clouds(clouds, surface):
+    for cloud in clouds:
+        cloud.y += cloud.speed
+        surface.blit(cloud.image, (cloud.x, cloud.y))
+        if cloud.y > SCREEN_HEIGHT:
+            cloud.y = -100
+
+
+def _drift_dict_clouds(clouds, surface):
+    for cloud in clouds:
+        cloud["y"] += cloud["speed"]
+        surface.blit(cloud["image"], (cloud["x"], cloud["y"]))
+        if cloud["y"] > SCREEN_HEIGHT:
+            cloud["y"] = -100
+
+
+# Method: run_entity_benchmark
+# count  - entities per kind
+# rounds - update/draw passes per measurement
+# -------------------------------------------------------------
+# Compares the slotted Player, Platform and Cloud with the original
+# plain-attribute classes (BaselinePlayer, BaselinePlatform, dict
+# clouds): bytes per object (not counting a platform's EntityStore row)
+# and microseconds per object for an update pass (simulation step work)
+# and a draw pass (recording into a DrawList that culls everything, so
+# only the entity side is measured). Each variant runs its own code, so
+# the baseline rows include the original per-draw player flip. Prints one
+# line per variant and the change of each slotted row against its
+# baseline, and returns the rows as dicts.
+#
+# Smaller objects do not make every pass faster. A Platform reads and
+# writes a numpy row, which costs more per field than a __dict__
+# attribute, so its update pass is slower than the baseline's. The
+# simulation does not use it: it moves every platform at once with
+# EntityStore.move, which is where the store pays off. Platform draw also
+# interpolates and looks up its atlas region, work the original did not
+# do.
+
+def run_entity_benchmark(count=1000, rounds=100):
+    from src import headless, start
+
+    headless.init_pygame()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    start.load_assets()
+    draw_list = DrawList(pygame.Rect(0, 0, 0, 0))
+    image = start.cloud_variants[0]
+
+    def step_baseline_player(players):
+        keys = {pygame.K_LEFT: False, pygame.K_RIGHT: True}
+        for player in players:
+            player.move(keys, SCREEN_WIDTH)
+            player.apply_gravity()
+            player.update(1 / 60)
+            if player.y > SCREEN_HEIGHT:
+                player.y = 0
+                player.vel_y = 0
+
+    def step_player(players):
+        for player in players:
+            player.prev_x, player.prev_y = player.x, player.y
+            player.steer(False, True, SCREEN_WIDTH)
+            player.apply_gravity()
+            player.update(1 / 60)
+            if player.y > SCREEN_HEIGHT:
+                player.y = 0
+                player.vel_y = 0
+
+    def draw_all(entities):
+        for entity in entities:
+            entity.draw(draw_list, 0.5)
+
+    def draw_baseline(entities):
+        for entity in entities:
+            entity.draw(draw_list)
+
+    def update_all(entities):
+        for entity in entities:
+            entity.update()
+
+    def make_platforms():
+        store = EntityStore(count)
+        return lambda: Platform(100, 200, moving=True, image=PLATFORM_IMAGE, store=store)
+
+    def make_dict_cloud():
+        return {"image": image, "x": 10, "y": 0, "speed": 1.5}
+
+    def make_cloud(cls):
+        def factory():
+            cloud = cls()
+            cloud.image, cloud.speed = image, 1.5
+            return cloud
+        return factory
+
+    frames = [[region.image for region in row] for row in Player(0, 0).animations]
+    platform_image = pygame.image.load(PLATFORM_IMAGE)
+    variants = [
+        ("player", "slots", lambda: Player(100, 100), step_player, draw_all),
+        ("player", "dict", lambda: BaselinePlayer(100, 100, frames), step_baseline_player, draw_baseline),
+        ("platform", "slots", make_platforms(), update_all, draw_all),
+        ("platform", "dict", lambda: BaselinePlatform(100, 200, moving=True, image=platform_image),
+         update_all, draw_baseline),
+        ("cloud", "slots", make_cloud(start.Cloud), None, lambda c: _drift_clouds(c, draw_list)),
+        ("cloud", "dict", make_dict_cloud, None, lambda c: _drift_dict_clouds(c, draw_list)),
+    ]
+
+    rows = []
+    for kind, variant, factory, update, draw in variants:
+        objects = [factory() for _ in range(count)]
+        size = object_size(objects[0])
+        row = {
+            "entity": kind, "variant": variant, "bytes": size,
+            "update_us": time_per_object(update, objects, rounds) if update else None,
+            "draw_us": time_per_object(draw, objects, rounds),
+        }
+        rows.append(row)
+        update_text = f"{row['update_us']:.3f}us" if update else "-"
+        print(f"{kind:9} {variant:6} {size:7.0f} bytes  update {update_text:>9}  draw {row['draw_us']:.3f}us")
+
+    for slots, baseline in zip(rows[::2], rows[1::2]):
+        changes = [f"{slots['bytes'] / baseline['bytes'] - 1:+.0%} bytes"]
+        for key in ("update_us", "draw_us"):
+            if slots[key] is not None:
+                changes.append(f"{slots[key] / baseline[key] - 1:+.0%} {key[:-3]}")
+        print(f"{slots['entity']:9} slots vs dict: " + ", ".join(changes))
+    return rows
@@ -0,0 +1,315 @@
+# entity_store.py
+# ---------------------------------
+# Structure-of-arrays storage for platforms and enemies, updated with NumPy
+
+import math
+
+import numpy as np
+
+from src.config import GRID_CELL_SIZE
+from src.spatial_grid import SpatialGrid
+
+# Columns of an EntityStore: one float64 array each
+COLUMNS = (
+    "x", "y",                  # top-left position
+    "w", "h",                  # size
+    "prev_x", "prev_y",        # position before the last simulation step
+    "speed",                   # horizontal speed in pixels per step (0 = static)
+    "direction",               # 1 = right, -1 = left
+    "range_min", "range_max",  # patrol range of x; direction flips outside it
+    "dx",                      # horizontal movement of the last step
+)
+
+
+# Class: EntityStore
+# capacity  - number of rows allocated up front; grows by doubling when full
+# cell_size - cell size of the store's SpatialGrid
+# -------------------------------------------------------------
+# Holds the movable world entities of one kind (platforms or enemies) as
+# parallel NumPy columns, plus an `alive` mask. Entity objects (Platform,
+# BaseEnemy) are thin views that keep their row index, so drawing and
+# the rest of the game keep using p.x / p.y, while the per-step work
+# (patrol movement, scrolling, AABB tests against the player) is done with
+# one vectorized call over all rows instead of a Python loop per entity.
+# Rows of removed entities are put on a free list and reused.
+#
+# Every live row is also kept in a SpatialGrid, so box and nearest-
+# neighbour queries only test the rows near the query. A row is binned by
+# the whole horizontal extent it can reach while patrolling, so patrol
+# movement never re-bins and scrolling only shifts the grid's offset;
+# rows are re-binned by add/remove/place and by the x/y/w/h column
+# properties of the entity views.
+
+class EntityStore:
+    def __init__(self, capacity=32, cell_size=GRID_CELL_SIZE):
+        self.grid = SpatialGrid(cell_size)
+        self.capacity = capacity
+        for name in COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.count = 0     # rows in use so far (high-water mark)
+        self._free = []
+
+
+    # Method: add
+    # x, y, w, h - position and size
+    # speed      - horizontal patrol speed (0 = static)
+    # range_min, range_max - patrol range of x (defaults to x, i.e. none)
+    # -------------------------------------------------------------
+    # Stores a new entity and returns its row index.
+
+    def add(self, x, y, w, h, speed=0, range_min=None, range_max=None):
+        if self._free:
+            index = self._free.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow()
+            index = self.count
+            self.count += 1
+
+        self._write(index, x, y, w, h, speed, range_min, range_max)
+        self.alive[index] = True
+        self.grid.insert(index, *self._grid_box(index))
+        return index
+
+
+    # Method: reset
+    # index - live row to reuse
+    # Other parameters as for add()
+    # -------------------------------------------------------------
+    # Overwrites a live row with a new entity in place (no free/add round
+    # trip), e.g. when a ring buffer recycles a platform.
+
+    def reset(self, index, x, y, w, h, speed=0, range_min=None, range_max=None):
+        self._write(index, x, y, w, h, speed, range_min, range_max)
+        self.grid.move(index, *self._grid_box(index))
+
+
+    def _write(self, index, x, y, w, h, speed, range_min, range_max):
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.w[index] = w
+        self.h[index] = h
+        self.speed[index] = speed
+        self.direction[index] = 1
+        self.range_min[index] = x if range_min is None else range_min
+        self.range_max[index] = x if range_max is None else range_max
+        self.dx[index] = 0
+
+
+    # Property: size
+    # -------------------------------------------------------------
+    # Number of live rows.
+
+    @property
+    def size(self):
+        return self.count - len(self._free)
+
+
+    # Method: remove
+    # index - row returned by add()
+    # -------------------------------------------------------------
+    # Frees the row; it is skipped by every vectorized update until reused.
+
+    def remove(self, index):
+        self.alive[index] = False
+        self._free.append(index)
+        self.grid.remove(index)
+
+
+    # Method: place
+    # index - row to move
+    # x, y  - new position
+    # -------------------------------------------------------------
+    # Teleports an entity (previous position included, so it is not
+    # interpolated across the screen) and re-bins it in the grid.
+
+    def place(self, index, x, y):
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.reindex(index)
+
+
+    # Method: reindex
+    # index - row whose position or size was changed directly
+    # -------------------------------------------------------------
+
+    def reindex(self, index):
+        if not self.alive[index]:
+            return
+        self.grid.move(index, *self._grid_box(index))
+
+
+    # Box the row is binned with: its current box widened to everything
+    # it covers while walking back into and along its patrol range
+    # (including the one-step overshoot before turning around).
+    def _grid_box(self, index):
+        x, y = self.x.item(index), self.y.item(index)
+        speed = abs(self.speed.item(index))
+        left = min(x, self.range_min.item(index)) - speed
+        right = max(x, self.range_max.item(index)) + speed + self.w.item(index)
+        return left, y, right, y + self.h.item(index)
+
+
+    def _grow(self):
+        self.capacity *= 2
+        for name in COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+        self.alive = np.concatenate([self.alive, np.zeros_like(self.alive)])
+
+
+    # Method: save_positions
+    # -------------------------------------------------------------
+    # Copies x/y into prev_x/prev_y (start of a simulation step).
+
+    def save_positions(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+
+    # Method: move
+    # steps - number of simulation steps to advance
+    # -------------------------------------------------------------
+    # Advances every patrolling entity by speed * direction and reverses
+    # the direction of those that left their range (the same rule as the
+    # former Platform.update / Bettle.update, applied to all rows at once),
+    # once per step. dx holds the movement over all steps.
+
+    def move(self, steps=1):
+        n = self.count
+        x, direction = self.x[:n], self.direction[:n]
+        dx = self._patrol(x, direction)
+        for _ in range(steps - 1):
+            dx = dx + self._patrol(x, direction)
+        self.dx[:n] = dx
+
+
+    # Method: patrol_path
+    # steps - number of simulation steps to look ahead
+    # -------------------------------------------------------------
+    # Returns the x of every row after 0..steps moves as a (steps + 1,
+    # count) array, without changing the store.
+
+    def patrol_path(self, steps):
+        n = self.count
+        path = np.empty((steps + 1, n))
+        path[0] = x = self.x[:n].copy()
+        direction = self.direction[:n].copy()
+        for i in range(1, steps + 1):
+            self._patrol(x, direction)
+            path[i] = x
+        return path
+
+
+    # One patrol move of x / direction (views or copies of the columns)
+    def _patrol(self, x, direction):
+        n = self.count
+        dx = self.speed[:n] * direction * self.alive[:n]
+        x += dx
+        direction[x > self.range_max[:n]] = -1
+        direction[x < self.range_min[:n]] = 1
+        return dx
+
+
+    # Method: scroll
+    # amount - vertical distance to move every entity down
+    # -------------------------------------------------------------
+
+    def scroll(self, amount):
+        self.y[:self.count] += amount
+        self.grid.scroll(amount)
+
+
+    # Method: query
+    # left, top, right, bottom - box in screen coordinates (may be infinite)
+    # -------------------------------------------------------------
+    # Returns the sorted rows in the grid cells covered by the box: a
+    # superset of the rows overlapping it, for callers with their own test.
+
+    def query(self, left, top, right, bottom):
+        rows = self.grid.candidates(left, top, right, bottom)
+        return np.array(sorted(rows), dtype=np.intp)
+
+
+    # Method: overlapping
+    # left, top, right, bottom - box to test (screen coordinates)
+    # -------------------------------------------------------------
+    # Returns the row indices of all live entities whose box overlaps the
+    # given box (same rule as pygame.Rect.colliderect).
+
+    def overlapping(self, left, top, right, bottom):
+        rows = self.query(left, top, right, bottom)
+        if not len(rows):
+            return rows
+        x, y = self.x[rows], self.y[rows]
+        hit = (x < right) & (x + self.w[rows] > left) & (y < bottom) & (y + self.h[rows] > top)
+        return rows[hit]
+
+
+    # Method: sweep_candidates
+    # left, top, right, bottom - box to test (screen coordinates)
+    # steps                    - patrol moves ahead to allow for
+    # -------------------------------------------------------------
+    # Returns the rows whose box touches the given box now or may touch
+    # it within `steps` patrol moves: a cheap superset for swept tests.
+
+    def sweep_candidates(self, left, top, right, bottom, steps=0):
+        rows = self.query(left, top, right, bottom)
+        if not len(rows):
+            return rows
+        reach = np.abs(self.speed[rows]) * steps if steps else 0
+        x, y = self.x[rows], self.y[rows]
+        near = (x - reach <= right) & (x + self.w[rows] + reach >= left) & (y <= bottom) & (y + self.h[rows] >= top)
+        return rows[near]
+
+
+    # Method: nearest
+    # x, y         - query point in screen coordinates
+    # max_distance - search radius (None = unlimited)
+    # -------------------------------------------------------------
+    # Returns (row, distance) of the entity whose position (top-left
+    # corner) is closest to the point, or (None, inf) if there is none
+    # within max_distance. Searches the grid ring by ring around the point
+    # and stops as soon as no farther ring can hold a closer entity.
+
+    def nearest(self, x, y, max_distance=None):
+        best, best_distance = None, math.inf
+        size = self.grid.cell_size
+        radius = 0
+        while True:
+            rows = self.grid.ring(x, y, radius)
+            if rows is None:
+                break
+            for row in rows:
+                distance = math.hypot(self.x.item(row) - x, self.y.item(row) - y)
+                if distance < best_distance or (distance == best_distance and row < best):
+                    best, best_distance = row, distance
+            if best_distance <= radius * size:
+                break
+            if max_distance is not None and radius * size >= max_distance:
+                break
+            radius += 1
+
+        if max_distance is not None and best_distance > max_distance:
+            return None, math.inf
+        return best, best_distance
+
+
+# Function: column
+# name - column of the entity's store
+# -------------------------------------------------------------
+# Property that reads and writes one column of the row an entity object
+# views (its `store` and `index` attributes), e.g. `x = column("x")`.
+
+def column(name):
+    def get(self):
+        return getattr(self.store, name).item(self.index)
+
+    def set(self, value):
+        getattr(self.store, name)[self.index] = value
+        if name in ("x", "y", "w", "h"):
+            self.store.reindex(self.index)
+
+    return property(get, set)
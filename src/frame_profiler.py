@@ -0,0 +1,95 @@
+# frame_profiler.py
+# ---------------------------------
+# Per-subsystem frame timing for the game loop
+
+import time
+
+# Subsystems run_game reports, in frame order
+SECTIONS = (
+    "events",      # input and window events
+    "step",        # simulation steps
+    "animate",     # enemy animation frames
+    "background",  # parallax layers and clouds
+    "platforms",   # platform draw commands
+    "enemies",     # enemy draw commands
+    "player",      # player animation and draw command
+    "hud",         # info box, score, level and icons
+    "flush",       # draw list submission (the actual blits)
+    "present",     # display update
+    "stream",      # level generation in idle time
+)
+
+
+# Class: FrameProfiler
+# enabled - when False, every method returns immediately
+# -------------------------------------------------------------
+# Splits each frame into the SECTIONS above. The game loop calls start()
+# at the top of a frame, mark(section) after each subsystem (the time
+# since the previous mark is added to that section) and end_frame() once
+# the frame is done, or discard_frame() if it was cut short (the game
+# ended or the pause menu opened) and should not count. Per frame, every
+# section's time (0 if it did not run) and the frame total are kept in
+# `samples`, in seconds.
+
+class FrameProfiler:
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.samples = {name: [] for name in SECTIONS + ("frame",)}
+        self._frame = dict.fromkeys(SECTIONS, 0.0)
+        self._start = self._last = 0.0
+
+    @property
+    def frames(self):
+        return len(self.samples["frame"])
+
+    def start(self):
+        if self.enabled:
+            self._start = self._last = time.perf_counter()
+
+    def mark(self, section):
+        if self.enabled:
+            now = time.perf_counter()
+            self._frame[section] += now - self._last
+            self._last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        for name, seconds in self._frame.items():
+            self.samples[name].append(seconds)
+            self._frame[name] = 0.0
+        self.samples["frame"].append(self._last - self._start)
+
+    def discard_frame(self):
+        if self.enabled:
+            for name in self._frame:
+                self._frame[name] = 0.0
+
+
+    # Method: percentiles
+    # points - percentiles to report (0-100)
+    # -------------------------------------------------------------
+    # Returns {section: {"p50": ms, ..., "max": ms}} over all recorded
+    # frames, "frame" included.
+
+    def percentiles(self, points=(50, 90, 95, 99)):
+        result = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            stats = {}
+            for point in points:
+                stats[f"p{point}"] = percentile(ordered, point) * 1000 if ordered else 0.0
+            stats["max"] = ordered[-1] * 1000 if ordered else 0.0
+            result[name] = stats
+        return result
+
+
+# Function: percentile
+# ordered - sorted values
+# point   - percentile (0-100)
+# -------------------------------------------------------------
+# Nearest-rank percentile.
+
+def percentile(ordered, point):
+    rank = max(1, -(-len(ordered) * point // 100))
+    return ordered[min(rank, len(ordered)) - 1]
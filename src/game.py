@@ -2,72 +2,108 @@
 # ---------------------------------
 # Main game loop and core logic
 
-import math
+import random
 import pygame
-from random import randint
 from src.settings import load_settings, save_settings
 
 from src.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
-    PLAYER_START_X, PLAYER_START_Y,
-    BACKGROUND_IMAGE, PAUSE_ICON_PATH, INFO_ICON_PATH, VOLUME_ICON_PATH, ICON_SIZE,
+    PARALLAX_LAYERS, PAUSE_ICON_PATH, INFO_ICON_PATH, VOLUME_ICON_PATH, ICON_SIZE,
     PAUSE_BTN_POS, INFO_BTN_POS,
     MUSIC_PATH, JUMP_SOUND_PATH, GAME_OVER_SOUND_PATH,
-    SCROLL_TRIGGER_Y, MAX_PLATFORM_DISTANCE,
     INFO_BOX_RECT, INFO_TEXT_COLOR, INFO_BG_COLOR,
     SCORE_POS, LEVEL_POS, SCORE_TEXT_COLOR,
-    NOTIF_DURATION, NOTIF_BG_COLOR, NOTIF_TEXT_COLOR, NOTIF_POS,
-    ENEMY_RESPAWN_Y, INFO_LINES
+    INFO_LINES, DIRTY_RECT_RENDERING,
+    SIM_HZ, RENDER_FPS, MAX_CATCHUP_STEPS, LEVEL_STREAM_THREAD
 )
-from src.player import Player
-from src.game_platform import generate_platforms, scroll_platforms, recycle_platforms
-from src.start import draw_background
+from src.assets import assets, preload_assets
+from src.simulation import GameState, Inputs, step, EVENT_JUMP, ENEMY_COUNT
+from src.frame_profiler import FrameProfiler
+from src.start import draw_clouds, seed_background
+from src.background import load_parallax
 from src.pause_menu import show_pause_menu
-from src.enemy_logic import spawn_enemies
 from src.score_utils import save_high_score, load_high_score
 from src.game_over_screen import show_game_over
-
-def run_game(scroll_offset=None):
+from src.dirty_rects import DirtyRectTracker
+from src.draw_list import DrawList, Z_BACKGROUND, Z_PLATFORMS, Z_ENEMIES, Z_PLAYER, Z_HUD
+from src.text_cache import get_font, render_text, draw_number
+from src.audio import init_audio, load_sound, play_music, set_music_volume, stop_music
+from src import headless, replay
+
+# dirty_rects - only push changed screen regions to the display; the whole
+#               window is updated only when the camera scrolls
+# controller  - optional callable(player, platforms, enemies) -> (left, right, jump)
+#               that replaces keyboard input (used by headless sessions)
+# max_frames  - end the game after this many frames
+# seed        - seed of the game's random number generator (None = random)
+# record      - file to record the game's inputs to (see src/replay.py);
+#               defaults to the path set with replay.enable_recording
+# enemy_count, platform_count - entity counts of the GameState (stress scenarios)
+# profiler    - FrameProfiler the time of each subsystem is reported to
+# The game logic lives in src/simulation.py; run_game turns events and keys
+# into Inputs, steps the GameState and plays sounds and draws the result.
+# The simulation runs at a fixed SIM_HZ, independent of the render rate
+# (RENDER_FPS): each rendered frame runs as many steps as the elapsed time
+# calls for (at most MAX_CATCHUP_STEPS; a longer stall is dropped rather
+# than replayed), and draws positions interpolated between the last two
+# steps. Headless sessions run exactly one step per frame. The level ahead
+# is generated by the state's LevelStreamer on a worker thread
+# (LEVEL_STREAM_THREAD) or at the end of each frame. In headless mode
+# (see src/headless.py) the game over screen is skipped and a result dict
+# {"score", "frames", "cause"} is returned instead.
+# Every game is played from an explicit seed, so with the recorded inputs
+# it can be replayed step for step.
+def run_game(scroll_offset=None, dirty_rects=DIRTY_RECT_RENDERING, controller=None, max_frames=None, seed=None,
+             record=None, enemy_count=ENEMY_COUNT, platform_count=None, profiler=None):
     if scroll_offset is None:
         scroll_offset = 0
-
-    pygame.init()
-    pygame.mixer.init()
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    if record is None:
+        record = replay.record_path
+    seed_background(seed)
+
+    headless.init_pygame()
+    init_audio(enabled=not headless.headless)
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     clock = pygame.time.Clock()
+    preload_assets()
 
     # Background setup
-    bg_layers = [pygame.image.load(BACKGROUND_IMAGE).convert_alpha()]
-    scroll_offsets = [0 for _ in bg_layers]
-    scroll_speeds = [0.2, 0.4, 0.6, 0.8, 1.2]
+    background = load_parallax(PARALLAX_LAYERS, screen.get_size())
+    bg_layers = background.surfaces
+    scroll_offsets = background.offsets
+    scroll_speeds = background.speeds
 
     # Load audio
-    pygame.mixer.music.load(MUSIC_PATH)
-    jump_sound = pygame.mixer.Sound(JUMP_SOUND_PATH)
-    game_over_sound = pygame.mixer.Sound(GAME_OVER_SOUND_PATH)
+    jump_sound = load_sound(JUMP_SOUND_PATH)
+    game_over_sound = load_sound(GAME_OVER_SOUND_PATH)
 
     # Load saved volume
     settings = load_settings()
     volume = settings.get("volume", 0.5)
 
-    pygame.mixer.music.set_volume(volume)
     jump_sound.set_volume(volume)
     game_over_sound.set_volume(volume)
-    pygame.mixer.music.play(-1)
+    play_music(MUSIC_PATH, volume)
 
     # Fonts
-    font = pygame.font.SysFont("Arial", 24)
-    pause_font = pygame.font.SysFont("Arial", 48)
+    font = get_font("Arial", 24)
+    pause_font = get_font("Arial", 48)
 
     # Game objects
-    player = Player(PLAYER_START_X, PLAYER_START_Y)
-    platforms = generate_platforms(SCREEN_WIDTH, SCREEN_HEIGHT)
-    enemies = spawn_enemies(2.5, SCREEN_WIDTH, SCREEN_HEIGHT, screen, platforms)
+    state = GameState(seed, scroll_offset, SCREEN_WIDTH, SCREEN_HEIGHT, enemy_count, platform_count)
+    player, platforms, enemies = state.player, state.platforms, state.enemies
+    streamer = state.streamer
+    threaded_streaming = LEVEL_STREAM_THREAD and not headless.headless
+    if threaded_streaming:
+        streamer.start()
+    recorder = replay.InputRecorder(seed) if record else None
 
     # UI icons
-    pause_icon = pygame.transform.scale(pygame.image.load(PAUSE_ICON_PATH).convert_alpha(), ICON_SIZE)
-    info_icon = pygame.transform.scale(pygame.image.load(INFO_ICON_PATH).convert_alpha(), ICON_SIZE)
-    volume_icon = pygame.transform.scale(pygame.image.load(VOLUME_ICON_PATH).convert_alpha(), ICON_SIZE)
+    pause_icon = assets.image(PAUSE_ICON_PATH, ICON_SIZE)
+    info_icon = assets.image(INFO_ICON_PATH, ICON_SIZE)
+    volume_icon = assets.image(VOLUME_ICON_PATH, ICON_SIZE)
 
     pause_rect = pause_icon.get_rect(topleft=PAUSE_BTN_POS)
     info_rect = info_icon.get_rect(topleft=INFO_BTN_POS)
@@ -80,9 +116,45 @@ def run_game(scroll_offset=None):
     show_info = False
     slider_visible = False
     running = True
+    dirty = DirtyRectTracker(screen.get_size(), enabled=dirty_rects)
+    draw_list = DrawList(screen.get_rect())
+    render = headless.render
+    sim_dt = 1 / SIM_HZ
+    accumulator = 0.0
+    jump_pending = False  # jump key pressed, not consumed by a step yet
+    last_camera = None
+    if profiler is None:
+        profiler = FrameProfiler(enabled=False)
+
+    # Ends the run: plays the game over sound and shows the game over screen,
+    # or returns the session result in headless mode.
+    def end_game(cause):
+        finish(cause)
+        stop_music()
+        game_over_sound.play()
+        if headless.headless:
+            return {"score": state.score, "frames": state.frame, "cause": cause}
+        return show_game_over(
+            screen, font, state.scroll_offset,
+            bg_layers, scroll_offsets, scroll_speeds,
+            save_high_score, load_high_score,
+            run_game, player
+        )
+
+    # Stops level streaming and writes the recording of the game
+    def finish(cause):
+        streamer.stop()
+        result = {"score": state.score, "frames": state.frame, "cause": cause}
+        if recorder is not None:
+            recorder.save(record, result)
+        return result
 
     while running:
-        dt = clock.tick(60) / 1000
+        # Headless sessions run as fast as possible, one step per frame
+        dt = clock.tick(0 if headless.headless else RENDER_FPS) / 1000
+        if headless.headless:
+            dt = sim_dt
+        profiler.start()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -94,13 +166,15 @@ def run_game(scroll_offset=None):
                         paused = True
                     elif info_rect.collidepoint(event.pos):
                         show_info = not show_info
+                        dirty.invalidate()
                     elif volume_rect.collidepoint(event.pos):
                         slider_visible = not slider_visible
+                        dirty.invalidate()
                     elif slider_visible and volume_slider_rect.collidepoint(event.pos):
                         mouse_y = event.pos[1]
                         relative_y = mouse_y - volume_slider_rect.top
                         volume = max(0.0, min(1.0, 1 - (relative_y / volume_slider_rect.height)))
-                        pygame.mixer.music.set_volume(volume)
+                        set_music_volume(volume)
                         jump_sound.set_volume(volume)
                         game_over_sound.set_volume(volume)
                         settings["volume"] = volume
@@ -111,88 +185,113 @@ def run_game(scroll_offset=None):
                         mouse_y = event.pos[1]
                         relative_y = mouse_y - volume_slider_rect.top
                         volume = max(0.0, min(1.0, 1 - (relative_y / volume_slider_rect.height)))
-                        pygame.mixer.music.set_volume(volume)
+                        set_music_volume(volume)
                         jump_sound.set_volume(volume)
                         game_over_sound.set_volume(volume)
                         settings["volume"] = volume
                         save_settings(settings)
 
                 elif event.type == pygame.KEYDOWN:
-                    if event.key in (pygame.K_SPACE, pygame.K_UP) and not player.is_jumping:
-                        player.jump()
-                        jump_sound.play()
+                    if event.key in (pygame.K_SPACE, pygame.K_UP):
+                        jump_pending = True
+
+        profiler.mark("events")
 
         if paused:
             paused = show_pause_menu(screen, SCREEN_WIDTH, SCREEN_HEIGHT, pause_font)
+            profiler.discard_frame()
+            dirty.invalidate()
+            clock.tick()  # the time spent in the menu is not simulated
             continue
 
-        # Update player and world
-        keys = pygame.key.get_pressed()
-        player.move(keys, SCREEN_WIDTH)
-        player.apply_gravity()
-        player.update(dt)
+        # Update player and world in fixed steps
+        accumulator += dt
+        steps = 0
+        while accumulator >= sim_dt:
+            if max_frames is not None and state.frame >= max_frames:
+                profiler.discard_frame()
+                return finish("timeout")
+            if steps == MAX_CATCHUP_STEPS:
+                accumulator = 0.0
+                break
+
+            if controller is not None:
+                inputs = Inputs(*controller(player, platforms, enemies))
+            else:
+                keys = pygame.key.get_pressed()
+                inputs = Inputs(bool(keys[pygame.K_LEFT]), bool(keys[pygame.K_RIGHT]), jump_pending)
+            jump_pending = False  # a key press applies to one step only
+            if recorder is not None:
+                recorder.record(inputs)
+
+            events = step(state, inputs)
+            accumulator -= sim_dt
+            steps += 1
+            if EVENT_JUMP in events:
+                jump_sound.play()
+            profiler.mark("step")
+            if state.game_over is not None:
+                profiler.discard_frame()
+                return end_game(state.game_over)
+            if render:
+                for enemy in enemies:
+                    enemy.animate()
+                profiler.mark("animate")
+
+        if not render:
+            if not threaded_streaming:
+                streamer.pump()
+            profiler.mark("stream")
+            profiler.end_frame()
+            continue
 
-        for p in platforms:
-            p.update()
-
-        score = int(scroll_offset)
-        difficulty_level = score // MAX_PLATFORM_DISTANCE
-
-        if player.y < SCROLL_TRIGGER_Y:
-            scroll = SCROLL_TRIGGER_Y - player.y
-            scroll_offset += scroll
-            player.y = SCROLL_TRIGGER_Y
-            scroll_platforms(platforms, scroll)
-            recycle_platforms(platforms, SCREEN_WIDTH, SCREEN_HEIGHT)
-
-            for enemy in enemies:
-                enemy.rect.y += scroll
-                if enemy.rect.y > SCREEN_HEIGHT:
-                    enemy.rect.y = -50
-                    enemy.rect.x = randint(50, SCREEN_WIDTH - 100)
-
-        player_rect = player.get_rect()
-        for p in platforms:
-            plat_rect = pygame.Rect(p.x, p.y, p.width, p.height)
-            if player.vel_y > 0 and player_rect.colliderect(plat_rect):
-                if player_rect.bottom <= plat_rect.bottom + 10:
-                    player.y = p.y - player.height
-                    player.vel_y = 0
-                    player.is_jumping = False
+        alpha = accumulator / sim_dt
+        camera = state.camera_offset(alpha)
+        scrolled = camera != last_camera
+        if scrolled:
+            dirty.invalidate()
+        last_camera = camera
 
-        for enemy in enemies:
-            if player.get_rect().colliderect(enemy.rect):
-                game_over_sound.play()
-                pygame.mixer.music.stop()
-                return show_game_over(
-                    screen, font, scroll_offset,
-                    bg_layers, scroll_offsets, scroll_speeds,
-                    save_high_score, load_high_score,
-                    run_game, player
-                )
-
-        # Draw everything
-        draw_background(screen)
+        player.update(dt)
+        profiler.mark("player")
+        score = state.score
+        difficulty_level = state.difficulty_level
+
+        # Draw everything: sprites are recorded into the draw list and
+        # submitted in one batch; only the slider primitives draw directly
+        draw_list.z = Z_BACKGROUND
+        background.draw(draw_list, camera)
+        draw_clouds(draw_list, drift=scrolled or not dirty_rects, dirty=dirty)
+        profiler.mark("background")
+
+        draw_list.z = Z_PLATFORMS
         for platform in platforms:
-            platform.draw(screen)
+            dirty.track(id(platform), platform.draw(draw_list, alpha), changed=False)
+        profiler.mark("platforms")
 
+        draw_list.z = Z_ENEMIES
         for enemy in enemies:
-            enemy.update()
-            screen.blit(enemy.image, enemy.rect)
+            dirty.track(id(enemy), enemy.draw(draw_list, alpha))
+        profiler.mark("enemies")
 
-        player.draw(screen)
+        draw_list.z = Z_PLAYER
+        dirty.track(id(player), player.draw(draw_list, alpha))
+        profiler.mark("player")
 
+        draw_list.z = Z_HUD
         if show_info:
-            pygame.draw.rect(screen, INFO_BG_COLOR, INFO_BOX_RECT)
+            draw_list.blit(assets.solid(INFO_BG_COLOR, INFO_BOX_RECT[2:]), INFO_BOX_RECT[:2])
             for i, line in enumerate(INFO_LINES):
-                screen.blit(font.render(line, True, INFO_TEXT_COLOR), (70, 220 + i * 30))
+                draw_list.blit(render_text(font, line, INFO_TEXT_COLOR), (70, 220 + i * 30))
 
-        screen.blit(font.render(f"Score: {score}", True, SCORE_TEXT_COLOR), SCORE_POS)
-        screen.blit(font.render(f"Lvl: {difficulty_level + 1}", True, SCORE_TEXT_COLOR), LEVEL_POS)
+        dirty.track("score", draw_number(draw_list, font, "Score: ", score, SCORE_TEXT_COLOR, SCORE_POS))
+        dirty.track("level", draw_number(draw_list, font, "Lvl: ", difficulty_level + 1, SCORE_TEXT_COLOR, LEVEL_POS))
 
-        screen.blit(pause_icon, pause_rect)
-        screen.blit(info_icon, info_rect)
-        screen.blit(volume_icon, volume_rect)
+        draw_list.blit(pause_icon, pause_rect)
+        draw_list.blit(info_icon, info_rect)
+        draw_list.blit(volume_icon, volume_rect)
+        profiler.mark("hud")
+        draw_list.flush(screen)
 
         if slider_visible:
             slider_width = 6
@@ -204,18 +303,17 @@ def run_game(scroll_offset=None):
                               slider_width, volume_slider_rect.height), border_radius=3)
 
             knob_y = volume_slider_rect.top + (1 - volume) * volume_slider_rect.height
-            pygame.draw.circle(screen, (80, 80, 255), (center_x, int(knob_y)), knob_radius)
+            dirty.track("knob", pygame.draw.circle(screen, (80, 80, 255), (center_x, int(knob_y)), knob_radius))
 
-        if player.y > SCREEN_HEIGHT:
-            pygame.mixer.music.stop()
-            game_over_sound.play()
-            return show_game_over(
-                screen, font, scroll_offset,
-                bg_layers, scroll_offsets, scroll_speeds,
-                save_high_score, load_high_score,
-                run_game, player
-            )
+        profiler.mark("flush")
+        dirty.present()
+        profiler.mark("present")
 
-        pygame.display.update()
+        # Idle time: prepare the level ahead (no-op with the worker thread)
+        if not threaded_streaming:
+            streamer.pump()
+        profiler.mark("stream")
+        profiler.end_frame()
 
+    finish("quit")
     return None
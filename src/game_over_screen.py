@@ -2,6 +2,11 @@
 # ---------------------------------
 # Game Over screen display logic
 
+import pygame
+
+from src.text_cache import get_font, render_text
+from src.ui_overlay import LayerCache
+
 # Method: show_game_over
 # screen - Pygame screen surface to draw the game over screen on
 # font - default font object for drawing text
@@ -19,7 +24,6 @@
 # Offers the option to retry (SPACE) or quit (ESC).
 # High score is updated and saved if the player beats it.
 def show_game_over(screen, font, score, bg_layers, scroll_offsets, scroll_speeds, save_high_score_func, load_high_score_func, run_game_func, player):
-    import pygame
     clock = pygame.time.Clock()
     running = True
 
@@ -30,13 +34,44 @@ def show_game_over(screen, font, score, bg_layers, scroll_offsets, scroll_speeds
         high_score = score
 
     # Fonts for title, score, and hints
-    title_font = pygame.font.SysFont("Comic Sans MS", 64, bold=True)
-    score_font = pygame.font.SysFont("Comic Sans MS", 32)
-    hint_font = pygame.font.SysFont("Comic Sans MS", 24)
+    title_font = get_font("Comic Sans MS", 64, bold=True)
+    score_font = get_font("Comic Sans MS", 32)
+    hint_font = get_font("Comic Sans MS", 24)
 
     blink = True # Controls blinking of "GAME OVER"
     blink_timer = 0 # Timer to toggle blinking
 
+    # Everything on this screen is static apart from the blinking title, so
+    # each (blink, score, high score) state is composited once onto a
+    # snapshot of the last game frame and every loop iteration is one blit.
+    background = screen.copy()
+
+    def build_frame(key):
+        blink, score, high_score = key
+        frame = background.copy()
+        width = frame.get_width()
+
+        # Draw blinking "GAME OVER" title with shadow
+        title = render_text(title_font, "GAME OVER", (255, 0, 0))
+        shadow = render_text(title_font, "GAME OVER", (0, 0, 0))
+        title_x = width // 2 - title.get_width() // 2
+        frame.blit(shadow, (title_x + 2, 102))
+        if blink:
+            frame.blit(title, (title_x, 100))
+
+        # Draw current and high scores
+        score_text = render_text(score_font, f"Score: {score}", (0, 0, 0))
+        high_score_text = render_text(score_font, f"High Score: {high_score}", (20, 40, 200))
+        frame.blit(score_text, (width // 2 - score_text.get_width() // 2, 200))
+        frame.blit(high_score_text, (width // 2 - high_score_text.get_width() // 2, 240))
+
+        # Show hint to the user
+        hint = render_text(hint_font, "Press SPACE to Retry or ESC to Quit", (80, 80, 80))
+        frame.blit(hint, (width // 2 - hint.get_width() // 2, 300))
+        return frame
+
+    frames = LayerCache(build_frame, max_variants=2)
+
     while running:
         # Animated background
         # screen_height = screen.get_height()
@@ -46,27 +81,7 @@ def show_game_over(screen, font, score, bg_layers, scroll_offsets, scroll_speeds
         #     screen.blit(layer, (0, y))
         #     screen.blit(layer, (0, y + screen_height))
 
-        # Light blue transparent overlay
-        blue_overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        screen.blit(blue_overlay, (0, 0))
-
-        # Draw blinking "GAME OVER" title with shadow
-        title = title_font.render("GAME OVER", True, (255, 0, 0))
-        shadow = title_font.render("GAME OVER", True, (0, 0, 0))
-        title_x = screen.get_width() // 2 - title.get_width() // 2
-        screen.blit(shadow, (title_x + 2, 102))
-        if blink:
-            screen.blit(title, (title_x, 100))
-
-        # Draw current and high scores
-        score_text = score_font.render(f"Score: {score}", True, (0, 0, 0))
-        high_score_text = score_font.render(f"High Score: {high_score}", True, (20, 40, 200))
-        screen.blit(score_text, (screen.get_width() // 2 - score_text.get_width() // 2, 200))
-        screen.blit(high_score_text, (screen.get_width() // 2 - high_score_text.get_width() // 2, 240))
-
-        # Show hint to the user
-        hint = hint_font.render("Press SPACE to Retry or ESC to Quit", True, (80, 80, 80))
-        screen.blit(hint, (screen.get_width() // 2 - hint.get_width() // 2, 300))
+        screen.blit(frames.get((blink, score, high_score)), (0, 0))
 
         # Update blink timer
         blink_timer += clock.get_time()
@@ -1,27 +1,91 @@
-import pygame
 import random
+from collections import namedtuple
+
+from src.assets import assets
+from src.entity_store import EntityStore, column
+from src.config import (
+    PLATFORM_IMAGE, MOVING_PLATFORM_IMAGE, GROUND_IMAGE, PLATFORM_WIDTH, PLATFORM_HEIGHT,
+    PLATFORM_MIN_GAP, PLATFORM_MAX_GAP, PLATFORM_MAX_SHIFT
+)
+from src.reachability import MAX_RISE, max_shift
+
+# Look of a platform (cold data): the image path and the ground flag.
+# There are only a few distinct styles, so platforms share the records
+# returned by platform_style() instead of carrying their own copies.
+PlatformStyle = namedtuple("PlatformStyle", ["image", "is_ground"])
+_styles = {}
+
+
+def platform_style(image, is_ground=False):
+    style = _styles.get((image, is_ground))
+    if style is None:
+        style = _styles[(image, is_ground)] = PlatformStyle(image, is_ground)
+    return style
 
-platform_img = pygame.image.load("assets/images/platform.png")
-moving_platform_img = pygame.image.load("assets/images/moving_platform_cloud_lighter.png")
 
 #Class for Platforms
+# Position, size and movement (hot data) live in a row of an EntityStore
+# (store), so all platforms of a game can be moved, scrolled and
+# collision-tested with vectorized calls; the attributes below read and
+# write that row. The move configuration is derived from the same row and
+# the look is a shared PlatformStyle, so a platform object itself is just
+# three slots: no per-instance __dict__.
 class Platform:
-    def __init__(self, x, y, width=100, height=25, moving=False, move_range=100, move_speed=2, image=None, is_ground=False):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.moving = moving
-        self.move_range = move_range
-        self.move_speed = move_speed
-        self.start_x = x
-        self.direction = 1 #1 = right, -1 = left
-        self.movement_delta = 0
-        self.image = image
-        self.is_ground = is_ground
-
-        if image:
-            self.image = pygame.transform.scale(image, (self.width, self.height))
+    __slots__ = ("store", "index", "style")
+
+    x = column("x")
+    y = column("y")
+    prev_x = column("prev_x")  # position before the last simulation step (render interpolation)
+    prev_y = column("prev_y")
+    width = column("w")
+    height = column("h")
+    move_speed = column("speed")
+    direction = column("direction")  #1 = right, -1 = left
+    start_x = column("range_min")
+    movement_delta = column("dx")
+
+    def __init__(self, x, y, width=100, height=25, moving=False, move_range=100, move_speed=2, image=None, is_ground=False, store=None):
+        self.store = store if store is not None else EntityStore()
+        self.index = self.store.add(x, y, width, height,
+                                    speed=move_speed if moving else 0,
+                                    range_min=x, range_max=x + move_range)
+        self.style = platform_style(image, is_ground)
+
+    @property
+    def moving(self):
+        return self.store.speed.item(self.index) != 0
+
+    @property
+    def move_range(self):
+        return self.store.range_max.item(self.index) - self.store.range_min.item(self.index)
+
+    @property
+    def image(self):
+        return self.style.image  # path of the platform image, resolved through the asset registry
+
+    @property
+    def is_ground(self):
+        return self.style.is_ground
+
+
+    # Method: reset
+    # Same parameters as the constructor
+    # ---------------------------------------
+    # Turns this platform into a new one in place, reusing its store row.
+
+    def reset(self, x, y, width, height, moving=False, move_range=0, move_speed=0, image=None, is_ground=False):
+        self.style = platform_style(image, is_ground)
+        self.store.reset(self.index, x, y, width, height,
+                         speed=move_speed if moving else 0,
+                         range_min=x, range_max=x + move_range)
+
+
+    # Method: remove
+    # ---------------------------------------
+    # Frees the platform's row in its store; call when dropping the platform.
+
+    def remove(self):
+        self.store.remove(self.index)
 
 
     # Method: update
@@ -31,196 +95,164 @@ class Platform:
     # It updates the x-position based on speed and direction,
     # reverses direction when reaching movement bounds,
     # and stores the amount of movement in `movement_delta`.
+    # The simulation moves all platforms at once with EntityStore.move();
+    # this is the per-platform equivalent. It works on the store row
+    # directly: the grid bins the whole patrol range, so no re-binning.
 
     def update(self):
-        if self.moving:
-            old_x = self.x
-            self.x += self.move_speed * self.direction
-            self.movement_delta = self.x - old_x
-            if self.x > self.start_x + self.move_range:
-                self.direction = -1
-            elif self.x < self.start_x:
-                self.direction = 1
+        store, i = self.store, self.index
+        speed = store.speed.item(i)
+        if speed:
+            delta = speed * store.direction.item(i)
+            x = store.x.item(i) + delta
+            store.x[i] = x
+            store.dx[i] = delta
+            if x > store.range_max.item(i):
+                store.direction[i] = -1
+            elif x < store.range_min.item(i):
+                store.direction[i] = 1
         else:
-            self.movement_delta = 0
+            store.dx[i] = 0
 
 
     # Method: draw
     # screen - instance of screen
+    # alpha  - interpolation factor between the previous (0) and the
+    #          current (1) simulation position
     # -------------------------------------------------------------
     # Draws the platform on the screen.
-    # If a custom image is set, it will be drawn at the platform's position.
-    # Otherwise, a green rectangle is used as a fallback.
+    # If a custom image is set, its pre-scaled atlas region is fetched from the
+    # asset registry and drawn at the platform's position with an area blit.
+    # Otherwise, a green rectangle (a shared solid surface) is used as a fallback.
     # Additionally, if the platform is marked as ground and is near the bottom of the screen,
     # it will draw a separate ground image across the full width.
-
-    def draw(self, screen):
-        if self.image:
-            screen.blit(self.image, (self.x, self.y))
+    # Returns the screen area that was drawn to.
+    # The store row is read once, not through the column properties.
+
+    def draw(self, screen, alpha=1.0):
+        store, i, style = self.store, self.index, self.style
+        prev_x, prev_y = store.prev_x.item(i), store.prev_y.item(i)
+        x = prev_x + (store.x.item(i) - prev_x) * alpha
+        y = prev_y + (store.y.item(i) - prev_y) * alpha
+        size = (store.w.item(i), store.h.item(i))
+        if style.image:
+            region = assets.region(style.image, size)
+            drawn = screen.blit(region.sheet, (x, y), region.area)
         else:
-            pygame.draw.rect(screen, (0, 255, 0), (self.x, self.y, self.width, self.height))
+            drawn = screen.blit(assets.solid((0, 255, 0), size), (x, y))
+
+        if style.is_ground and y >= screen.get_height() - 30:
+            ground_height = assets.image(GROUND_IMAGE).get_height()
+            ground = assets.region(GROUND_IMAGE, (screen.get_width(), ground_height))
+            drawn = drawn.union(screen.blit(ground.sheet, (0, screen.get_height() - ground_height), ground.area))
+        return drawn
 
-        if self.y >= screen.get_height() - 30 and self.is_ground:
-            ground_img = pygame.image.load("assets/images/ground_new.png").convert_alpha()
-            ground_img = pygame.transform.scale(ground_img, (screen.get_width(), ground_img.get_height()))
-            screen.blit(ground_img, (0, 750 - 80))
 
+# Platform description in world coordinates (screen y = world y + camera offset)
+PlatformSpec = namedtuple("PlatformSpec", ["x", "y", "width", "moving", "move_range", "move_speed"])
 
-# Function: generate_platforms
+
+# Function: next_platform_spec
+# previous     - PlatformSpec of the platform directly below
+# screen_width - width of the screen in pixels
+# rng          - random number source (the random module or a random.Random)
+# -------------------------------------------------------------
+# Constructive placement: returns the platform one jump above `previous`.
+# - the vertical gap is drawn from [PLATFORM_MIN_GAP, PLATFORM_MAX_GAP],
+#   capped at the jump height (reachability.MAX_RISE)
+# - the horizontal position is drawn from the part of the screen within
+#   PLATFORM_MAX_SHIFT of the previous platform's start position, capped
+#   at the reach of a jump at that gap (reachability.max_shift, one table
+#   lookup); that interval always contains the previous platform's own
+#   x, so it is never empty
+# - one in five platforms moves, within the free space to its right
+# Every platform is reachable from the one below by construction, so
+# there are no retries and no overlap checks: a fixed number of random
+# draws per platform.
+
+def next_platform_spec(previous, screen_width, rng=random):
+    width = PLATFORM_WIDTH
+    gap = rng.randint(PLATFORM_MIN_GAP, min(PLATFORM_MAX_GAP, MAX_RISE))
+    y = previous.y - gap
+
+    previous_x = previous.x + (previous.width - width) / 2
+    shift = min(PLATFORM_MAX_SHIFT, max_shift(gap, width))
+    low = max(0, int(previous_x) - shift)
+    high = min(screen_width - width, int(previous_x) + shift)
+    x = rng.randint(low, high)
+
+    moving = rng.random() > 0.8
+    if moving:
+        move_range = int((screen_width - width - x) * rng.uniform(0.5, 1.0))
+        move_speed = rng.randint(2, 4)
+    else:
+        move_range = 0
+        move_speed = 0
+    return PlatformSpec(x, y, width, moving, move_range, move_speed)
+
+
+# Class: PlatformRing
 # screen_width  - width of the game screen in pixels
 # screen_height - height of the game screen in pixels
-# num           - number of regular platforms to generate (default = 8)
+# streamer      - LevelStreamer the platforms are taken from
+# camera_offset - camera offset at the start of the game
+# store         - EntityStore for the platforms (None = a new one)
+# capacity      - number of platforms (None = enough to always reach above the screen)
 # -------------------------------------------------------------
-# Generates the initial list of platforms including:
-# - One ground platform at the bottom of the screen
-# - A series of regular platforms evenly spaced vertically above
-# Returns a list of Platform objects initialized with random x-positions.
-
-def generate_platforms(screen_width, screen_height, num=8):
-    platforms = []
-
-    ground = Platform(x=0, y=screen_height - 20, width=screen_width, height=25, moving=False, is_ground=True)
-    platforms.append(ground)
-
-    platform_width = 100
-    for i in range(num):
-        x = random.randint(10, screen_width - platform_width)
-        y = screen_height - i * 90
-
-        platforms.append(Platform(x, y, platform_width, 25, image=platform_img))
-    return platforms
-
-
-# Function: scroll_platforms
-# platforms     - list of Platform objects currently in the game
-# scroll_amount - vertical amount (in pixels) to scroll all platforms downward
-# ---------------------------------------------------------------------------
-# Shifts all platforms on the screen downward by a given scroll amount.
-# This creates the illusion of upward player movement by moving the platforms.
-
-def scroll_platforms(platforms, scroll_amount):
-    for p in platforms:
-        p.y += scroll_amount
-
-
-# Function: recycle_platforms
-# platforms       - list of current Platform objects in the game
-# screen_width    - width of the screen in pixels
-# screen_height   - height of the screen in pixels
-# -------------------------------------------------------------------------------
-# Recycles platforms that move out of view at the bottom of the screen.
-# It removes those platforms and generates new ones at the top with random position,
-# vertical spacing, movement properties, and appropriate platform image.
-
-def recycle_platforms(platforms, screen_width, screen_height):
-    platform_width = 100
-    platform_height = 25
-    max_attempts = 10
-    min_vertical_distance = 50
-    max_vertical_distance = 80
-    max_horizontal_distance = 120
-
-    for p in platforms[:]:
-        if p.y > screen_height:
-            platforms.remove(p)
-
-            for i in range(max_attempts):
-                new_x = random.randint(0, screen_width - platform_width - 80)
-                new_y = random.randint(-100, -10)
-                if (not is_too_close_vertically(new_y, platforms, min_vertical_distance) and
-                    not is_overlapping(new_x, new_y, platform_width, platform_height, platforms) and
-                    is_within_max_horizontal_distance(new_x, platforms, max_horizontal_distance) and
-                    is_within_max_vertical_distance(new_y, platforms, max_vertical_distance)
-                ):
-                    moving = random.random() > 0.8
-                    if moving:
-                        max_range_left = new_x
-                        max_range_right = screen_width - (new_x + platform_width)
-
-                        if max_range_left < 50 or max_range_right < 50:
-                            move_range = random.randint(150, 300)
-                        else:
-                            move_range = int(min(max_range_left, max_range_right) * random.uniform(0.8, 1.0))
-                    else:
-                        move_range = 0
-
-                    move_speed = random.randint(2, 4) if moving else 0
-
-                    image = moving_platform_img if moving else platform_img
-                    platforms.append(Platform(new_x, new_y, platform_width, platform_height, True, move_range, move_speed, image=image))
-                    break
-
-
-# Function: is_overlapping
-# new_x          - x position of the new platform
-# new_y          - y position of the new platform
-# width          - width of the new platform
-# height         - height of the new platform
-# platforms      - list of existing Platform object
-# --------------------------------------------------------------
-# Check whether the proposed new platform would overlap with any
-# existing platforms based on their rectangular bounds.
-# Returns true if overlap is detected, otherwise False.
-
-def is_overlapping(new_x, new_y, width, height, platforms):
-    for p in platforms:
-        if (new_x < p.x + p.width and
-            new_x + width > p.x and
-            new_y < p.y + p.height and
-            new_y + height > p.y):
-            return True
-    return False
-
-
-# Function: is_too_close_vertically
-# new_y          - y position of the new platform
-# platforms      - list of existing Platform objects
-# min_distance   - minimum allowed vertical distance between platforms
-#-------------------------------------------------------------------------------
-# Checks if the new platforms y-position is too close vertically to
-# any existing platform. This helps in ensuring enough space for the
-# player to jump or move between platforms.
-# Returns True if too close, otherwise False.
-
-def is_too_close_vertically(new_y, platforms, min_distance):
-    for p in platforms:
-        if abs(new_y - p.y) < min_distance:
-            return True
-    return False
-
-
-# Function: is_within_max_vertical_distance
-# new_y        - y position of the new platform
-# platforms    - list of existing Platform objects
-# max_distance - maximum allowed vertical distance between platforms
-#---------------------------------------------------------------------------------------
-# Check if the new platforms y-position is farther than may_distance
-# from any existing platform vertically. This can help control platform
-# spacing to avoid placing platforms to far apart.
-# Returns True if the distance to any platform exceeds max_distance,
-# otherwise returns False.
-
-def is_within_max_vertical_distance(new_y, platforms, max_distance):
-    for p in platforms:
-        if abs(new_y - p.y) > max_distance:
-            return True
-    return False
-
-
-# Function: is_within_max_horizontal_distance
-# new_x         - x position of the new platform
-# platforms     - list of existing Platform objects
-# max_distance  - maximum allowed horizontal distance between platforms
-# ---------------------------------------------------------------------
-# Checks if the horizontal center of the new platform is within max_distance
-# of the horizontal center of any existing platform.
-# Returns True if there is at least one platform close enough horizontally,
-# otherwise returns False.
-
-def is_within_max_horizontal_distance(new_x, platforms, max_distance):
-    for p in platforms:
-        p_center_x = p.x +  p.width / 2
-        new_center_x = new_x + 100 / 2
-        if abs(new_center_x - p_center_x) < max_distance:
-            return True
-    return False
+# Fixed-size ring buffer of platforms, ordered from the lowest (head) to
+# the highest. Starts with the streamer's ground platform and the next
+# platforms of the level. When the lowest platform scrolls off the
+# bottom it is reset in place to the next platform of the level (above
+# the highest one) and the head advances: no list copies, removals or
+# new objects while playing, and no generation either, since the
+# streamer has the level prepared ahead of the camera.
+# `platforms` is a plain list (in ring order) for drawing and iteration.
+
+class PlatformRing:
+    def __init__(self, screen_width, screen_height, streamer, camera_offset=0, store=None, capacity=None):
+        if capacity is None:
+            capacity = screen_height // PLATFORM_MIN_GAP + 2
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.streamer = streamer
+        self.store = store if store is not None else EntityStore(capacity)
+        self.head = 0
+
+        ground = streamer.ground
+        self.platforms = [Platform(ground.x, ground.y + camera_offset, ground.width, PLATFORM_HEIGHT,
+                                   moving=False, is_ground=True, store=self.store)]
+        for _ in range(capacity - 1):
+            platform = Platform(0, 0, PLATFORM_WIDTH, PLATFORM_HEIGHT, store=self.store)
+            self._place(platform, camera_offset)
+            self.platforms.append(platform)
+
+    @property
+    def lowest(self):
+        return self.platforms[self.head]
+
+    @property
+    def highest(self):
+        return self.platforms[self.head - 1]
+
+
+    # Method: recycle
+    # camera_offset - current camera offset
+    # -------------------------------------------------------------
+    # Moves every platform that fell below the screen to the top of the
+    # column. Only the lowest platform has to be checked, since platforms
+    # never overtake each other vertically. Returns the number recycled.
+
+    def recycle(self, camera_offset):
+        recycled = 0
+        while self.lowest.y > self.screen_height:
+            self._place(self.lowest, camera_offset)
+            self.head = (self.head + 1) % len(self.platforms)
+            recycled += 1
+        return recycled
+
+
+    def _place(self, platform, camera_offset):
+        spec = self.streamer.next_platform()
+        image = MOVING_PLATFORM_IMAGE if spec.moving else PLATFORM_IMAGE
+        platform.reset(spec.x, spec.y + camera_offset, spec.width, PLATFORM_HEIGHT,
+                       spec.moving, spec.move_range, spec.move_speed, image=image)
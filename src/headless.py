@@ -0,0 +1,131 @@
+# headless.py
+# ---------------------------------
+# Headless mode: run the game without a window, audio device or mouse
+
+import os
+import time
+
+# Mode flags, read by run_game
+headless = False
+render = True
+
+
+# Method: enable_headless
+# render_frames - draw every frame to the offscreen surface (True)
+#                 or skip drawing completely (False)
+# -------------------------------------------------------------
+# Selects SDL's dummy video and audio drivers. Must be called before
+# pygame.init(); the display then is an offscreen surface, the mixer is
+# never loaded and run_game never waits for the frame clock.
+
+def enable_headless(render_frames=True):
+    global headless, render
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    headless = True
+    render = render_frames
+
+
+# Method: init_pygame
+# -------------------------------------------------------------
+# pygame.init() replacement: in headless mode only the display (dummy
+# driver) and font modules are initialised, so no audio device is opened.
+
+def init_pygame():
+    import pygame
+    if headless:
+        pygame.display.init()
+        pygame.font.init()
+    else:
+        pygame.init()
+
+
+# Class: AutoJumpController
+# -------------------------------------------------------------
+# Scripted input for unattended sessions: jumps whenever the player can
+# and steers towards the nearest platform above the player.
+# Called once per frame; returns (left, right, jump).
+
+class AutoJumpController:
+    def __call__(self, player, platforms, enemies):
+        center_x = player.x + player.width / 2
+        target = None
+        for p in platforms:
+            if p.y < player.y and (target is None or p.y > target.y):
+                target = p
+
+        left = right = False
+        if target is not None:
+            target_x = target.x + target.width / 2
+            left = target_x < center_x - player.speed
+            right = target_x > center_x + player.speed
+        return left, right, not player.is_jumping
+
+
+# Method: run_sessions
+# sessions   - number of games to play
+# max_frames - frame limit per game (None = until game over)
+# seed       - seed of the first game; game i uses seed + i (None = random)
+# simulate   - step the simulation core only, without run_game and pygame
+# record     - file to record each game to (run_game only); with several
+#              sessions, game i goes to "<name>-<i>.<ext>"
+# dt         - frames per simulation step (simulate only, see simulation.step)
+# -------------------------------------------------------------
+# Plays the given number of games with the AutoJumpController and prints
+# one line per game plus a summary. Returns the list of session results.
+
+def run_sessions(sessions, max_frames=None, seed=None, simulate=False, record=None, dt=1):
+    if simulate:
+        from src.simulation import run_simulation
+    else:
+        from src.game import run_game
+
+    results = []
+    start = time.perf_counter()
+    for i in range(sessions):
+        game_seed = None if seed is None else seed + i
+        if simulate:
+            result = run_simulation(game_seed, AutoJumpController(), max_frames, dt)
+        else:
+            path = record
+            if record and sessions > 1:
+                name, ext = os.path.splitext(record)
+                path = f"{name}-{i + 1}{ext}"
+            result = run_game(controller=AutoJumpController(), max_frames=max_frames, seed=game_seed, record=path)
+        results.append(result)
+        print(f"session {i + 1}: score={result['score']} frames={result['frames']} end={result['cause']}")
+
+    elapsed = time.perf_counter() - start
+    frames = sum(r["frames"] for r in results)
+    print(f"{sessions} sessions, {frames} frames in {elapsed:.2f}s "
+          f"({frames / elapsed if elapsed else 0:.0f} frames/s)")
+    return results
+
+
+# Method: replay_file
+# path     - replay written by run_game's recording
+# realtime - play it back in a window at the normal speed instead of
+#            stepping the simulation as fast as possible
+# -------------------------------------------------------------
+# Plays a recorded game back. At maximum speed it checks that the replay
+# reaches the recorded result and prints the step rate.
+
+def replay_file(path, realtime=False):
+    from src.replay import Replay, ReplayController, replay_headless
+
+    recording = Replay.load(path)
+    expected = recording.result
+    print(f"replay {path}: seed={recording.seed} score={expected['score']} "
+          f"frames={expected['frames']} end={expected['cause']}")
+    if realtime:
+        from src.game import run_game
+        result = run_game(controller=ReplayController(recording), max_frames=recording.steps,
+                          seed=recording.seed, record=False)
+        if result is not None:
+            print(f"replayed: score={result['score']} frames={result['frames']} end={result['cause']}")
+        return result
+
+    result = replay_headless(recording)
+    print(f"replayed: score={result['score']} frames={result['frames']} end={result['cause']} "
+          f"{'OK' if result['verified'] else 'MISMATCH'} ({result['steps_per_second']:.0f} steps/s)")
+    return result
@@ -0,0 +1,30 @@
+# lazy_import.py
+# ---------------------------------
+# Modules that are only loaded on first attribute access
+
+import importlib.util
+import sys
+
+
+# Function: lazy_import
+# name - absolute module name, e.g. "pygame"
+# -------------------------------------------------------------
+# Returns the module if it is already imported; otherwise returns a
+# placeholder module that runs the real import on its first attribute
+# access. Simulation modules import pygame this way, so the headless
+# simulation, the batch environment and the balance runner never load
+# pygame (or SDL) at all, while the draw code keeps writing pygame.Rect.
+
+def lazy_import(name):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,228 @@
+# level_stream.py
+# ---------------------------------
+# Generates the level ahead of the camera, in chunks, off the frame path
+
+import queue
+import random
+import threading
+from collections import deque, namedtuple
+
+from src.config import (
+    LEVEL_CHUNK_HEIGHT, LEVEL_LOOKAHEAD_CHUNKS, ENEMY_SPAWNS_PER_CHUNK,
+    ENEMY_PLATFORM_CLEARANCE, PLATFORM_HEIGHT, PLATFORM_MIN_GAP
+)
+from src.game_platform import next_platform_spec
+from src.enemy_logic import EnemySpawner
+
+# Spawn points keep this far below a chunk's top edge: the first platform
+# of the next chunk is not known yet, but it is at least PLATFORM_MIN_GAP
+# above the chunk's last platform, which is already above the top edge.
+SPAWN_TOP_MARGIN = max(0, PLATFORM_HEIGHT + ENEMY_PLATFORM_CLEARANCE[1] - PLATFORM_MIN_GAP)
+
+# One generated vertical section of the level, in world coordinates
+# (screen y = world y + camera offset; the level grows towards negative y).
+# platforms - PlatformSpecs from bottom to top
+# spawns    - (x, y) enemy spawn points from bottom to top
+LevelChunk = namedtuple("LevelChunk", ["index", "top", "bottom", "platforms", "spawns"])
+
+
+# Class: LevelStreamer
+# seed         - seed of the streamer's own random.Random
+# screen_width - width of the screen in pixels
+# ground       - PlatformSpec of the ground (world coordinates); the level
+#                is built upwards from it
+# lookahead    - number of chunks kept generated ahead of consumption
+# chunk_height - height of one chunk in pixels
+# -------------------------------------------------------------
+# Produces the level as a stream of chunks. Each chunk holds the platforms
+# of one LEVEL_CHUNK_HEIGHT band (built with next_platform_spec, every
+# platform reachable from the one below) and the enemy spawn points of
+# the band, placed by an EnemySpawner (platform clearance, and distance
+# to the spawn points of the chunk below). The game only takes ready results:
+#   next_platform()     - next platform above the previous one
+#   next_enemy_spawn()  - lowest acceptable unused spawn point in a height band
+#
+# Chunks are generated ahead of use, either by pump() in idle time of
+# the calling thread, or by a worker thread (start()/stop()) that keeps
+# `lookahead` chunks in a bounded queue. Generation only depends on the
+# seed, so both modes produce the same level. If the game ever needs a
+# chunk before one is ready, it is generated on the spot and counted in
+# `stalls`.
+
+class LevelStreamer:
+    def __init__(self, seed, screen_width, ground, lookahead=LEVEL_LOOKAHEAD_CHUNKS, chunk_height=LEVEL_CHUNK_HEIGHT):
+        self.rng = random.Random(seed)
+        self.screen_width = screen_width
+        self.ground = ground
+        self.lookahead = lookahead
+        self.chunk_height = chunk_height
+
+        # Generator state (owned by whichever thread generates)
+        self._previous = ground
+        self._below = ([ground], [])  # platforms and spawns of the chunk below
+        self.spawner = EnemySpawner(screen_width)
+        self._next_index = 0
+        self._next_bottom = ground.y
+        self.chunks_generated = 0
+
+        # Ready chunks and the consumer's cursors
+        self._ready = deque()
+        self._queue = None
+        self._worker = None
+        self._stop = threading.Event()
+        self._platforms = deque()
+        self._spawns = deque()
+        self.stalls = 0
+
+
+    # Method: generate_chunk
+    # -------------------------------------------------------------
+    # Builds the next chunk: platforms up to the chunk's top edge, and
+    # ENEMY_SPAWNS_PER_CHUNK Poisson-disk spawn points in the band.
+
+    def generate_chunk(self):
+        rng = self.rng
+        bottom = self._next_bottom
+        top = bottom - self.chunk_height
+
+        platforms = []
+        previous = self._previous
+        while previous.y > top:
+            previous = next_platform_spec(previous, self.screen_width, rng)
+            platforms.append(previous)
+        self._previous = previous
+
+        below_platforms, below_spawns = self._below
+        boxes = [(p.x, p.y, p.width, PLATFORM_HEIGHT) for p in below_platforms + platforms]
+        spawns = self.spawner.sample(rng, top + SPAWN_TOP_MARGIN, bottom, ENEMY_SPAWNS_PER_CHUNK,
+                                     boxes, below_spawns)
+        spawns.sort(key=lambda spawn: -spawn[1])
+        self._below = (platforms, spawns)
+
+        chunk = LevelChunk(self._next_index, top, bottom, platforms, spawns)
+        self._next_index += 1
+        self._next_bottom = top
+        self.chunks_generated += 1
+        return chunk
+
+
+    # Method: pump
+    # max_chunks - most chunks to generate in this call
+    # -------------------------------------------------------------
+    # Idle-time generation on the calling thread: fills the look-ahead up
+    # to `lookahead` ready chunks. Call when a frame has time to spare.
+    # Does nothing while a worker thread is running.
+    # Returns the number of chunks generated.
+
+    def pump(self, max_chunks=1):
+        if self._worker is not None:
+            return 0
+        generated = 0
+        while generated < max_chunks and len(self._ready) < self.lookahead:
+            self._ready.append(self.generate_chunk())
+            generated += 1
+        return generated
+
+
+    # Method: start
+    # -------------------------------------------------------------
+    # Starts a daemon worker thread that keeps `lookahead` chunks queued.
+    # Chunks already generated by pump() are used first.
+
+    def start(self):
+        if self._worker is not None:
+            return
+        self._queue = queue.Queue(maxsize=self.lookahead)
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._work, name="level-streamer", daemon=True)
+        self._worker.start()
+
+
+    # Method: stop
+    # -------------------------------------------------------------
+    # Stops the worker thread; queued chunks stay available.
+
+    def stop(self):
+        if self._worker is None:
+            return
+        self._stop.set()
+        while self._worker.is_alive():
+            try:
+                self._ready.append(self._queue.get(timeout=0.01))
+            except queue.Empty:
+                pass
+        self._worker.join()
+        while not self._queue.empty():
+            self._ready.append(self._queue.get_nowait())
+        self._worker = None
+        self._queue = None
+
+
+    def _work(self):
+        while not self._stop.is_set():
+            chunk = self.generate_chunk()
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            else:
+                self._queue.put(chunk)  # stop() drains the queue, keep the order
+
+
+    # Method: ready_chunks
+    # -------------------------------------------------------------
+    # Number of generated chunks not taken by the game yet.
+
+    def ready_chunks(self):
+        return len(self._ready) + (self._queue.qsize() if self._queue is not None else 0)
+
+
+    # Method: next_platform
+    # -------------------------------------------------------------
+    # Returns the PlatformSpec directly above the previously returned one.
+
+    def next_platform(self):
+        while not self._platforms:
+            self._take_chunk()
+        return self._platforms.popleft()
+
+
+    # Method: next_enemy_spawn
+    # max_y  - spawn points lower than this (world y) are dropped
+    # min_y  - spawn points higher than this are not considered yet
+    # accept - optional test accept(x, y) a point has to pass
+    # -------------------------------------------------------------
+    # Returns the lowest unused spawn point (x, world y) between max_y and
+    # min_y that passes accept, and removes it; None if there is none.
+    # Points that fail accept, or lie above min_y, stay available for
+    # later calls.
+
+    def next_enemy_spawn(self, max_y, min_y, accept=None):
+        while True:
+            while self._spawns and self._spawns[0][1] > max_y:
+                self._spawns.popleft()
+            if self._spawns and self._spawns[-1][1] < min_y:
+                break
+            self._take_chunk()
+        for index, (x, y) in enumerate(self._spawns):
+            if y < min_y:
+                break
+            if accept is None or accept(x, y):
+                del self._spawns[index]
+                return x, y
+        return None
+
+
+    # Splices the next ready chunk into the platform and spawn cursors
+    def _take_chunk(self):
+        if self._ready:
+            chunk = self._ready.popleft()
+        elif self._worker is not None:
+            chunk = self._queue.get()
+        else:
+            self.stalls += 1
+            chunk = self.generate_chunk()
+        self._platforms.extend(chunk.platforms)
+        self._spawns.extend(chunk.spawns)
@@ -4,6 +4,12 @@
 # ---------------------------------
 # Pause menu rendering and interaction handler
 
+import pygame
+
+from src.text_cache import get_font, render_text
+from src.ui_overlay import LayerCache
+
+
 # Method: show_pause_menu
 # screen - instance of the Pygame screen to render to
 # screen_width, screen_height - dimensions of the screen
@@ -12,35 +18,25 @@
 # Displays the pause menu with two buttons: "Resume" and "Quit".
 # Renders a dimmed overlay and handles input events for both buttons.
 # The menu stays open until the user chooses to resume or quit the game.
+# The title and buttons come from a cached layer that is composited onto a
+# snapshot of the paused game once; each menu frame is a single blit.
+
+_menu_layers = None
 
 def show_pause_menu(screen, screen_width, screen_height, pause_font ):
-    import pygame
+    global _menu_layers
     clock = pygame.time.Clock()
     running = True
 
-    btn_font = pygame.font.SysFont("Arial", 32)
+    if _menu_layers is None:
+        _menu_layers = LayerCache(_build_menu_layer)
+    resume_btn, quit_btn = _button_rects(screen_width)
 
-    # Define button rectangles
-    resume_btn = pygame.Rect(screen_width // 2 - 100, 300, 200, 50)
-    quit_btn = pygame.Rect(screen_width // 2 - 100, 380, 200, 50)
+    frame = screen.copy()
+    frame.blit(_menu_layers.get((screen_width, screen_height, pause_font)), (0, 0))
 
     while running:
-
-        # Dim overlay
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        screen.blit(overlay, (0, 0))
-
-        # Title text
-        title = pause_font.render("Game Paused", True, (0, 0, 139))
-        screen.blit(title, (screen_width // 2 - title.get_width() // 2, 150))
-
-        # Draw buttons
-        pygame.draw.rect(screen, (100, 200, 100), resume_btn, border_radius=12)
-        pygame.draw.rect(screen, (200, 80, 80), quit_btn, border_radius=12)
-
-        screen.blit(btn_font.render("Resume", True, (255, 255, 255)), (resume_btn.x + 40, resume_btn.y + 10))
-        screen.blit(btn_font.render("Quit", True, (255, 255, 255)), (quit_btn.x + 60, quit_btn.y + 10))
-
+        screen.blit(frame, (0, 0))
         pygame.display.update()
 
         # Handle pause menu events
@@ -60,3 +56,39 @@ def show_pause_menu(screen, screen_width, screen_height, pause_font ):
 
         clock.tick(60)
     return None
+
+
+# Method: _button_rects
+# screen_width - width of the screen
+# -------------------------------------------------------------
+# Returns the (resume, quit) button rectangles.
+
+def _button_rects(screen_width):
+    resume_btn = pygame.Rect(screen_width // 2 - 100, 300, 200, 50)
+    quit_btn = pygame.Rect(screen_width // 2 - 100, 380, 200, 50)
+    return resume_btn, quit_btn
+
+
+# Method: _build_menu_layer
+# key - (screen_width, screen_height, pause_font)
+# -------------------------------------------------------------
+# Draws the pause title and both buttons onto a transparent layer.
+
+def _build_menu_layer(key):
+    screen_width, screen_height, pause_font = key
+
+    btn_font = get_font("Arial", 32)
+    resume_btn, quit_btn = _button_rects(screen_width)
+    layer = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+
+    # Title text
+    title = render_text(pause_font, "Game Paused", (0, 0, 139))
+    layer.blit(title, (screen_width // 2 - title.get_width() // 2, 150))
+
+    # Draw buttons
+    pygame.draw.rect(layer, (100, 200, 100), resume_btn, border_radius=12)
+    pygame.draw.rect(layer, (200, 80, 80), quit_btn, border_radius=12)
+
+    layer.blit(render_text(btn_font, "Resume", (255, 255, 255)), (resume_btn.x + 40, resume_btn.y + 10))
+    layer.blit(render_text(btn_font, "Quit", (255, 255, 255)), (quit_btn.x + 60, quit_btn.y + 10))
+    return layer
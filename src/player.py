@@ -1,65 +1,81 @@
 # src/player.py
-import pygame
+from src.assets import assets
+from src.config import PLAYER_SIZE, PLAYER_SPRITE_SHEET, PLAYER_FRAME_SIZE, PLAYER_FRAMES_PER_ROW
+from src.lazy_import import lazy_import
 
+pygame = lazy_import("pygame")
+
+# Player state is kept in __slots__: the hot simulation data (position,
+# velocity, flags) first, then the animation state and the references to
+# the shared sprite frames. Constants (size, speed, gravity, animation
+# speed) are class attributes instead of per-player copies.
 class Player:
-    width = 64
-    height = 64
+    __slots__ = (
+        "x", "y", "prev_x", "prev_y", "vel_y", "is_jumping", "direction", "facing_right",
+        "current_row", "current_frame", "animation_timer", "_animations", "_flipped_animations",
+    )
+
+    width, height = PLAYER_SIZE
     speed = 5
+    gravity = 0.6
+    jump_velocity = -20
+    animation_speed = 0.04
 
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        self.prev_x = x  # position before the last simulation step (render interpolation)
+        self.prev_y = y
         self.vel_y = 0
-        self.gravity = 0.6
         self.is_jumping = False
         self.direction = "idle"  # 'idle', 'fly', 'jump', 'eat'
         self.facing_right = False
 
-        self.animations = self.load_animation_rows("assets/images/BirdSprite.png", 16, 16)
+        # Sprite frames are looked up on first draw/animation, so a Player
+        # used only by the simulation never touches the asset registry
+        self._animations = None
+        self._flipped_animations = None
         self.current_row = 0
         self.current_frame = 0
         self.animation_timer = 0
-        self.animation_speed = 0.04
-        self.image = self.animations[self.current_row][self.current_frame]
 
 
     # Method: load_animation_rows
     # path           - file path to the sprite sheet image
     # frame_width    - width of a single frame in the sprite sheet
     # frame_height   - height of a single frame in the sprite sheet
+    # flip           - mirror every frame horizontally (left-facing set)
     # ----------------------------------------------------------------------
     # Loads animation frames from a sprite sheet arranged in multiple rows.
     # Each row represents a different animation type (e.g., idle, jump, eat).
     # A predefined number of frames is extracted per row based on the index.
     # The extracted frames are resized to match the object's width and height.
-    # Returns a list of animation rows, where each row is a list of frames.
-
-    def load_animation_rows(self, path, frame_width, frame_height):
-        sprite_sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sprite_sheet.get_size()
-        total_rows = sheet_height // frame_height
-
-        # Define actual number of frames per row
-        frames_per_row = {
-            0: 2,  # idle
-            1: 8,  # fly/jump
-            2: 3   # eat (or rotate if repurposed)
-        }
-
-        animations = []
-        for row in range(total_rows):
-            row_frames = []
-            max_cols = frames_per_row.get(row, 0)
-            for col in range(max_cols):
-                # Check if frame is inside image bounds
-                if (col + 1) * frame_width <= sheet_width:
-                    frame = sprite_sheet.subsurface(
-                        pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
-                    )
-                    frame = pygame.transform.scale(frame, (self.width, self.height))
-                    row_frames.append(frame)
-            animations.append(row_frames)
-        return animations
+    # The sheet is sliced only once by the asset registry; every Player shares
+    # the same frames, packed into the sprite atlas. Returns a list of animation
+    # rows, where each row is a list of AtlasRegions.
+
+    def load_animation_rows(self, path, frame_width, frame_height, flip=False):
+        return assets.sprite_regions(
+            path, (frame_width, frame_height), PLAYER_FRAMES_PER_ROW,
+            (self.width, self.height), flip
+        )
+
+
+    # Property: animations / flipped_animations
+    # ----------------------------------------------------------------------
+    # Right- and left-facing animation rows, loaded on first access.
+
+    @property
+    def animations(self):
+        if self._animations is None:
+            self._animations = self.load_animation_rows(PLAYER_SPRITE_SHEET, *PLAYER_FRAME_SIZE)
+        return self._animations
+
+    @property
+    def flipped_animations(self):
+        if self._flipped_animations is None:
+            self._flipped_animations = self.load_animation_rows(PLAYER_SPRITE_SHEET, *PLAYER_FRAME_SIZE, flip=True)
+        return self._flipped_animations
 
 
     # Method: move
@@ -67,16 +83,27 @@ class Player:
     # screen_width  - width of the screen to restrict horizontal movement
     # ------------------------------------------------------------------------
     # Handles the horizontal movement of the player based on key input.
+
+    def move(self, keys, screen_width):
+        self.steer(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], screen_width)
+
+
+    # Method: steer
+    # left, right   - horizontal input flags
+    # screen_width  - width of the screen to restrict horizontal movement
+    # steps         - number of simulation steps the input is held for
+    # ------------------------------------------------------------------------
+    # Moves the player horizontally (left wins if both are set).
     # Updates the player's direction and facing direction for animations.
     # Ensures the player stays within the horizontal bounds of the screen.
 
-    def move(self, keys, screen_width):
-        if keys[pygame.K_LEFT]:
-            self.x -= self.speed
+    def steer(self, left, right, screen_width, steps=1):
+        if left:
+            self.x -= self.speed * steps
             self.direction = "fly"
             self.facing_right = True
-        elif keys[pygame.K_RIGHT]:
-            self.x += self.speed
+        elif right:
+            self.x += self.speed * steps
             self.direction = "fly"
             self.facing_right = False
         else:
@@ -86,15 +113,17 @@ class Player:
 
 
     # Method: apply_gravity
+    # steps - number of simulation steps to apply
     # ----------------------
     # Applies gravity to the player by increasing vertical velocity (`vel_y`)
-    # and updating the player's vertical position (`y`).
+    # and updating the player's vertical position (`y`); several steps at
+    # once land where that many single steps would.
     # Also sets the animation direction to "fly" when the player is moving
     # vertically (either jumping up or falling down).
 
-    def apply_gravity(self):
-        self.vel_y += self.gravity
-        self.y += self.vel_y
+    def apply_gravity(self, steps=1):
+        self.y += self.vel_y * steps + self.gravity * steps * (steps + 1) / 2
+        self.vel_y += self.gravity * steps
 
         # Use jump/fly animation when moving vertically
         if self.vel_y < 0:
@@ -109,7 +138,7 @@ class Player:
     # Also sets the animation direction to "fly".
 
     def jump(self):
-        self.vel_y = -20
+        self.vel_y = self.jump_velocity
         self.is_jumping = True
         self.direction = "fly"
 
@@ -126,7 +155,6 @@ class Player:
         if self.direction == "idle":
             self.current_row = 0
             self.current_frame = 0  # Always show the first idle frame
-            self.image = self.animations[self.current_row][self.current_frame]
             return  # Skip animation
 
         elif self.direction == "fly":
@@ -138,22 +166,41 @@ class Player:
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
-            num_frames = len(self.animations[self.current_row])
+            num_frames = PLAYER_FRAMES_PER_ROW[self.current_row]
             self.current_frame = (self.current_frame + 1) % num_frames
-            self.image = self.animations[self.current_row][self.current_frame]
 
 
     # Method: draw
     # screen - the surface to draw the character on
+    # alpha  - interpolation factor between the previous (0) and the
+    #          current (1) simulation position
     # ----------------------------------------------------------
     # Renders the player's current animation frame to the screen.
-    # If the player is facing left, the image is flipped horizontally.
+    # If the player is facing left, the pre-flipped frame is used.
+    # Frames are drawn with an area blit from the atlas page.
+    # Returns the screen area that was drawn to.
+
+    def draw(self, screen, alpha=1.0):
+        rows = self.animations if self.facing_right else self.flipped_animations
+        region = rows[self.current_row][self.current_frame]
+        prev_x, prev_y = self.prev_x, self.prev_y
+        x = prev_x + (self.x - prev_x) * alpha
+        y = prev_y + (self.y - prev_y) * alpha
+        return screen.blit(region.sheet, (x, y), region.area)
+
+
+    # Property: region / image
+    # ----------------------------------------------------------
+    # The current animation frame as an AtlasRegion, and as a plain
+    # Surface (atlas subsurface).
+
+    @property
+    def region(self):
+        return self.animations[self.current_row][self.current_frame]
 
-    def draw(self, screen):
-        image = self.image
-        if not self.facing_right:
-            image = pygame.transform.flip(self.image, True, False)
-        screen.blit(image, (self.x, self.y))
+    @property
+    def image(self):
+        return self.region.image
 
 
     # Method: get_rect
@@ -0,0 +1,106 @@
+# reachability.py
+# ---------------------------------
+# Jump reachability: how far apart two platforms can be and still be
+# reachable, as a lookup table built once from the player's jump physics
+
+import math
+
+from src.config import PLATFORM_WIDTH, PLATFORM_HEIGHT, SCREEN_HEIGHT
+from src.player import Player
+
+# simulation.step lands a falling player whose feet are at most this far
+# below a platform's bottom edge
+LANDING_TOLERANCE = 10
+MAX_DROP = SCREEN_HEIGHT  # deepest drop (negative rise) the table covers
+
+
+# Function: jump_arc
+# -------------------------------------------------------------
+# Replays a jump from standing with simulation.step's order of updates
+# (jump, steer, gravity, landing check) and returns (frame, feet
+# displacement) for every frame on which the player is falling, i.e. on
+# which step would test for a landing. Displacement is in pixels relative
+# to the take-off platform's top, negative = above it. Ends once the feet
+# are MAX_DROP plus a platform below the take-off height.
+
+def jump_arc():
+    arc = []
+    vel_y, y = Player.jump_velocity, 0.0
+    frame = 0
+    while y <= MAX_DROP + PLATFORM_HEIGHT + LANDING_TOLERANCE:
+        frame += 1
+        vel_y += Player.gravity
+        y += vel_y
+        if vel_y > 0:
+            arc.append((frame, y))
+    return arc
+
+
+# Function: build_reach_table
+# -------------------------------------------------------------
+# Returns a list indexed by rise + MAX_DROP (rise = take-off platform top
+# minus target platform top, whole pixels, from -MAX_DROP up to the jump
+# height) holding the widest horizontal edge gap a jump can clear to land
+# on a platform that much higher, or -1 if no falling frame lands there
+# (above the jump height, or a drop the fall steps over in one frame).
+#
+# A falling frame with feet displacement d lands on a platform at rise r
+# if -d < r <= PLATFORM_HEIGHT + LANDING_TOLERANCE - d; the last such
+# frame k gives the most air time. Holding a direction from take-off
+# moves the player Player.speed px per frame, and a player standing on
+# the lower platform can always start within one step of its edge, so
+# the gap (upper left edge minus lower right edge, or mirrored) must be
+# below speed * (k - 1) + player width to still overlap the target.
+
+def build_reach_table():
+    speed, player_width = Player.speed, Player.width
+    arc = jump_arc()
+    top = math.floor(-arc[0][1]) + 1  # highest rise any falling frame could land on
+    last_frame = [0] * (MAX_DROP + top + 1)
+    for frame, y in arc:
+        low = max(-MAX_DROP, math.floor(-y) + 1)
+        high = math.floor(PLATFORM_HEIGHT + LANDING_TOLERANCE - y)
+        for rise in range(low, min(high, top) + 1):
+            last_frame[rise + MAX_DROP] = frame
+    return [speed * (frame - 1) + player_width - 1 if frame else -1 for frame in last_frame]
+
+
+REACH_TABLE = build_reach_table()
+MAX_RISE = max(i for i, gap in enumerate(REACH_TABLE) if gap >= 0) - MAX_DROP
+
+
+# Function: max_gap
+# rise - height of the target platform's top above the take-off platform's top (px)
+# -------------------------------------------------------------
+# Widest horizontal gap between the two platforms' facing edges that a
+# jump can clear, or -1 if a platform at that rise cannot be landed on.
+
+def max_gap(rise):
+    rise = round(rise)
+    if rise < -MAX_DROP or rise > MAX_RISE:
+        return -1
+    return REACH_TABLE[rise + MAX_DROP]
+
+
+# Function: max_shift
+# rise  - as for max_gap
+# width - width of both platforms
+# -------------------------------------------------------------
+# Largest horizontal offset between the left edges of two platforms of
+# the same width, or -1 if the rise cannot be landed on.
+
+def max_shift(rise, width=PLATFORM_WIDTH):
+    gap = max_gap(rise)
+    return gap + width if gap >= 0 else -1
+
+
+# Function: reachable
+# lower - PlatformSpec jumped from
+# upper - PlatformSpec to land on (world coordinates like lower)
+# -------------------------------------------------------------
+# True if a jump from `lower` can land on `upper` while both stand still.
+# Moving platforms move slower than the player, who can follow them.
+
+def reachable(lower, upper):
+    gap = max(upper.x - (lower.x + lower.width), lower.x - (upper.x + upper.width))
+    return gap <= max_gap(lower.y - upper.y)
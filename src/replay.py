@@ -0,0 +1,194 @@
+# replay.py
+# ---------------------------------
+# Recording of per-step inputs and deterministic replay of recorded games
+
+import struct
+import time
+
+from src.config import SIM_HZ
+from src.simulation import GameState, Inputs, NO_INPUT, step
+
+# File layout (little endian):
+#   header - magic, format version, seed (int64), SIM_HZ (uint16),
+#            steps (uint32), score (int64), cause code (uint8)
+#   body   - the inputs of every step, run-length encoded: one LEB128
+#            varint per run of identical steps, (run length << 3) | bits
+REPLAY_MAGIC = b"SKYR"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sBqHIqB")
+
+# Input bits of one step
+BIT_LEFT = 1
+BIT_RIGHT = 2
+BIT_JUMP = 4
+
+# How a recorded game ended
+CAUSES = (None, "enemy", "fall", "timeout", "quit")
+
+# Path run_game records every game to (the last game wins), see enable_recording
+record_path = None
+
+
+# Method: enable_recording
+# path - file run_game writes the replay of each game to
+# -------------------------------------------------------------
+
+def enable_recording(path):
+    global record_path
+    record_path = path
+
+
+def pack_inputs(inputs):
+    return (BIT_LEFT if inputs.left else 0) | (BIT_RIGHT if inputs.right else 0) | (BIT_JUMP if inputs.jump else 0)
+
+
+def unpack_inputs(bits):
+    return Inputs(bool(bits & BIT_LEFT), bool(bits & BIT_RIGHT), bool(bits & BIT_JUMP))
+
+
+# Class: InputRecorder
+# seed - seed of the recorded game's GameState
+# -------------------------------------------------------------
+# Collects the Inputs of every simulation step as (bits, run length)
+# pairs; a step with the same keys as the one before only extends the
+# current run, so holding a key for a second costs no more than a tap.
+
+class InputRecorder:
+    def __init__(self, seed):
+        self.seed = seed
+        self.runs = []  # [bits, run length]
+        self.steps = 0
+
+
+    # Method: record
+    # inputs - Inputs passed to step()
+    # -------------------------------------------------------------
+
+    def record(self, inputs):
+        bits = pack_inputs(inputs)
+        runs = self.runs
+        if runs and runs[-1][0] == bits:
+            runs[-1][1] += 1
+        else:
+            runs.append([bits, 1])
+        self.steps += 1
+
+
+    # Method: to_bytes
+    # result - {"score", "frames", "cause"} of the recorded game
+    # -------------------------------------------------------------
+
+    def to_bytes(self, result):
+        data = bytearray(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, SIM_HZ, self.steps,
+                                     result["score"], CAUSES.index(result["cause"])))
+        for bits, length in self.runs:
+            value = (length << 3) | bits
+            while value > 0x7F:
+                data.append((value & 0x7F) | 0x80)
+                value >>= 7
+            data.append(value)
+        return bytes(data)
+
+
+    # Method: save
+    # path   - file to write
+    # result - {"score", "frames", "cause"} of the recorded game
+    # -------------------------------------------------------------
+
+    def save(self, path, result):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes(result))
+
+
+# Class: Replay
+# seed   - seed of the recorded game
+# runs   - (bits, run length) pairs of the recorded inputs
+# result - {"score", "frames", "cause"} the recorded game ended with
+# -------------------------------------------------------------
+# A loaded recording. Built with Replay.load(path) or Replay.from_bytes().
+
+class Replay:
+    def __init__(self, seed, runs, result):
+        self.seed = seed
+        self.runs = runs
+        self.result = result
+
+    @property
+    def steps(self):
+        return self.result["frames"]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, sim_hz, steps, score, cause = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("not a SkyDodo replay (or an unsupported version)")
+        if sim_hz != SIM_HZ:
+            raise ValueError(f"replay was recorded at {sim_hz} steps/s, the game runs at {SIM_HZ}")
+
+        runs = []
+        value = shift = 0
+        for byte in data[HEADER.size:]:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                runs.append((value & 7, value >> 3))
+                value = shift = 0
+        if sum(length for _, length in runs) != steps:
+            raise ValueError("replay is truncated")
+        return cls(seed, runs, {"score": score, "frames": steps, "cause": CAUSES[cause]})
+
+
+    # Method: iter_inputs
+    # -------------------------------------------------------------
+    # Yields the Inputs of every recorded step.
+
+    def iter_inputs(self):
+        for bits, length in self.runs:
+            inputs = unpack_inputs(bits)
+            for _ in range(length):
+                yield inputs
+
+
+# Class: ReplayController
+# replay - Replay to play back
+# -------------------------------------------------------------
+# run_game controller that feeds the recorded inputs, one per step, and
+# no input once the recording ends.
+
+class ReplayController:
+    def __init__(self, replay):
+        self._inputs = replay.iter_inputs()
+
+    def __call__(self, player, platforms, enemies):
+        return next(self._inputs, NO_INPUT)
+
+
+# Method: replay_headless
+# replay - Replay to play back
+# -------------------------------------------------------------
+# Steps a GameState built from the replay's seed through the recorded
+# inputs as fast as possible, without pygame. Returns the result dict
+# of the replayed game plus "verified" (it matches the recorded result)
+# and "steps_per_second".
+
+def replay_headless(replay):
+    state = GameState(replay.seed)
+    start = time.perf_counter()
+    for inputs in replay.iter_inputs():
+        step(state, inputs)
+    elapsed = time.perf_counter() - start
+
+    # Games that ended without a game over (frame limit, window closed)
+    # end the replay when the inputs run out
+    cause = state.game_over
+    if cause is None and replay.result["cause"] in ("timeout", "quit", None):
+        cause = replay.result["cause"]
+    result = {"score": state.score, "frames": state.frame, "cause": cause}
+    result["verified"] = result == replay.result
+    result["steps_per_second"] = state.frame / elapsed if elapsed else 0.0
+    return result
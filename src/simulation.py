@@ -0,0 +1,381 @@
+# simulation.py
+# ---------------------------------
+# Deterministic game simulation, independent of display, audio and input devices
+
+import math
+import random
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from src.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    PLAYER_START_X, PLAYER_START_Y,
+    SCROLL_TRIGGER_Y, MAX_PLATFORM_DISTANCE, ENEMY_RESPAWN_Y, ENEMY_RESPAWN_BAND, ENEMY_MIN_DISTANCE
+)
+from src.player import Player
+from src.game_platform import PlatformRing, PlatformSpec
+from src.level_stream import LevelStreamer
+from src.enemy_logic import spawn_enemies
+from src.entity_store import EntityStore
+from src.sprites.bettle import Bettle
+from src.swept import first_landing, first_overlap, landings_from_rest
+
+# Input state for one simulation step; jump is a "jump pressed" edge
+Inputs = namedtuple("Inputs", ["left", "right", "jump"])
+NO_INPUT = Inputs(False, False, False)
+
+# Events returned by step()
+EVENT_JUMP = "jump"        # the player started a jump
+EVENT_SCROLL = "scroll"    # the camera moved up
+EVENT_LAND = "land"        # the player landed on a platform
+EVENT_ENEMY = "enemy"      # game over: the player touched an enemy
+EVENT_FALL = "fall"        # game over: the player fell off the screen
+
+ENEMY_COUNT = 2.5  # as passed to spawn_enemies, i.e. up to three enemies
+
+
+# Class: GameState
+# seed          - seed of the state's random number generator (None = random)
+# scroll_offset - starting camera offset
+# screen_width, screen_height - size of the playing field
+# enemy_count    - number of enemies (stress scenarios raise it)
+# platform_count - platforms in the ring (None = enough to fill the screen)
+# -------------------------------------------------------------
+# Everything the simulation needs to advance the game: player, platforms,
+# enemies, camera offset and a private random.Random, so two states built
+# from the same seed and fed the same inputs play out identically.
+# Platforms and enemies are views on two EntityStores (platform_store,
+# enemy_store) that step() updates with vectorized calls. New platforms
+# and enemy respawn points come from a LevelStreamer (seeded from the
+# state's random generator) that has the level generated ahead of time.
+# Enemies the spawn rules leave no room for (only with a raised
+# enemy_count) are placed at random on and above the screen. Placements
+# that broke the spawn rules (enemies missing at the start, respawns
+# with no uncrowded point) are counted per level in failed_placements.
+# Creating a state does not load any images or sounds.
+
+class GameState:
+    def __init__(self, seed=None, scroll_offset=0, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                 enemy_count=ENEMY_COUNT, platform_count=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.scroll_offset = scroll_offset
+        self.prev_scroll_offset = scroll_offset
+        self.frame = 0
+        self.game_over = None  # EVENT_ENEMY or EVENT_FALL once the game has ended
+        self.failed_placements = Counter()  # level -> enemies the spawn rules found no room for
+
+        self.platform_store = EntityStore()
+        self.enemy_store = EntityStore()
+        self.player = Player(PLAYER_START_X, PLAYER_START_Y)
+        ground = PlatformSpec(0, screen_height - 20 - scroll_offset, screen_width, False, 0, 0)
+        self.streamer = LevelStreamer(self.rng.getrandbits(64), screen_width, ground)
+        self.streamer.pump(self.streamer.lookahead)
+        self.platform_ring = PlatformRing(screen_width, screen_height, self.streamer, scroll_offset,
+                                          store=self.platform_store, capacity=platform_count)
+        self.platforms = self.platform_ring.platforms
+        self.enemies = spawn_enemies(enemy_count, screen_width, screen_height, None, self.platforms,
+                                     rng=self.rng, store=self.enemy_store, spawner=self.streamer.spawner)
+        missing = math.ceil(enemy_count) - len(self.enemies)
+        if missing > 0:
+            self.failed_placements[0] += missing
+        while enemy_count > ENEMY_COUNT and len(self.enemies) < math.ceil(enemy_count):
+            x = self.rng.randint(50, screen_width - 100)
+            y = self.rng.uniform(-screen_height, screen_height - 200)
+            self.enemies.append(Bettle(game=None, x=x, y=y, store=self.enemy_store))
+
+    @property
+    def score(self):
+        return int(self.scroll_offset)
+
+    @property
+    def difficulty_level(self):
+        return self.score // MAX_PLATFORM_DISTANCE
+
+
+    # Method: camera_offset
+    # alpha - interpolation factor between the previous and the current step
+    # -------------------------------------------------------------
+    # Scroll offset to draw with, interpolated like the entity positions.
+
+    def camera_offset(self, alpha=1.0):
+        return self.prev_scroll_offset + (self.scroll_offset - self.prev_scroll_offset) * alpha
+
+
+# Function: step
+# state  - GameState to advance (modified in place)
+# inputs - Inputs for this step
+# dt     - number of frames to advance at once, with the inputs held
+# -------------------------------------------------------------
+# Advances the game by dt frames: jump, horizontal movement, gravity,
+# moving platforms, platform landing, enemy collision, camera scroll
+# with platform recycling and enemy respawns (see _respawn_enemies),
+# enemy movement and the fall check. Returns the list of events that
+# happened during the step.
+# Once state.game_over is set, further steps do nothing.
+#
+# Collisions are swept: the player moves in a straight line between
+# its per-frame positions (computed frame by frame, like single-frame
+# steps), and landings and enemy hits are found where the path first
+# touches a platform's landing band or an enemy box, so a fast fall
+# cannot skip a platform. With dt = 1 every hit of the per-frame test is
+# still a hit. After a landing the rest of a coarse step is replayed as
+# single-frame steps would play it (see _land): the player jumps again
+# if the jump input is held, stands while the platform supports them and
+# falls once it does not. A game that ends in a coarse step (enemy hit
+# or fall) stops at that frame, so the player, platforms and enemies end
+# up exactly where dt single-frame steps with the same inputs leave
+# them. What a coarse step does only once, at its end, is the camera
+# scroll: platforms recycled and enemies respawned by it are placed
+# after the step and start moving with the next one.
+#
+# The positions before the step are kept in prev_x/prev_y (and
+# prev_scroll_offset) so the renderer can interpolate between two steps;
+# entities that teleport (respawned enemies) get prev = current.
+
+def step(state, inputs, dt=1):
+    events = []
+    if state.game_over is not None:
+        return events
+
+    player = state.player
+    platform_store = state.platform_store
+    enemy_store = state.enemy_store
+    width, height = state.screen_width, state.screen_height
+
+    state.prev_scroll_offset = state.scroll_offset
+    player.prev_x, player.prev_y = player.x, player.y
+    platform_store.save_positions()
+    enemy_store.save_positions()
+
+    if inputs.jump and not player.is_jumping:
+        player.jump()
+        events.append(EVENT_JUMP)
+
+    # Player position and velocity at frames 0..dt
+    x = player.x
+    shift = -player.speed if inputs.left else player.speed if inputs.right else 0
+    right_edge = width - player.width
+    xs = [max(0, min(x + shift * i, right_edge)) for i in range(dt + 1)]
+    ys, vels = [player.y] * (dt + 1), [player.vel_y] * (dt + 1)
+    _fall(ys, vels, 0, player.vel_y, player.gravity)
+    player.steer(inputs.left, inputs.right, width, dt)
+    player.apply_gravity(dt)
+
+    # Landings, and what follows them within the step
+    jumping = [player.is_jumping] * (dt + 1)  # is_jumping at frames 0..dt
+    landed, jumped = _land(state, inputs, xs, ys, vels, jumping)
+
+    # Enemy hit: the enemies move after the test of each frame
+    hit = None
+    rows = enemy_store.sweep_candidates(min(xs), min(ys), max(xs) + player.width, max(ys) + player.height, dt - 1)
+    if len(rows):
+        path = enemy_store.patrol_path(dt - 1)[:, rows]
+        segment = first_overlap(np.array(xs), np.array(ys), path, enemy_store.y[rows], enemy_store.w[rows],
+                                enemy_store.h[rows], (player.width, player.height))
+        if segment is not None:
+            hit = segment + 1
+    end = dt if hit is None else hit
+
+    # Fall: the first frame that ends below the screen (after its scroll)
+    top = ys[0]
+    for i in range(1, end):
+        top = min(top, ys[i])
+        if ys[i] + max(0, SCROLL_TRIGGER_Y - top) > height:
+            end, hit = i, None
+            break
+
+    platform_store.move(end)
+    if jumped is not None and jumped < end and EVENT_JUMP not in events:
+        events.append(EVENT_JUMP)
+
+    player.x, player.y, player.vel_y = xs[end], ys[end], vels[end]
+    player.is_jumping = jumping[end]
+
+    top = min(ys[:end + 1])
+    if top < SCROLL_TRIGGER_Y:
+        scroll = SCROLL_TRIGGER_Y - top
+        state.scroll_offset += scroll
+        player.y = SCROLL_TRIGGER_Y + (player.y - top)
+        platform_store.scroll(scroll)
+        state.platform_ring.recycle(state.scroll_offset)
+
+        enemy_store.scroll(scroll)
+        gone = np.flatnonzero(enemy_store.y[:enemy_store.count] > height)
+        if len(gone):
+            _respawn_enemies(state, gone)
+        events.append(EVENT_SCROLL)
+
+    if landed is not None and landed <= end:
+        events.append(EVENT_LAND)
+
+    state.frame += end
+
+    if hit is not None:
+        state.game_over = EVENT_ENEMY
+        events.append(EVENT_ENEMY)
+        enemy_store.move(hit - 1)
+        return events
+
+    enemy_store.move(end)
+
+    if player.y > height:
+        state.game_over = EVENT_FALL
+        events.append(EVENT_FALL)
+    return events
+
+
+# Function: _land
+# state, inputs - as for step
+# xs, ys, vels  - player x, y and vertical velocity at frames 0..dt, as if
+#                 nothing were hit (updated in place)
+# jumping       - player.is_jumping at frames 0..dt (updated in place)
+# -------------------------------------------------------------
+# Finds the first frame whose landing test (see step) lands the player
+# and replays the rest of the step from there the way single-frame steps
+# would: with the jump input held the player takes off again on the next
+# frame; otherwise they stand on the platform for as long as each frame's
+# landing test lands them on it again, and fall from rest once it does
+# not (walked off the edge, or the platform moved away).
+# Returns (first landing frame, first take-off frame after a landing);
+# either may be None.
+
+def _land(state, inputs, xs, ys, vels, jumping):
+    player, store = state.player, state.platform_store
+    dt = len(xs) - 1
+    gravity, height, width = player.gravity, player.height, player.width
+    path = None  # platform x at frames 0..dt, computed on first use
+    landed = jumped = None
+    start = 0
+    while vels[-1] > 0:
+        # Free flight from frame start: the first frame whose fall ends on a platform
+        first = max(next(i for i in range(start, dt + 1) if vels[i] > 0) - 1, start)
+        path_x = xs[first:]
+        feet = [top + height for top in ys[first:]]
+        rows = store.sweep_candidates(min(path_x), feet[0] - 10, max(path_x) + width, feet[-1], dt)
+        if not len(rows):
+            break
+        if path is None:
+            path = store.patrol_path(dt)
+        landing = first_landing(np.array(path_x), np.array(feet), path[first:, rows], store.y[rows],
+                                store.w[rows], store.h[rows] + 10, width)
+        if landing is None:
+            break
+        frame, row = first + landing[0] + 1, rows[landing[1]]
+
+        # Stand on the platform, or on the next one a frame's landing test picks
+        while True:
+            landed = frame if landed is None else landed
+            rest = store.y.item(row) - height
+            ys[frame], vels[frame] = rest, 0
+            jumping[frame:] = [False] * (dt + 1 - frame)
+            if frame == dt:
+                return landed, jumped
+            if inputs.jump:
+                start = frame
+                jumped = frame if jumped is None else jumped
+                jumping[frame + 1:] = [True] * (dt - frame)
+                vel_y = player.jump_velocity
+                break
+
+            feet, fallen = rest + height, rest + gravity + height  # as one frame of gravity from rest
+            stand_x = xs[frame:]
+            below = np.full(dt - frame, -1)
+            rows = store.sweep_candidates(min(stand_x), feet - 10, max(stand_x) + width, fallen, dt)
+            if len(rows):
+                found = landings_from_rest(np.array(stand_x), feet, fallen - feet, path[frame:, rows],
+                                           store.y[rows], store.w[rows], store.h[rows] + 10, width)
+                below = np.where(found >= 0, rows[found], -1)
+            moved = np.flatnonzero(below != row)
+            stop = dt if not len(moved) else frame + int(moved[0])  # last frame standing on row
+            ys[frame:stop + 1] = [rest] * (stop + 1 - frame)
+            vels[frame:stop + 1] = [0] * (stop + 1 - frame)
+            if stop == dt:
+                return landed, jumped
+            if below[stop - frame] < 0:
+                start, vel_y = stop, 0  # nothing below any more: fall from rest
+                break
+            frame, row = stop + 1, int(below[stop - frame])
+
+        _fall(ys, vels, start, vel_y, gravity)
+    return landed, jumped
+
+
+# Function: _fall
+# ys, vels - player y and vertical velocity per frame (updated in place)
+# start    - frame to start from; ys[start] is kept
+# vel_y    - velocity at the start of the next frame (after a jump, if any)
+# gravity  - player gravity
+# -------------------------------------------------------------
+# Fills the frames after start with gravity applied frame by frame, the
+# way Player.apply_gravity does in single-frame steps, so a coarse step
+# reproduces their positions exactly (the closed form rounds differently).
+
+def _fall(ys, vels, start, vel_y, gravity):
+    y = ys[start]
+    for i in range(start + 1, len(ys)):
+        vel_y += gravity
+        y += vel_y
+        ys[i], vels[i] = y, vel_y
+
+
+# Function: _respawn_enemies
+# state - GameState whose camera has just scrolled
+# gone  - enemy_store rows of the enemies that scrolled below the screen
+# -------------------------------------------------------------
+# Moves the enemies back above the screen onto the streamer's spawn
+# points: each takes the lowest unused point in the ENEMY_RESPAWN_BAND
+# above ENEMY_RESPAWN_Y that is not too close to a live enemy. Points
+# passed over for being crowded stay in the stream for later respawns.
+# If every point in the band is crowded the lowest one is taken anyway,
+# and if the band has no point at all the enemy respawns at
+# ENEMY_RESPAWN_Y at a random x; both count as failed placements.
+#
+# Gameplay change: the original game respawned every enemy exactly at
+# ENEMY_RESPAWN_Y. The stream has two points per chunk, about one per
+# respawn, so the lowest free point is usually within a few hundred
+# pixels of ENEMY_RESPAWN_Y but can be up to the band height above it,
+# and such an enemy enters the screen later.
+
+def _respawn_enemies(state, gone):
+    enemy_store, offset = state.enemy_store, state.scroll_offset
+    low = ENEMY_RESPAWN_Y - offset
+    high = low - ENEMY_RESPAWN_BAND
+
+    def uncrowded(x, y):
+        return enemy_store.nearest(x, y + offset, ENEMY_MIN_DISTANCE)[1] >= ENEMY_MIN_DISTANCE
+
+    for i in gone:
+        spawn = state.streamer.next_enemy_spawn(low, high, uncrowded)
+        if spawn is None:
+            state.failed_placements[state.difficulty_level] += 1
+            spawn = state.streamer.next_enemy_spawn(low, high)
+        if spawn is None:
+            spawn = state.rng.randint(50, state.screen_width - 100), low
+        x, y = spawn
+        enemy_store.place(i, x, y + offset)
+
+
+# Function: run_simulation
+# seed       - seed of the game
+# controller - callable(player, platforms, enemies) -> (left, right, jump)
+# max_frames - frame limit (None = until game over)
+# dt         - frames per step (see step); the controller is asked once per step
+# -------------------------------------------------------------
+# Plays one game without any display, as fast as possible.
+# Returns {"score", "frames", "cause"} like a headless run_game session,
+# plus "failed_placements" ({level: count}, see GameState).
+
+def run_simulation(seed, controller, max_frames=None, dt=1):
+    state = GameState(seed)
+    cause = None
+    while state.game_over is None:
+        if max_frames is not None and state.frame >= max_frames:
+            cause = "timeout"
+            break
+        step(state, Inputs(*controller(state.player, state.platforms, state.enemies)), dt)
+    return {"score": state.score, "frames": state.frame, "cause": cause or state.game_over,
+            "failed_placements": dict(state.failed_placements)}
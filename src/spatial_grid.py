@@ -0,0 +1,190 @@
+# spatial_grid.py
+# ---------------------------------
+# Uniform grid of world-space cells for collision and placement queries
+
+import math
+
+
+# Class: SpatialGrid
+# cell_size - width and height of one cell in pixels
+# -------------------------------------------------------------
+# Buckets keys (EntityStore rows) by the grid cells their boxes cover, so
+# a rect query only looks at the entities in the covered cells and its
+# cost depends on the local density instead of the total entity count.
+#
+# Cells are in world coordinates: screen y = world y + offset_y. When the
+# camera scrolls, only offset_y changes and nothing is re-binned. An
+# entity is re-binned only when its box crosses into other cells.
+#
+# The grid stores cell ranges only; exact box tests are done by the owner
+# (EntityStore) on the candidates returned by candidates().
+
+class SpatialGrid:
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.offset_y = 0.0
+        self.cells = {}    # (cell x, cell y) -> set of keys
+        self._ranges = {}  # key -> (x0, y0, x1, y1) covered cell range
+        self._extent = None  # (x0, y0, x1, y1) bounds of the used cells
+        self._extent_dirty = False
+
+
+    # Method: cell_range
+    # left, top, right, bottom - box in screen coordinates
+    # -------------------------------------------------------------
+    # Returns the (x0, y0, x1, y1) range of cells the box covers.
+
+    def cell_range(self, left, top, right, bottom):
+        size = self.cell_size
+        top -= self.offset_y
+        bottom -= self.offset_y
+        return (math.floor(left / size), math.floor(top / size),
+                math.floor(right / size), math.floor(bottom / size))
+
+
+    # Method: insert
+    # key                      - hashable id of the entity
+    # left, top, right, bottom - its box in screen coordinates
+    # -------------------------------------------------------------
+
+    def insert(self, key, left, top, right, bottom):
+        cells = self.cell_range(left, top, right, bottom)
+        self._ranges[key] = cells
+        self._add(key, cells)
+
+
+    # Method: move
+    # key                      - entity already in the grid
+    # left, top, right, bottom - its new box in screen coordinates
+    # -------------------------------------------------------------
+    # Re-bins the entity if its box now covers a different cell range.
+
+    def move(self, key, left, top, right, bottom):
+        cells = self.cell_range(left, top, right, bottom)
+        old = self._ranges[key]
+        if cells != old:
+            self._discard(key, old)
+            self._ranges[key] = cells
+            self._add(key, cells)
+
+
+    def remove(self, key):
+        self._discard(key, self._ranges.pop(key))
+
+
+    # Method: scroll
+    # amount - distance every entity moved down on screen
+    # -------------------------------------------------------------
+
+    def scroll(self, amount):
+        self.offset_y += amount
+
+
+    # Method: candidates
+    # left, top, right, bottom - query box in screen coordinates;
+    #                            may be infinite (e.g. a horizontal band)
+    # -------------------------------------------------------------
+    # Returns the set of keys in the cells covered by the box: every entity
+    # whose box overlaps the query box is included, plus near misses.
+
+    def candidates(self, left, top, right, bottom):
+        extent = self.extent()
+        if extent is None:
+            return set()
+        ex0, ey0, ex1, ey1 = extent
+        size = self.cell_size
+        top -= self.offset_y
+        bottom -= self.offset_y
+
+        x0 = max(ex0, math.floor(max(left, ex0 * size) / size))
+        x1 = min(ex1, math.floor(min(right, (ex1 + 1) * size) / size))
+        y0 = max(ey0, math.floor(max(top, ey0 * size) / size))
+        y1 = min(ey1, math.floor(min(bottom, (ey1 + 1) * size) / size))
+
+        found = set()
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                keys = cells.get((cx, cy))
+                if keys:
+                    found |= keys
+        return found
+
+
+    # Method: ring
+    # x, y   - query point in screen coordinates
+    # radius - ring distance in cells (0 = the point's own cell)
+    # -------------------------------------------------------------
+    # Returns the keys in the cells at exactly `radius` cells (Chebyshev
+    # distance) from the point's cell; used for nearest-neighbour search.
+    # Returns None once the ring lies completely outside the used extent.
+
+    def ring(self, x, y, radius):
+        extent = self.extent()
+        if extent is None:
+            return None
+        cx, cy = math.floor(x / self.cell_size), math.floor((y - self.offset_y) / self.cell_size)
+        ex0, ey0, ex1, ey1 = extent
+        if cx - radius < ex0 and cx + radius > ex1 and cy - radius < ey0 and cy + radius > ey1:
+            return None
+
+        found = set()
+        cells = self.cells
+        for gx in range(cx - radius, cx + radius + 1):
+            for gy in (cy - radius, cy + radius) if radius else (cy,):
+                keys = cells.get((gx, gy))
+                if keys:
+                    found |= keys
+        for gy in range(cy - radius + 1, cy + radius):
+            for gx in (cx - radius, cx + radius) if radius else ():
+                keys = cells.get((gx, gy))
+                if keys:
+                    found |= keys
+        return found
+
+
+    # Method: extent
+    # -------------------------------------------------------------
+    # Returns the (x0, y0, x1, y1) bounds of the non-empty cells, or None
+    # if the grid is empty. Recomputed only after a border cell emptied.
+
+    def extent(self):
+        if self._extent_dirty:
+            self._extent_dirty = False
+            if self.cells:
+                xs = [cx for cx, _ in self.cells]
+                ys = [cy for _, cy in self.cells]
+                self._extent = (min(xs), min(ys), max(xs), max(ys))
+            else:
+                self._extent = None
+        return self._extent
+
+
+    def _add(self, key, cells):
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    bucket = self.cells[(cx, cy)] = set()
+                bucket.add(key)
+
+        extent = self.extent()
+        if extent is None:
+            self._extent = cells
+        else:
+            ex0, ey0, ex1, ey1 = extent
+            self._extent = (min(ex0, x0), min(ey0, y0), max(ex1, x1), max(ey1, y1))
+
+
+    def _discard(self, key, cells):
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells[(cx, cy)]
+                bucket.discard(key)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+                    ex0, ey0, ex1, ey1 = self._extent
+                    if cx in (ex0, ex1) or cy in (ey0, ey1):
+                        self._extent_dirty = True
@@ -1,34 +1,81 @@
-import pygame
-import os
+from src.assets import assets
+from src.entity_store import EntityStore, column
+from src.lazy_import import lazy_import
+
+pygame = lazy_import("pygame")
 
 # Constructor: __init__
         # game - reference to the main game object
         # x, y - initial position of the enemy
         # frame_paths - list of file paths for animation frames
+        # size - (width, height) of the frames, used for the collision rect
         # animation_speed - controls how fast the animation updates
+        # store - EntityStore holding the enemy's position (None = own store)
         # -------------------------------------------------------------
         # Initializes the BaseEnemy object with position, animation frames,
         # and animation speed. Sets the starting frame and defines the
         # sprite's rectangle for positioning and collision.
+        # Frames are looked up on first draw, so enemies created by the
+        # simulation never touch the asset registry.
+        # Position and movement live in a row of an EntityStore, like
+        # platforms, so the simulation moves and tests all enemies at once.
+
+class BaseEnemy:
+    x = column("x")
+    y = column("y")
+    prev_x = column("prev_x")  # position before the last simulation step (render interpolation)
+    prev_y = column("prev_y")
+    speed = column("speed")
+    direction = column("direction")
 
-class BaseEnemy(pygame.sprite.Sprite):
-    def __init__(self, game, x, y, frame_paths, animation_speed=0.15):
-        super().__init__()
+    def __init__(self, game, x, y, frame_paths, size, animation_speed=0.15, store=None):
         self.game = game
-        self.frames = self.load_frames(frame_paths)
+        self.frame_paths = frame_paths
+        self._frames = None
         self.current_frame = 0
-        self.image = self.frames[self.current_frame]
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.store = store if store is not None else EntityStore()
+        self.index = self.store.add(x, y, *size)
         self.animation_speed = animation_speed
         self.animation_timer = 0
 
+    # Property: rect
+    # -------------------------------------------------------------
+    # Collision rect at the current position. This is a new Rect built
+    # from the store on every access; move the enemy through x and y.
+    @property
+    def rect(self):
+        store, i = self.store, self.index
+        return pygame.Rect(store.x[i], store.y[i], store.w[i], store.h[i])
+
+    # Property: frames
+    # -------------------------------------------------------------
+    # Atlas regions of the animation frames, loaded on first access.
+    @property
+    def frames(self):
+        if self._frames is None:
+            self._frames = self.load_frames(self.frame_paths)
+        return self._frames
+
     # Method: load_frames
     # paths - list of strings with file paths to animation frames
     # -------------------------------------------------------------
-    # Loads each image from the given paths and returns them as a list
-    # of surfaces with alpha transparency.
+    # Returns the shared atlas regions for each of the given paths.
+    # The asset registry decodes every frame only once, so spawning
+    # an enemy does no image loading.
     def load_frames(self, paths):
-        return [pygame.image.load(path).convert_alpha() for path in paths]
+        return [assets.region(path) for path in paths]
+
+    # Property: region / image
+    # -------------------------------------------------------------
+    # The current animation frame as an AtlasRegion, and as a plain
+    # Surface (atlas subsurface).
+    @property
+    def region(self):
+        return self.frames[self.current_frame]
+
+    @property
+    def image(self):
+        return self.region.image
 
     # Method: animate
     # -------------------------------------------------------------
@@ -38,13 +85,32 @@ class BaseEnemy(pygame.sprite.Sprite):
     def animate(self):
         self.animation_timer += self.animation_speed
         if self.animation_timer >= 1:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.image = self.frames[self.current_frame]
+            self.current_frame = (self.current_frame + 1) % len(self.frame_paths)
             self.animation_timer = 0
 
+    # Method: move
+    # -------------------------------------------------------------
+    # Advances the enemy's position by one simulation step.
+    # Stationary by default; subclasses add their movement pattern.
+    def move(self):
+        pass
+
     # Method: update
     # -------------------------------------------------------------
     # Called every frame to update the enemy.
-    # Handles animation logic by calling the animate method.
+    # Moves the enemy and advances its animation.
     def update(self):
+        self.move()
         self.animate()
+
+    # Method: draw
+    # screen - surface to draw the enemy on
+    # alpha  - interpolation factor between the previous (0) and the
+    #          current (1) simulation position
+    # -------------------------------------------------------------
+    # Draws the current frame with an area blit from the atlas page.
+    # Returns the screen area that was drawn to.
+    def draw(self, screen, alpha=1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return screen.blit(self.region.sheet, (x, y), self.region.area)
@@ -1,32 +1,36 @@
 from src.sprites.base_enemy import BaseEnemy
-import os
+from src.config import BETTLE_FRAMES, BETTLE_SIZE
 
 class Bettle(BaseEnemy):
-    def __init__(self, game, x=300, y=400):
-        frame_paths = [
-            os.path.join("assets", "images", "enemies", f"bettle{i}.png")
-            for i in range(1, 5)
-        ]
+    def __init__(self, game, x=300, y=400, store=None):
         super().__init__(
             game=game,
             x=x,
             y=y,
-            frame_paths=frame_paths,
-            animation_speed=0.2
+            frame_paths=BETTLE_FRAMES,
+            size=BETTLE_SIZE,
+            animation_speed=0.2,
+            store=store
         )
 
         self.start_x = x
         self.move_range = 100
         self.speed = 2
         self.direction = 1
+        self.store.range_min[self.index] = x - self.move_range
+        self.store.range_max[self.index] = x + self.move_range
+        self.store.reindex(self.index)
 
-    def update(self):
-        super().update()
+    # Method: move
+    # -------------------------------------------------------------
+    # Patrols horizontally within move_range of the spawn position.
+    # The simulation moves all enemies at once with EntityStore.move();
+    # this is the per-enemy equivalent.
+    def move(self):
+        self.x += self.speed * self.direction
 
-        self.rect.x += self.speed * self.direction
-
-        if self.rect.x > self.start_x + self.move_range:
+        if self.x > self.start_x + self.move_range:
             self.direction = -1
-        elif self.rect.x < self.start_x - self.move_range:
+        elif self.x < self.start_x - self.move_range:
             self.direction = 1
 
@@ -1,9 +1,13 @@
 import pygame
 import os
 import random
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List
 
-from src.player import Player
+from src.assets import assets
+from src.text_cache import get_font, render_text
+from src.audio import init_audio, play_music
+from src.ui_overlay import LayerCache
 
 # Screen dimensions
 SCREEN_WIDTH = 600
@@ -12,19 +16,43 @@ SCREEN_HEIGHT = 750
 # Assets
 sky_img: Optional[pygame.Surface] = None
 cloud_img_original: Optional[pygame.Surface] = None
+cloud_variants: List[pygame.Surface] = []
 fh_img: Optional[pygame.Surface] = None
 logo_img: Optional[pygame.Surface] = None
 
 # Background state
 sky_y = 0
 sky_speed = 0.2
-clouds: List[Dict[str, Any]] = []
+clouds: List["Cloud"] = []
+cloud_rng = random.Random()  # clouds draw from their own stream, see seed_background
+
+# Clouds are drawn from a fixed set of pre-scaled (and mirrored) variants
+# and live in a preallocated pool of slots that are recycled in place.
+CLOUD_SCALES = (0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+CLOUD_COUNT = 3
+
+
+# One cloud slot: position and drift speed, plus the shared pre-baked
+# variant it shows. Slotted, so the per-frame drift and blit do plain
+# attribute reads instead of string-keyed dict lookups.
+class Cloud:
+    __slots__ = ("x", "y", "speed", "image")
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.speed = 0.0
+        self.image: Optional[pygame.Surface] = None
 
 # UI State
 privacy_accepted = False
 show_dev_info = False
 show_privacy_popup = False
 privacy_scroll_offset = 0
+overlay_layers = None  # LayerCache of the overlay UI, one layer per toggle state
+
+PRIVACY_POPUP_RECT = pygame.Rect(60, 120, 480, 400)
+PRIVACY_CLOSE_RECT = pygame.Rect(PRIVACY_POPUP_RECT.right - 30, PRIVACY_POPUP_RECT.y + 10, 20, 20)
 
 PRIVACY_TEXT = [
     "This game collects no personal data.",
@@ -35,45 +63,51 @@ PRIVACY_TEXT = [
 ]
 
 def load_assets():
-    global sky_img, cloud_img_original, fh_img, logo_img
+    global sky_img, cloud_img_original, cloud_variants, fh_img, logo_img
 
     base_dir = os.path.dirname(__file__)
     image_dir = os.path.join(base_dir, "..", "assets", "images")
 
-    def load_image(name: str) -> pygame.Surface:
-        path = os.path.join(image_dir, name)
+    def load_image(name: str, size=None, smooth: bool = False, flip: bool = False) -> pygame.Surface:
+        path = os.path.normpath(os.path.join(image_dir, name))
         if not os.path.exists(path):
             raise FileNotFoundError(f"Image not found: {path}")
-        return pygame.image.load(path).convert_alpha()
+        return assets.image(path, size, flip=flip, smooth=smooth)
 
-    sky_img = pygame.transform.scale(load_image("blueback.jpg"), (SCREEN_WIDTH, SCREEN_HEIGHT))
+    sky_img = load_image("blueback.jpg", (SCREEN_WIDTH, SCREEN_HEIGHT))
     cloud_img_original = load_image("clouds.png")
-    fh_img = pygame.transform.scale(load_image("fh.png"), (155, 67))
-    logo_img = pygame.transform.smoothscale(load_image("logo.webp"), (250, 180))
-
-    assert sky_img and cloud_img_original and fh_img and logo_img, "All images must be loaded."
+    fh_img = load_image("fh.png", (155, 67))
+    logo_img = load_image("logo.webp", (250, 180), smooth=True)
 
-def reset_background():
-    global clouds
-    clouds.clear()
-    for i in range(3):
-        clouds.append(create_cloud(y=i * 100))
+    cloud_variants = []
+    for scale in CLOUD_SCALES:
+        size = (int(cloud_img_original.get_width() * scale), int(cloud_img_original.get_height() * scale))
+        for flip in (False, True):
+            cloud_variants.append(load_image("clouds.png", size, flip=flip))
 
-def create_cloud(y: Optional[int] = None) -> Dict[str, Any]:
-    assert cloud_img_original is not None
+    assert sky_img and cloud_img_original and fh_img and logo_img, "All images must be loaded."
 
-    scale = random.uniform(0.4, 0.9)
-    width = int(cloud_img_original.get_width() * scale)
-    height = int(cloud_img_original.get_height() * scale)
-    image = pygame.transform.scale(cloud_img_original, (width, height))
+# count - number of cloud slots in the pool
+def reset_background(count: int = CLOUD_COUNT):
+    if len(clouds) != count:
+        clouds[:] = [Cloud() for _ in range(count)]
+    for i, cloud in enumerate(clouds):
+        respawn_cloud(cloud, y=i * 100)
 
-    if random.choice([True, False]):
-        image = pygame.transform.flip(image, True, False)
+# seed - seed of the cloud random stream (e.g. the game's seed)
+def seed_background(seed):
+    cloud_rng.seed(seed)
 
-    x = random.randint(0, SCREEN_WIDTH - width)
-    y = y if y is not None else random.randint(-600, -100)
+# Re-initializes a cloud slot in place with a random pre-baked variant;
+# no image transforms and no new objects.
+def respawn_cloud(cloud: Cloud, y: Optional[int] = None):
+    assert cloud_variants, "load_assets() must run first"
 
-    return {"image": image, "x": x, "y": y, "speed": random.uniform(0.5, 2.5)}
+    image = cloud_rng.choice(cloud_variants)
+    cloud.image = image
+    cloud.x = cloud_rng.randint(0, SCREEN_WIDTH - image.get_width())
+    cloud.y = y if y is not None else cloud_rng.randint(-600, -100)
+    cloud.speed = cloud_rng.uniform(0.5, 2.5)
 
 def draw_layer(surface: pygame.Surface, img: pygame.Surface, y: float):
     height = img.get_height()
@@ -81,19 +115,31 @@ def draw_layer(surface: pygame.Surface, img: pygame.Surface, y: float):
     surface.blit(img, (0, y - height))
     surface.blit(img, (0, y))
 
-def draw_background(surface: pygame.Surface):
+# drift - advance the sky and the clouds; dirty-rect rendering only drifts
+#         them while the camera scrolls, so a still camera leaves the
+#         background untouched
+# dirty - optional DirtyRectTracker the clouds are reported to
+def draw_background(surface: pygame.Surface, drift: bool = True, dirty=None):
     global sky_y
     assert sky_img is not None
 
-    sky_y += sky_speed
+    if drift:
+        sky_y += sky_speed
     draw_layer(surface, sky_img, sky_y)
-
-    for cloud in clouds[:]:
-        cloud["y"] += cloud["speed"]
-        surface.blit(cloud["image"], (cloud["x"], cloud["y"]))
-        if cloud["y"] > SCREEN_HEIGHT:
-            clouds.remove(cloud)
-            clouds.append(create_cloud())
+    draw_clouds(surface, drift, dirty)
+
+# Draws the drifting clouds and the FH badge on top of any background
+# (the start-menu sky or the in-game parallax layers).
+def draw_clouds(surface: pygame.Surface, drift: bool = True, dirty=None):
+    for cloud in clouds:
+        if drift:
+            cloud.y += cloud.speed
+        y = cloud.y
+        drawn = surface.blit(cloud.image, (cloud.x, y))
+        if dirty is not None:
+            dirty.track(id(cloud), drawn, changed=False)
+        if y > SCREEN_HEIGHT:
+            respawn_cloud(cloud)
 
     if fh_img:
         fh_rect = fh_img.get_rect(topright=(SCREEN_WIDTH - 0, 0))
@@ -102,29 +148,43 @@ def draw_background(surface: pygame.Surface):
 def draw_button(surface, font, text, x, y, width, height):
     rect = pygame.Rect(x, y, width, height)
     pygame.draw.rect(surface, (70, 130, 180), rect, border_radius=10)
-    label = font.render(text, True, (255, 255, 255))
+    label = render_text(font, text, (255, 255, 255))
     label_rect = label.get_rect(center=rect.center)
     surface.blit(label, label_rect)
     return rect
 
+# The overlay only changes when one of the three toggles changes, so each
+# toggle combination is drawn once into a cached transparent layer and
+# every frame is a single blit of that layer.
 def draw_overlay_ui(surface: pygame.Surface):
-    global privacy_accepted, show_dev_info, show_privacy_popup, privacy_scroll_offset
+    global overlay_layers
+    if overlay_layers is None:
+        overlay_layers = LayerCache(build_overlay_ui)
+
+    surface.blit(overlay_layers.get((privacy_accepted, show_dev_info, show_privacy_popup)), (0, 0))
+    if show_privacy_popup:
+        return PRIVACY_CLOSE_RECT
+    return None
 
-    font = pygame.font.SysFont("Arial", 20)
+def build_overlay_ui(key) -> pygame.Surface:
+    accepted, dev_info, privacy_popup = key
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
+    font = get_font("Arial", 20)
     checkbox_rect = pygame.Rect(40, SCREEN_HEIGHT - 60, 20, 20)
     pygame.draw.rect(surface, (0, 0, 0), checkbox_rect, 2)
-    if privacy_accepted:
+    if accepted:
         pygame.draw.line(surface, (0, 0, 0), checkbox_rect.topleft, checkbox_rect.bottomright, 2)
         pygame.draw.line(surface, (0, 0, 0), checkbox_rect.topright, checkbox_rect.bottomleft, 2)
-    underline_font = pygame.font.SysFont("Arial", 20, italic=True)
-    privacy_label = underline_font.render("Privacy Policy", True, (0, 0, 200))
+    underline_font = get_font("Arial", 20, italic=True)
+    privacy_label = render_text(underline_font, "Privacy Policy", (0, 0, 200))
     label_rect = privacy_label.get_rect(topleft=(70, SCREEN_HEIGHT - 62))
     surface.blit(privacy_label, label_rect)
     info_icon = pygame.Rect(SCREEN_WIDTH - 40, SCREEN_HEIGHT - 40, 25, 25)
     pygame.draw.circle(surface, (50, 50, 255), info_icon.center, 12)
-    surface.blit(font.render("i", True, (255, 255, 255)), (info_icon.x + 7, info_icon.y))
+    surface.blit(render_text(font, "i", (255, 255, 255)), (info_icon.x + 7, info_icon.y))
 
-    if show_dev_info:
+    if dev_info:
         info_lines = [
             "👨‍💻 Developer Info:",
             "SkyDodo Developers",
@@ -132,19 +192,18 @@ def draw_overlay_ui(surface: pygame.Surface):
         ]
         pygame.draw.rect(surface, (240, 240, 240), (40, 100, 520, 120))
         for i, line in enumerate(info_lines):
-            surface.blit(font.render(line, True, (0, 0, 0)), (60, 110 + i * 25))
+            surface.blit(render_text(font, line, (0, 0, 0)), (60, 110 + i * 25))
 
-    if show_privacy_popup:
-        popup = pygame.Rect(60, 120, 480, 400)
+    if privacy_popup:
+        popup = PRIVACY_POPUP_RECT
         pygame.draw.rect(surface, (255, 255, 255), popup)
         pygame.draw.rect(surface, (0, 0, 0), popup, 2)
         for i, line in enumerate(PRIVACY_TEXT):
-            surface.blit(font.render(line, True, (0, 0, 0)), (popup.x + 10, popup.y + 10 + i * 30))
-        close_btn = pygame.Rect(popup.right - 30, popup.y + 10, 20, 20)
+            surface.blit(render_text(font, line, (0, 0, 0)), (popup.x + 10, popup.y + 10 + i * 30))
+        close_btn = PRIVACY_CLOSE_RECT
         pygame.draw.rect(surface, (200, 50, 50), close_btn)
-        surface.blit(font.render("X", True, (255, 255, 255)), (close_btn.x + 3, close_btn.y - 3))
-        return close_btn
-    return None
+        surface.blit(render_text(font, "X", (255, 255, 255)), (close_btn.x + 3, close_btn.y - 3))
+    return surface
 
 def fade_out(surface: pygame.Surface, speed: int = 10):
     fade = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -157,28 +216,43 @@ def fade_out(surface: pygame.Surface, speed: int = 10):
         pygame.display.update()
         pygame.time.delay(30)
 
-def start_menu_loop():
+# Method: start_menu_loop
+# started          - time.perf_counter() at process start (None = not measured)
+# first_frame_only - return after the first menu frame (with started: a
+#                    time-to-first-frame measurement)
+# -------------------------------------------------------------
+# Runs the start menu until the player quits or starts a game.
+# Only the menu's own images are decoded before the first frame; the
+# in-game assets are loaded and packed by run_game, and the game modules
+# are imported when a game starts. With started given, prints the time
+# from process start to the first presented frame, split into stages.
+
+def start_menu_loop(started=None, first_frame_only=False):
     global privacy_accepted, show_dev_info, show_privacy_popup
+    from src.player import Player
 
+    stages = [("imports", time.perf_counter())]
     pygame.init()
-    pygame.mixer.init()
+    init_audio()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("SkyDodo")
-    pygame.mixer.music.load("assets/sounds/background_music.mp3")
-    pygame.mixer.music.set_volume(0.3)
-    pygame.mixer.music.play(-1)
+    play_music("assets/sounds/background_music.mp3", 0.3)
+    stages.append(("display+audio", time.perf_counter()))
 
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont("Arial", 36)
+    font = get_font("Arial", 36)
 
     load_assets()
     reset_background()
+    stages.append(("assets", time.perf_counter()))
 
     player = Player(x=0, y=0)
 
+    framerate = 0  # present the first frame at once; later frames are capped
     running = True
     while running:
-        dt = clock.tick(60) / 1000
+        dt = clock.tick(framerate) / 1000
+        framerate = 60
         screen.fill((0, 0, 0))
         draw_background(screen)
 
@@ -200,6 +274,18 @@ def start_menu_loop():
         close_rect = draw_overlay_ui(screen)
         pygame.display.flip()
 
+        if started is not None:
+            stages.append(("first frame", time.perf_counter()))
+            previous = started
+            parts = []
+            for name, mark in stages:
+                parts.append(f"{name} {(mark - previous) * 1000:.0f}")
+                previous = mark
+            print(f"time to first frame: {(previous - started) * 1000:.0f} ms ({', '.join(parts)} ms)")
+            started = None
+        if first_frame_only:
+            break
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
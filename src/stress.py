@@ -0,0 +1,110 @@
+# stress.py
+# ---------------------------------
+# Stress scenarios: frame time per subsystem at growing entity counts
+
+import csv
+import json
+import math
+import os
+
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, PLATFORM_MIN_GAP, RENDER_FPS
+from src.frame_profiler import FrameProfiler, SECTIONS
+from src.simulation import ENEMY_COUNT
+
+# Entity counts of a normal game; scenario n multiplies all of them by n
+BASE_PLATFORMS = SCREEN_HEIGHT // PLATFORM_MIN_GAP + 2  # PlatformRing's default capacity
+BASE_ENEMIES = math.ceil(ENEMY_COUNT)
+BASE_CLOUDS = 3
+DEFAULT_SCALES = (1, 2, 4, 8, 16, 32, 64)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+# Method: run_stress
+# scales - entity count multipliers, one scenario each
+# frames - frames measured per scenario
+# seed   - seed of the first game of each scenario (game i uses seed + i)
+# output - .csv or .json file the results are written to (None = print only)
+# -------------------------------------------------------------
+# Plays scripted games (AutoJumpController) through run_game with
+# BASE_PLATFORMS / BASE_ENEMIES / BASE_CLOUDS times each scale, starting a
+# new game whenever one ends, until `frames` frames were measured. Must
+# run in headless mode (see src/headless.py), so that each frame is one
+# simulation step and nothing waits for the frame clock; whether frames
+# are drawn follows headless.render.
+# Prints the frame time percentiles of every scenario and the knee: the
+# first scale whose 95th percentile frame time exceeds one frame at
+# RENDER_FPS. Returns the list of scenario results.
+
+def run_stress(scales=DEFAULT_SCALES, frames=600, seed=0, output=None):
+    import pygame
+    from src import headless, start
+    from src.game import run_game
+
+    headless.init_pygame()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    start.load_assets()
+
+    budget = 1000 / RENDER_FPS
+    scenarios = []
+    knee = None
+    for scale in scales:
+        counts = {"platforms": BASE_PLATFORMS * scale, "enemies": BASE_ENEMIES * scale,
+                  "clouds": BASE_CLOUDS * scale}
+        start.reset_background(counts["clouds"])
+
+        profiler = FrameProfiler()
+        games = 0
+        while profiler.frames < frames:
+            run_game(controller=headless.AutoJumpController(), max_frames=frames - profiler.frames,
+                     seed=seed + games, record=False, enemy_count=counts["enemies"],
+                     platform_count=counts["platforms"], profiler=profiler)
+            games += 1
+
+        sections = profiler.percentiles(PERCENTILES)
+        scenario = {"scale": scale, **counts, "render": headless.render, "frames": profiler.frames,
+                    "games": games, "sections": sections}
+        scenarios.append(scenario)
+
+        frame = sections["frame"]
+        slowest = max(SECTIONS, key=lambda name: sections[name]["p95"])
+        print(f"x{scale}: platforms={counts['platforms']} enemies={counts['enemies']} clouds={counts['clouds']} "
+              f"frame p50={frame['p50']:.2f}ms p95={frame['p95']:.2f}ms p99={frame['p99']:.2f}ms "
+              f"(slowest: {slowest} {sections[slowest]['p95']:.2f}ms)")
+        if knee is None and frame["p95"] > budget:
+            knee = scale
+
+    if knee is None:
+        print(f"every scenario holds {RENDER_FPS} FPS (p95 <= {budget:.2f}ms)")
+    else:
+        print(f"knee: x{knee} is the first scenario over {budget:.2f}ms per frame at p95")
+
+    if output:
+        write_results(output, scenarios, knee, budget)
+    return scenarios
+
+
+# Method: write_results
+# path      - output file; .json writes one document, anything else CSV
+# scenarios - results of run_stress
+# knee      - first scale over budget (None = none)
+# budget    - frame time budget in ms
+# -------------------------------------------------------------
+# The CSV has one row per scenario and subsystem ("frame" = whole frame).
+
+def write_results(path, scenarios, knee, budget):
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, "w") as f:
+            json.dump({"fps": RENDER_FPS, "budget_ms": budget, "knee": knee, "scenarios": scenarios}, f, indent=2)
+        return
+
+    stats = [f"p{point}" for point in PERCENTILES] + ["max"]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["scale", "platforms", "enemies", "clouds", "render", "frames", "section"]
+                        + [f"{name}_ms" for name in stats])
+        for scenario in scenarios:
+            for section, values in scenario["sections"].items():
+                writer.writerow([scenario["scale"], scenario["platforms"], scenario["enemies"], scenario["clouds"],
+                                 int(scenario["render"]), scenario["frames"], section]
+                                + [f"{values[name]:.4f}" for name in stats])
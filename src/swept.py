@@ -0,0 +1,122 @@
+# swept.py
+# ---------------------------------
+# Swept AABB tests: first contact of the player's path with platforms and enemies
+
+import numpy as np
+
+
+# Function: slab
+# start, delta - position at t = 0 and movement over the segment (arrays)
+# low, high    - the position must lie strictly between these
+# -------------------------------------------------------------
+# Returns the arrays (t_low, t_high) bounding the times at which
+# low < start + delta * t < high; t_low >= t_high means never. Unmoving
+# entries give (-inf, inf) or (inf, -inf).
+
+def slab(start, delta, low, high):
+    moving = delta != 0
+    step = np.where(moving, delta, 1.0)
+    t0 = (low - start) / step
+    t1 = (high - start) / step
+    inside = (start > low) & (start < high)
+    t_low = np.where(moving, np.minimum(t0, t1), np.where(inside, -np.inf, np.inf))
+    t_high = np.where(moving, np.maximum(t0, t1), np.where(inside, np.inf, -np.inf))
+    return t_low, t_high
+
+
+# Function: first_contact
+# t_lows, t_highs - per axis slab() results, all of shape (segments, rows)
+# -------------------------------------------------------------
+# Segment s runs from sample s to sample s + 1, over t in (0, 1]. Returns
+# (segment, rows, t) of the earliest segment and time at which all axes
+# overlap, with every row touching at that time, or None if none does.
+
+def first_contact(t_lows, t_highs):
+    low = np.maximum.reduce([np.maximum(t, 0.0) for t in t_lows])
+    high = np.minimum.reduce([np.minimum(t, 1.0) for t in t_highs])
+    hit = low < high
+    segments = np.flatnonzero(hit.any(axis=1))
+    if not len(segments):
+        return None
+    segment = segments[0]
+    times = np.where(hit[segment], low[segment], np.inf)
+    first = times.min()
+    return segment, np.flatnonzero(times == first), first
+
+
+# Function: first_landing
+# xs, feet - player x and feet y at samples 0..S (the player falls in every segment)
+# plat_x   - platform x at samples 0..S, shape (S + 1, rows)
+# tops     - platform top y per row
+# widths   - platform width per row
+# depth    - how far below a top the feet may be to land, per row
+# player_width - width of the player
+# -------------------------------------------------------------
+# Landing rule of simulation.step, swept: the feet must pass through the
+# band (top, top + depth] while the player overlaps the platform
+# horizontally, with both moving in a straight line between samples.
+# Returns (segment, row) of the first landing (the highest platform on
+# a tie) as plain ints, or None.
+
+def first_landing(xs, feet, plat_x, tops, widths, depth, player_width):
+    start_x = xs[:-1, None] - plat_x[:-1]
+    delta_x = (xs[1:, None] - plat_x[1:]) - start_x
+    start_y = feet[:-1, None] - tops
+    delta_y = np.broadcast_to((feet[1:] - feet[:-1])[:, None], start_y.shape)
+    x_low, x_high = slab(start_x, delta_x, -player_width, widths)
+    y_low, y_high = slab(start_y, delta_y, 0.0, depth)
+    contact = first_contact((x_low, y_low), (x_high, y_high))
+    if contact is None:
+        return None
+    segment, rows, _ = contact
+    return int(segment), int(rows[np.argmin(tops[rows])])
+
+
+# Function: first_overlap
+# xs, ys     - player top-left at samples 0..S
+# box_x      - entity x during each segment, shape (S, rows)
+# box_y      - entity y per row
+# box_w, box_h - entity size per row
+# size       - (width, height) of the player
+# -------------------------------------------------------------
+# Returns the first segment in which the player's box, moving in a
+# straight line between samples, touches an entity box (a plain int),
+# or None.
+
+def first_overlap(xs, ys, box_x, box_y, box_w, box_h, size):
+    width, height = size
+    start_x = xs[:-1, None] - box_x
+    delta_x = np.broadcast_to((xs[1:] - xs[:-1])[:, None], start_x.shape)
+    start_y = np.broadcast_to(ys[:-1, None] - box_y, start_x.shape)
+    delta_y = np.broadcast_to((ys[1:] - ys[:-1])[:, None], start_x.shape)
+    x_low, x_high = slab(start_x, delta_x, -width, box_w)
+    y_low, y_high = slab(start_y, delta_y, -height, box_h)
+    contact = first_contact((x_low, y_low), (x_high, y_high))
+    return None if contact is None else int(contact[0])
+
+
+# Function: landings_from_rest
+# xs      - player x at samples 0..S
+# feet    - feet y at the start of every segment (standing at rest)
+# drop    - how far the feet fall during each segment (one frame of gravity)
+# plat_x, tops, widths, depth, player_width - as for first_landing
+# -------------------------------------------------------------
+# first_landing for a player standing on a platform: every segment starts
+# at rest at `feet` again, as in simulation.step when one frame's gravity
+# is undone by landing on the platform. Returns, per segment, the row the
+# player lands on (the one first_landing picks for that segment alone),
+# or -1 where nothing supports the player.
+
+def landings_from_rest(xs, feet, drop, plat_x, tops, widths, depth, player_width):
+    start_x = xs[:-1, None] - plat_x[:-1]
+    delta_x = (xs[1:, None] - plat_x[1:]) - start_x
+    start_y = np.broadcast_to(feet - tops, start_x.shape)
+    delta_y = np.full(start_x.shape, drop)
+    x_low, x_high = slab(start_x, delta_x, -player_width, widths)
+    y_low, y_high = slab(start_y, delta_y, 0.0, depth)
+    low = np.maximum(np.maximum(x_low, 0.0), np.maximum(y_low, 0.0))
+    high = np.minimum(np.minimum(x_high, 1.0), np.minimum(y_high, 1.0))
+    times = np.where(low < high, low, np.inf)
+    first = times.min(axis=1, keepdims=True)
+    ranked = np.where(np.isfinite(times) & (times == first), tops, np.inf)
+    return np.where(np.isfinite(first[:, 0]), np.argmin(ranked, axis=1), -1)
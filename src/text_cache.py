@@ -0,0 +1,100 @@
+# text_cache.py
+# ---------------------------------
+# Shared fonts and memoized text surfaces for HUD and menu rendering
+
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+
+
+# Function: get_font
+# name, size   - system font name and point size
+# bold, italic - font style flags
+# -------------------------------------------------------------
+# Resolves a system font once and returns the same Font object for every
+# later call with the same arguments.
+
+def get_font(name, size, bold=False, italic=False):
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+# Class: TextCache
+# capacity - maximum number of rendered surfaces kept
+# -------------------------------------------------------------
+# Memoizes font.render() results keyed by (font, text, color, antialias)
+# and evicts the least recently used surface once capacity is exceeded.
+
+class TextCache:
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self._surfaces = OrderedDict()
+
+
+    # Method: render
+    # Same arguments as Font.render
+    # -------------------------------------------------------------
+    # Returns the cached surface, rendering it on first use.
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+text_cache = TextCache()
+
+
+# Function: render_text
+# font, text, color, antialias - same as Font.render
+# -------------------------------------------------------------
+# Shortcut for text_cache.render(); use instead of font.render().
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
+
+
+# Function: draw_number
+# surface - target to draw on
+# font    - font to draw with
+# label   - static text drawn before the number (e.g. "Score: ")
+# value   - integer to draw
+# color   - text color
+# pos     - top-left position
+# -------------------------------------------------------------
+# Draws "label + value" from cached pieces: the label is one cached
+# surface and the number is composed from cached per-digit glyphs, so a
+# changing score never re-rasterizes the whole string.
+# Returns the screen area that was drawn to.
+
+def draw_number(surface, font, label, value, color, pos):
+    x, y = pos
+    label_surface = text_cache.render(font, label, color)
+    drawn = surface.blit(label_surface, (x, y))
+    x += label_surface.get_width()
+
+    for digit in str(value):
+        glyph = text_cache.render(font, digit, color)
+        drawn = drawn.union(surface.blit(glyph, (x, y)))
+        x += glyph.get_width()
+    return drawn
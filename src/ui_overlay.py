@@ -1,5 +1,35 @@
 import pygame
 
+from src.text_cache import get_font, render_text
+
+# Class: LayerCache
+# build        - function(key) returning the finished layer surface for a key
+# max_variants - number of built layers kept at once
+# -------------------------------------------------------------
+# Keeps pre-built full-screen layers for static UI screens. A layer is
+# rebuilt only when it is requested with a key that is not cached, e.g. a
+# new score or a toggled popup, so a menu frame is just one blit of the
+# cached layer instead of re-drawing every button and title.
+
+class LayerCache:
+    def __init__(self, build, max_variants=4):
+        self.build = build
+        self.max_variants = max_variants
+        self._layers = {}
+
+    def get(self, key):
+        layer = self._layers.get(key)
+        if layer is None:
+            if len(self._layers) >= self.max_variants:
+                self._layers.pop(next(iter(self._layers)))
+            layer = self.build(key)
+            self._layers[key] = layer
+        return layer
+
+    def clear(self):
+        self._layers.clear()
+
+
 # Method: draw_overlay
 # screen - instance of the screen to draw on
 # overlay_type - string, either "pause" or "info", determines the content
@@ -11,30 +41,36 @@ import pygame
 # Displays either a "PAUSED" or "INFO" overlay based on overlay_type.
 # Optionally renders a logo and an icon.
 # If overlay_type is "info", additional instructions and tips are displayed.
+# The overlay is built once per (type, size, font, logo, icon) and then
+# drawn with a single blit.
 def draw_overlay(screen, overlay_type, font, logo=None, icon=None):
-    width, height = screen.get_size()
+    layer = _overlay_layers.get((overlay_type, screen.get_size(), font, logo, icon))
+    screen.blit(layer, (0, 0))
+
+
+def _build_overlay(key):
+    overlay_type, (width, height), font, logo, icon = key
 
     # Dim background
     overlay = pygame.Surface((width, height), pygame.SRCALPHA)
     overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
 
     # Optional logo (top center)
     if logo:
-        screen.blit(logo, (width // 2 - logo.get_width() // 2, 30))
+        overlay.blit(logo, (width // 2 - logo.get_width() // 2, 30))
 
     # Icon (top-left)
     if icon:
-        screen.blit(icon, (20, 20))
+        overlay.blit(icon, (20, 20))
 
     # Title
     title_text = "PAUSED" if overlay_type == "pause" else "INFO"
-    title_surface = font.render(title_text, True, (255, 255, 255))
-    screen.blit(title_surface, (width // 2 - title_surface.get_width() // 2, 120))
+    title_surface = render_text(font, title_text, (255, 255, 255))
+    overlay.blit(title_surface, (width // 2 - title_surface.get_width() // 2, 120))
 
     # Info lines
     if overlay_type == "info":
-        info_font = pygame.font.SysFont("Arial", 24)
+        info_font = get_font("Arial", 24)
         lines = [
             "🕹️  Controls:",
             "- SPACE: Jump",
@@ -46,5 +82,9 @@ def draw_overlay(screen, overlay_type, font, logo=None, icon=None):
             "Avoid red enemies!",
         ]
         for i, line in enumerate(lines):
-            line_surface = info_font.render(line, True, (255, 255, 255))
-            screen.blit(line_surface, (60, 200 + i * 30))
+            line_surface = render_text(info_font, line, (255, 255, 255))
+            overlay.blit(line_surface, (60, 200 + i * 30))
+    return overlay
+
+
+_overlay_layers = LayerCache(_build_overlay)